@@ -25,17 +25,20 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 __all__ = [
-    "applconfig", "build", "content", "glossary", "interface", "interfacedoc",
-    "items", "specdoc", "specverify", "util", "validation"
+    "applconfig", "build", "content", "glossary", "incremental", "interface",
+    "interfacedoc", "items", "outputsink", "specdoc", "specverify", "util",
+    "validation"
 ]
 
 import rtemsspec.applconfig
 import rtemsspec.build
 import rtemsspec.content
 import rtemsspec.glossary
+import rtemsspec.incremental
 import rtemsspec.interface
 import rtemsspec.interfacedoc
 import rtemsspec.items  # noqa: F401
+import rtemsspec.outputsink
 import rtemsspec.specdoc
 import rtemsspec.specverify
 import rtemsspec.util  # noqa: F401
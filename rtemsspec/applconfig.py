@@ -24,15 +24,17 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from rtemsspec.content import Content, CContent, get_value_double_colon, \
     get_value_doxygen_function, get_value_doxygen_group, get_value_hash, \
     get_value_plural
 from rtemsspec.sphinxcontent import GenericContent, SphinxContent, \
     SphinxInterfaceMapper
+from rtemsspec.incremental import map_jobs, record_output, run_unit
 from rtemsspec.items import EmptyItem, Item, ItemCache, ItemGetValueContext, \
     ItemMapper
+from rtemsspec.outputsink import write_output
 
 ItemMap = Dict[str, Item]
 
@@ -63,14 +65,9 @@ class _ContentAdaptor:
     By default, Sphinx content is generated.
     """
 
-    def __init__(self, mapper: ItemMapper, content: Any) -> None:
-        self.mapper = mapper
+    def __init__(self, content: Any) -> None:
         self.content = content
 
-    def substitute(self, text: Optional[str]) -> str:
-        """ Substitutes the optional text using the item mapper. """
-        return self.mapper.substitute(text)
-
     def add_group(self, uid: str, name: str, description: str) -> None:
         """ Adds an option group. """
         self.content.add_automatically_generated_warning()
@@ -129,9 +126,12 @@ class _ContentAdaptor:
         """ Adds the license and copyrights. """
         self.content.add_licence_and_copyrights()
 
-    def register_license_and_copyrights_of_item(self, item: Item) -> None:
-        """ Registers the license and copyrights of the item. """
-        self.content.register_license_and_copyrights_of_item(item)
+    def register_license_and_copyrights(self, the_license: str,
+                                        copyrights: List[str]) -> None:
+        """ Registers the license and copyrights. """
+        self.content.register_license(the_license)
+        for statement in copyrights:
+            self.content.register_copyright(statement)
 
     def write(self, filename: str):
         """ Writes the content to the file specified by the path. """
@@ -140,15 +140,15 @@ class _ContentAdaptor:
 
 class _SphinxContentAdaptor(_ContentAdaptor):
 
-    def __init__(self, mapper: ItemMapper) -> None:
-        super().__init__(mapper, SphinxContent())
+    def __init__(self) -> None:
+        super().__init__(SphinxContent())
 
 
 class _DoxygenContentAdaptor(_ContentAdaptor):
     # pylint: disable=attribute-defined-outside-init
 
-    def __init__(self, mapper: ItemMapper) -> None:
-        super().__init__(mapper, CContent())
+    def __init__(self) -> None:
+        super().__init__(CContent())
         self._reset()
 
     def _reset(self) -> None:
@@ -198,34 +198,135 @@ class _DoxygenContentAdaptor(_ContentAdaptor):
         self.content.add_paragraph("Notes", self._notes)
         self.content.close_comment_block()
         self.content.append(f"#define {self._name}")
+        self.content.flush()
         self._reset()
 
     def add_licence_and_copyrights(self) -> None:
         self.content.add("/** @} */")
 
 
-def _generate_feature(content: _ContentAdaptor, item: Item,
-                      option_type: str) -> None:
-    content.add_option_default_config(
-        content.substitute(_OPTION_DEFAULT_CONFIG[option_type](item)))
+class _License(NamedTuple):
+    """ The license and copyrights of an item. """
+    license: str
+    copyrights: List[str]
+
+
+def _get_license(item: Item) -> _License:
+    return _License(item["SPDX-License-Identifier"], item["copyrights"])
+
+
+class _OptionTexts(NamedTuple):
+    """ The substituted texts of an option for an output format. """
+    licenses: List[_License]
+    default_value: str
+    default_config: str
+    description: str
+    notes: str
+    constraints: List[str]
+
+
+class _Option(NamedTuple):
+    """ An application configuration option. """
+    uid: str
+    name: str
+    index_entries: List[str]
+    option_type: str
+    texts: List[_OptionTexts]
+
+
+class _Group(NamedTuple):
+    """ An application configuration group. """
+    uid: str
+    name: str
+    descriptions: List[str]
+    license: _License
+    options: List[_Option]
+
+
+class _Format(NamedTuple):
+    """ The item mapper and enabled set of an output format. """
+    mapper: ItemMapper
+    enabled: List[str]
+
 
+# The indices of the output formats in the text lists of the options
+_SPHINX = 0
+_DOXYGEN = 1
 
-def _get_constraints(content: _ContentAdaptor, item: Item,
-                     enabled: List[str]) -> List[str]:
-    constraints: List[str] = []
-    for parent in item.parents("constraint"):
-        if not parent.is_enabled(enabled):
-            continue
-        content.register_license_and_copyrights_of_item(parent)
-        constraints.append(
-            content.substitute(parent["text"]).replace(
-                "application configuration option", "configuration option"))
-    return constraints
 
+def _substitute(mapper: ItemMapper, item: Item, text: Optional[str]) -> str:
+    # A text without a substitution is the same for all output formats
+    if not text or "$" not in text:
+        return text or ""
+    mapper.item = item
+    return mapper.substitute(text)
 
-def _generate_constraints(content: _ContentAdaptor, item: Item,
-                          enabled: List[str]) -> None:
-    constraints = _get_constraints(content, item, enabled)
+
+def _get_default_value(item: Item) -> str:
+    if item["appl-config-option-type"] in _OPTION_DEFAULT_CONFIG:
+        return ""
+    default_value = item["default-value"]
+    if not isinstance(default_value, str) or " " not in default_value:
+        default_value = f"The default value is {default_value}."
+    return default_value
+
+
+def _get_default_config(item: Item) -> str:
+    get_default_config = _OPTION_DEFAULT_CONFIG.get(
+        item["appl-config-option-type"], None)
+    if get_default_config is None:
+        return ""
+    return get_default_config(item)
+
+
+def _get_option(item: Item, constraints: List[Item],
+                formats: List[_Format]) -> _Option:
+    the_license = _get_license(item)
+    default_value = _get_default_value(item)
+    default_config = _get_default_config(item)
+    texts: List[_OptionTexts] = []
+    for fmt in formats:
+        licenses = [the_license]
+        constraint_texts: List[str] = []
+        for parent in constraints:
+            if not parent.is_enabled(fmt.enabled):
+                continue
+            licenses.append(_get_license(parent))
+            constraint_texts.append(
+                _substitute(fmt.mapper, item, parent["text"]).replace(
+                    "application configuration option",
+                    "configuration option"))
+        texts.append(
+            _OptionTexts(licenses=licenses,
+                         default_value=_substitute(fmt.mapper, item,
+                                                   default_value),
+                         default_config=_substitute(fmt.mapper, item,
+                                                    default_config),
+                         description=_substitute(fmt.mapper, item,
+                                                 item["description"]),
+                         notes=_substitute(fmt.mapper, item, item["notes"]),
+                         constraints=constraint_texts))
+    return _Option(uid=item.uid,
+                   name=item["name"],
+                   index_entries=item["index-entries"],
+                   option_type=_OPTION_TYPES[item["appl-config-option-type"]],
+                   texts=texts)
+
+
+def _get_group(group: Item, formats: List[_Format]) -> _Group:
+    options = sorted(
+        (child for child in group.children("interface-ingroup")
+         if child.type.startswith("interface/appl-config-option")),
+        key=lambda x: x["name"])
+    return _Group(group.uid, group["name"], [
+        _substitute(fmt.mapper, group, group["description"]) for fmt in formats
+    ], _get_license(group), [
+        _get_option(item, list(item.parents("constraint")), formats)
+        for item in options
+    ])
+
+
+def _add_constraints(content: _ContentAdaptor, constraints: List[str]) -> None:
     if len(constraints) > 1:
         constraint_list = Content("BSD-2-Clause", False)
         prologue = ("The following constraints apply "
@@ -235,39 +336,34 @@ def _generate_constraints(content: _ContentAdaptor, item: Item,
     content.add_option_constraints(constraints)
 
 
-def _generate_initializer_or_integer(content: _ContentAdaptor, item: Item,
-                                     _option_type: str) -> None:
-    default_value = item["default-value"]
-    if not isinstance(default_value, str) or " " not in default_value:
-        default_value = f"The default value is {default_value}."
-    content.add_option_default_value(content.substitute(default_value))
+def _render(group: _Group, fmt_index: int, content: _ContentAdaptor) -> None:
+    content.register_license_and_copyrights(*group.license)
+    content.add_group(group.uid, group.name, group.descriptions[fmt_index])
+    for option in group.options:
+        texts = option.texts[fmt_index]
+        for the_license in texts.licenses:
+            content.register_license_and_copyrights(*the_license)
+        content.add_option(option.uid, option.name, option.index_entries)
+        content.add_option_type(option.option_type)
+        content.add_option_default_value(texts.default_value)
+        content.add_option_default_config(texts.default_config)
+        content.add_option_description(texts.description)
+        content.add_option_notes(texts.notes)
+        _add_constraints(content, texts.constraints)
+    content.add_licence_and_copyrights()
 
 
-_OPTION_GENERATORS = {
-    "feature": _generate_feature,
-    "feature-enable": _generate_feature,
-    "initializer": _generate_initializer_or_integer,
-    "integer": _generate_initializer_or_integer
-}
+# The group items and output formats of the active generation.  They are
+# accessed by the worker processes through the index of the group.
+_GROUPS: List[Tuple[List[Item], List[_Format]]] = []
 
 
-def _generate(group: Item, options: ItemMap, enabled: List[str],
-              content: _ContentAdaptor) -> None:
-    content.register_license_and_copyrights_of_item(group)
-    content.add_group(group.uid, group["name"],
-                      content.substitute(group["description"]))
-    for item in sorted(options.values(), key=lambda x: x["name"]):
-        content.mapper.item = item
-        name = item["name"]
-        content.register_license_and_copyrights_of_item(item)
-        content.add_option(item.uid, name, item["index-entries"])
-        option_type = item["appl-config-option-type"]
-        content.add_option_type(_OPTION_TYPES[option_type])
-        _OPTION_GENERATORS[option_type](content, item, option_type)
-        content.add_option_description(content.substitute(item["description"]))
-        content.add_option_notes(content.substitute(item["notes"]))
-        _generate_constraints(content, item, enabled)
-    content.add_licence_and_copyrights()
+def _get_group_in_worker(index: int) -> Tuple[_Group, str]:
+    groups, formats = _GROUPS[-1]
+    group = _get_group(groups[index], formats)
+    content = _SphinxContentAdaptor()
+    _render(group, _SPHINX, content)
+    return group, str(content.content)
 
 
 def _get_value_doxygen_url(ctx: ItemGetValueContext) -> Optional[str]:
@@ -318,36 +414,53 @@ def _add_doxygen_get_values(mapper: ItemMapper) -> None:
                          _get_value_doxygen_unspecfied_type)
 
 
-def generate(config: dict, group_uids: List[str],
-             item_cache: ItemCache) -> None:
-    """
-    Generates application configuration documentation sources according to the
-    configuration.
-
-    :param config: A dictionary with configuration entries.
-    :param item_cache: The specification item cache containing the application
-                       configuration groups and options.
-    """
-    sphinx_mapper = SphinxInterfaceMapper(EmptyItem(), group_uids)
-    doxygen_mapper = ItemMapper(EmptyItem())
-    _add_doxygen_get_values(doxygen_mapper)
-    doxygen_content = _DoxygenContentAdaptor(doxygen_mapper)
+def _generate_all(config: dict, group_uids: List[str],
+                  item_cache: ItemCache) -> None:
+    sphinx_format = _Format(SphinxInterfaceMapper(EmptyItem(), group_uids),
+                            config["enabled-documentation"])
+    doxygen_format = _Format(ItemMapper(EmptyItem()), config["enabled-source"])
+    _add_doxygen_get_values(doxygen_format.mapper)
+    doxygen_content = _DoxygenContentAdaptor()
     doxygen_content.content.add_automatically_generated_warning()
     with doxygen_content.content.defgroup_block(
             "RTEMSApplConfig", "Application Configuration Options"):
         doxygen_content.content.add("@ingroup RTEMSAPI")
+    groups: List[Item] = []
     for group_config in config["groups"]:
         group = item_cache[group_config["uid"]]
         assert group.type == "interface/appl-config-group"
-        options: ItemMap = {}
-        for child in group.children("interface-ingroup"):
-            if child.type.startswith("interface/appl-config-option"):
-                options[child.uid] = child
-        sphinx_content = _SphinxContentAdaptor(sphinx_mapper)
-        _generate(group, options, config["enabled-documentation"],
-                  sphinx_content)
-        sphinx_content.write(group_config["target"])
-        _generate(group, options, config["enabled-source"], doxygen_content)
+        groups.append(group)
+    _GROUPS.append((groups, [sphinx_format, doxygen_format]))
+    try:
+        results = map_jobs(_get_group_in_worker, range(len(groups)),
+                           config.get("jobs", 1))
+    finally:
+        _GROUPS.pop()
+    for group_config, (group, text) in zip(config["groups"], results):
+        write_output(group_config["target"], text)
+        record_output(group_config["target"], text)
+        _render(group, _DOXYGEN, doxygen_content)
     doxygen_content.content.prepend_copyrights_and_licenses()
     doxygen_content.content.prepend_spdx_license_identifier()
     doxygen_content.write(config["doxygen-target"])
+
+
+def generate(config: dict, group_uids: List[str],
+             item_cache: ItemCache) -> None:
+    """
+    Generates application configuration documentation sources according to the
+    configuration.
+
+    The model of each group is built once for the Sphinx and the Doxygen
+    output.  The optional "jobs" configuration entry specifies the count of
+    worker processes used to build the models of the groups and to render the
+    Sphinx outputs.
+
+    :param config: A dictionary with configuration entries.
+    :param item_cache: The specification item cache containing the application
+                       configuration groups and options.
+    """
+    run_unit("applconfig", {
+        "config": config,
+        "group-uids": group_uids
+    }, lambda: _generate_all(config, group_uids, item_cache))
@@ -28,16 +28,20 @@
 
 from contextlib import contextmanager
 import collections
+import functools
 import itertools
 import math
 import os
 import re
 import sys
+import tempfile
 import textwrap
-from typing import Any, Callable, ContextManager, Deque, Dict, Iterable, \
-    Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+from typing import Any, Callable, ContextManager, Deque, Dict, IO, \
+    Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
+from rtemsspec.incremental import record_output, record_output_chunks
 from rtemsspec.items import Item, ItemGetValueContext
+from rtemsspec.outputsink import write_output, write_output_chunks
 
 AddContext = Callable[["Content"], ContextManager[None]]
 GenericContent = Union[str, List[str], "Content"]
@@ -161,6 +165,24 @@ def _add_context(_content: "Content") -> Iterator[None]:
 
 _SPECIAL_BLOCK = re.compile(r"^( *\* | *[0-9]+\. | +)")
 
+
+@functools.lru_cache(maxsize=4096)
+def _wrap_block(block: str, width: int, initial_indent: str,
+                subsequent_indent: str) -> Tuple[str, ...]:
+    # Fast path for a paragraph which fits on the first line.  The text
+    # wrapper would only drop trailing white space and replace white space
+    # characters other than the space.
+    if block.isprintable() and block[-1:] not in (
+            "", " ") and len(initial_indent) + len(block) <= width:
+        return (f"{initial_indent}{block}", )
+    wrapper = textwrap.TextWrapper(width=width,
+                                   initial_indent=initial_indent,
+                                   subsequent_indent=subsequent_indent,
+                                   break_long_words=False,
+                                   break_on_hyphens=False)
+    return tuple(wrapper.wrap(block))
+
+
 _AUTOMATICALLY_GENERATED_WARNING = [
     "This file is part of the RTEMS quality process and was automatically",
     "generated.  If you find something that needs to be fixed or",
@@ -185,7 +207,9 @@ class Content:
     # pylint: disable=too-many-instance-attributes
     # pylint: disable=too-many-public-methods
     def __init__(self, the_license: str, pop_indent_gap: bool):
+        self._header_lines: List[str] = []
         self._lines: List[str] = []
+        self._stream: Optional[IO[str]] = None
         self._license = the_license
         self._copyrights = Copyrights()
         self._gap = False
@@ -197,13 +221,32 @@ class Content:
         self._pop_indent_gap = pop_indent_gap
 
     def __str__(self):
-        return "\n".join(itertools.chain(self._lines, [""]))
+        if self._stream is None:
+            return "\n".join(
+                itertools.chain(self._header_lines, self._lines, [""]))
+        return "".join(self._get_chunks())
+
+    def _get_chunks(self) -> Iterator[str]:
+        yield "".join(f"{line}\n" for line in self._header_lines)
+        stream = self._stream
+        assert stream is not None
+        stream.seek(0)
+        yield from iter(lambda: stream.read(65536), "")
+        yield "".join(f"{line}\n" for line in self._lines)
 
     @property
     def lines(self) -> List[str]:
-        """ The lines. """
+        """ The lines which are not flushed. """
+        self._merge_header_lines()
         return self._lines
 
+    def _merge_header_lines(self) -> None:
+        # The header lines stay in front of the flushed lines
+        if self._header_lines and self._stream is None:
+            self._header_lines.extend(self._lines)
+            self._lines = self._header_lines
+            self._header_lines = []
+
     @property
     def tab(self) -> str:
         """ The tabulator. """
@@ -217,8 +260,14 @@ class Content:
 
     def prepend(self, content: GenericContent) -> None:
         """ Prepends the content. """
-        self._lines[0:0] = _indent(make_lines(content), self._indent,
-                                   self._empty_line_indent)
+        lines = _indent(make_lines(content), self._indent,
+                        self._empty_line_indent)
+        if self._lines or self._stream is not None:
+            # Keep the prepended lines in header slots in front of the body
+            # lines, so that late prepends do not move the whole body.
+            self._header_lines[0:0] = lines
+        else:
+            self._lines.extend(lines)
 
     def add(self,
             content: Optional[GenericContent],
@@ -260,10 +309,7 @@ class Content:
                     subsequent_indent = self._tab
                 else:
                     subsequent_indent = ""
-            wrapper = textwrap.TextWrapper()
-            wrapper.break_long_words = False
-            wrapper.break_on_hyphens = False
-            wrapper.width = 79 - len(self._indent)
+            width = 79 - len(self._indent)
             gap: List[str] = []
             blocks = collections.deque(text.split("\n\n"))
             while blocks:
@@ -271,7 +317,7 @@ class Content:
                 match = _SPECIAL_BLOCK.search(block)
                 if match:
                     space = len(match.group(0)) * " "
-                    wrapper.subsequent_indent = f"{subsequent_indent}{space}"
+                    block_indent = f"{subsequent_indent}{space}"
                     block = block.replace(f"\n{space}", "\n")
                 elif block.startswith(".. code-block"):
                     self.add(block)
@@ -280,15 +326,14 @@ class Content:
                         self._add_verbatim(blocks)
                     continue
                 else:
-                    wrapper.subsequent_indent = subsequent_indent
-                if gap:
-                    wrapper.initial_indent = subsequent_indent
-                else:
-                    wrapper.initial_indent = initial_indent
+                    block_indent = subsequent_indent
+                lines = list(
+                    _wrap_block(block, width,
+                                subsequent_indent if gap else initial_indent,
+                                block_indent))
                 self._lines.extend(gap)
                 self._lines.extend(
-                    _indent(wrapper.wrap(block), self._indent,
-                            self._empty_line_indent))
+                    _indent(lines, self._indent, self._empty_line_indent))
                 gap = [self._empty_line_indent]
 
     def wrap(self,
@@ -329,15 +374,10 @@ class Content:
         text = text.strip()
         if not text:
             return
-        wrapper = textwrap.TextWrapper()
-        wrapper.break_long_words = False
-        wrapper.break_on_hyphens = False
-        wrapper.initial_indent = ""
-        wrapper.width = 79 - len(self._indent)
+        width = 79 - len(self._indent)
         for index, block in enumerate(text.split("\n\n")):
             if index == 0:
-                wrapper.subsequent_indent = ""
-                lines = wrapper.wrap(block)
+                lines = list(_wrap_block(block, width, "", ""))
                 if 0 < len(last) >= indent_len:
                     self._lines[-1] = last[0:indent_len] + lines[0]
                     lines = lines[1:]
@@ -346,11 +386,10 @@ class Content:
                 match = _SPECIAL_BLOCK.search(block)
                 if match:
                     space = len(match.group(0)) * " "
-                    wrapper.subsequent_indent = space
                     block = block.replace(f"\n{space}", "\n")
                 else:
-                    wrapper.subsequent_indent = ""
-                lines = wrapper.wrap(block)
+                    space = ""
+                lines = list(_wrap_block(block, width, "", space))
                 self._lines.append(self._empty_line_indent)
             self._lines.extend(
                 _indent(lines, self._indent, self._empty_line_indent))
@@ -409,10 +448,35 @@ class Content:
         self.pop_indent()
 
     def indent_lines(self, level: int) -> None:
-        """ Indents all lines by the specified indent level. """
+        """
+        Indents all lines which are not flushed by the specified indent level.
+        """
         prefix = level * self._tab
+        self._merge_header_lines()
+        self._header_lines = [
+            prefix + line if line else line for line in self._header_lines
+        ]
         self._lines = [prefix + line if line else line for line in self._lines]
 
+    def flush(self) -> None:
+        """
+        Flushes the lines to the stream of the content.
+
+        The stream is a temporary file, so that large content does not need to
+        be kept in memory.  The flushed lines are final.  The lines property
+        and the methods which edit already added lines only see the lines
+        added after the last flush.  Content prepended after the first flush
+        is kept in header slots in front of the flushed lines.  Content.write()
+        writes the header lines, the flushed lines, and the remaining lines
+        chunk by chunk to the active output sink.
+        """
+        if self._stream is None:
+            self._stream = tempfile.TemporaryFile("w+", encoding="utf-8")
+        else:
+            self._stream.seek(0, os.SEEK_END)
+        self._stream.writelines(f"{line}\n" for line in self._lines)
+        self._lines = []
+
     def add_blank_line(self):
         """ Adds a blank line. """
         self._lines.append("")
@@ -499,12 +563,17 @@ class Content:
             self.append(_AUTOMATICALLY_GENERATED_WARNING)
 
     def write(self, path: str) -> None:
-        """ Writes the content to the file specified by the path. """
-        directory = os.path.dirname(path)
-        if directory:
-            os.makedirs(directory, exist_ok=True)
-        with open(path, "w+", encoding="utf-8") as out:
-            out.write(str(self))
+        """
+        Writes the content to the file specified by the path using the active
+        output sink.
+        """
+        if self._stream is None:
+            text = str(self)
+            write_output(path, text)
+            record_output(path, text)
+        else:
+            write_output_chunks(path, self._get_chunks)
+            record_output_chunks(path, self._get_chunks)
 
 
 _BSD_2_CLAUSE_LICENSE = """Redistribution and use in source and binary \
@@ -740,6 +809,7 @@ class CContent(Content):
     def close_comment_block(self) -> None:
         """ Closes a comment block. """
         self.pop_indent()
+        self._merge_header_lines()
         if self._lines[-1].lstrip().startswith("/*"):
             # Discard empty comment blocks
             self._lines = self._lines[:-2]
@@ -24,12 +24,19 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import functools
 import glob
+import itertools
+import os
+import pickle
 import re
-from typing import Any, Dict, List, NamedTuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+from rtemsspec.incremental import map_jobs, run_unit
+from rtemsspec.outputsink import open_atomically
 from rtemsspec.sphinxcontent import SphinxContent, SphinxInterfaceMapper
-from rtemsspec.items import Item, ItemCache, ItemGetValueContext, ItemMapper
+from rtemsspec.items import Item, ItemCache, \
+    ItemGetValueContext, ItemMapper
 
 ItemMap = Dict[str, Item]
 
@@ -70,18 +77,73 @@ _TERM = re.compile(r":term:`([^`]+)`")
 _TERM_2 = re.compile(r"^[^<]+<([^>]+)>")
 
 
-def _find_glossary_terms(path: str, document_terms: ItemMap,
-                         glossary: _Glossary) -> None:
-    for src in glob.glob(path + "/**/*.rst", recursive=True):
-        if src.endswith("glossary.rst"):
-            continue
-        with open(src, "r", encoding="utf-8") as out:
-            for term in _TERM.findall(out.read()):
-                match = _TERM_2.search(term)
-                if match:
-                    term = match.group(1)
-                item = glossary.term_to_item[term]
-                document_terms[item.uid] = item
+def _get_sources(path: str) -> List[str]:
+    return [
+        src for src in glob.glob(path + "/**/*.rst", recursive=True)
+        if not src.endswith("glossary.rst")
+    ]
+
+
+def _scan_source(src: str) -> List[str]:
+    terms: List[str] = []
+    with open(src, "r", encoding="utf-8") as out:
+        for term in _TERM.findall(out.read()):
+            match = _TERM_2.search(term)
+            if match:
+                term = match.group(1)
+            terms.append(term)
+    return terms
+
+
+# The term index maps a source file path to the file modification time, the
+# file size, and the terms referenced by the source file.
+_TermIndex = Dict[str, Tuple[int, int, List[str]]]
+
+
+def _load_term_index(index_path: Optional[str]) -> _TermIndex:
+    if index_path:
+        try:
+            with open(index_path, "rb") as src:
+                index = pickle.load(src)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # A damaged index is rebuilt
+            pass
+        else:
+            if isinstance(index, dict):
+                return index
+    return {}
+
+
+def _scan_sources(sources: Dict[str, None], index_path: Optional[str],
+                  jobs: int) -> Dict[str, List[str]]:
+    old_index = _load_term_index(index_path)
+    index: _TermIndex = {}
+    cold: Dict[str, Tuple[int, int]] = {}
+    for src in sources:
+        stat = os.stat(src)
+        entry = old_index.get(src, None)
+        if entry is not None and entry[0:2] == (stat.st_mtime_ns,
+                                                stat.st_size):
+            index[src] = entry
+        else:
+            cold[src] = (stat.st_mtime_ns, stat.st_size)
+    terms = map_jobs(_scan_source, cold, jobs, 16)
+    for (src, (mtime, size)), src_terms in zip(cold.items(), terms):
+        index[src] = (mtime, size, src_terms)
+    if index_path and index != old_index:
+        with open_atomically(index_path, "wb") as out:
+            pickle.dump(index, out)
+    return {src: entry[2] for src, entry in index.items()}
+
+
+def _get_document_terms(document_config: dict,
+                        sources_by_path: Dict[str, List[str]],
+                        terms_by_source: Dict[str, List[str]]) -> List[str]:
+    terms: Dict[str, None] = {}
+    for path in document_config["rest-source-paths"]:
+        for src in sources_by_path[path]:
+            terms.update(dict.fromkeys(terms_by_source[src]))
+    return list(terms)
 
 
 class _GlossaryMapper(ItemMapper):
@@ -106,21 +168,39 @@ def _resolve_glossary_terms(document_terms: ItemMap) -> None:
         _GlossaryMapper(term, document_terms).substitute(term["text"])
 
 
-def _generate_project_glossary(glossary: _Glossary, header: str, target: str,
-                               group_uids: List[str]) -> None:
+def _gather_project_glossary(config: dict, item_cache: ItemCache) -> _Glossary:
+    groups: ItemMap = {}
+    for uid, item in item_cache.all.items():
+        if item.type == "glossary/group":
+            groups[uid] = item
+
+    project_glossary = _Glossary({}, {})
+    for group in config["project-groups"]:
+        _gather_glossary_terms(groups[group], project_glossary)
+    return project_glossary
+
+
+def _generate_project_glossary(config: dict, group_uids: List[str],
+                               item_cache: ItemCache) -> None:
+    target = config["project-target"]
     if target:
-        _generate_glossary_content(glossary.uid_to_item, header, target,
+        glossary = _gather_project_glossary(config, item_cache)
+        _generate_glossary_content(glossary.uid_to_item,
+                                   config["project-header"], target,
                                    group_uids)
 
 
-def _generate_document_glossary(config: dict, group_uids: List[str],
-                                glossary: _Glossary) -> None:
+def _generate_document_glossary(config: dict, document_config: dict,
+                                terms: List[str], group_uids: List[str],
+                                item_cache: ItemCache) -> None:
+    glossary = _gather_project_glossary(config, item_cache)
     document_terms: ItemMap = {}
-    for path in config["rest-source-paths"]:
-        _find_glossary_terms(path, document_terms, glossary)
+    for term in terms:
+        item = glossary.term_to_item[term]
+        document_terms[item.uid] = item
     _resolve_glossary_terms(document_terms)
-    _generate_glossary_content(document_terms, config["header"],
-                               config["target"], group_uids)
+    _generate_glossary_content(document_terms, document_config["header"],
+                               document_config["target"], group_uids)
 
 
 def generate(config: dict, group_uids: List[str],
@@ -128,22 +208,42 @@ def generate(config: dict, group_uids: List[str],
     """
     Generates glossaries of terms according to the configuration.
 
+    The terms referenced by the reStructuredText sources of the documents are
+    stored in the optional term index file specified by the "term-index"
+    configuration entry.  Only sources which changed since the index was
+    stored are scanned for terms.  The optional "jobs" configuration entry
+    specifies the count of worker processes used to scan the sources.
+
     :param config: A dictionary with configuration entries.
     :param item_cache: The specification item cache containing the glossary
                        groups and terms.
     """
-    groups: ItemMap = {}
-    for uid, item in item_cache.all.items():
-        if item.type == "glossary/group":
-            groups[uid] = item
-
-    project_glossary = _Glossary({}, {})
-    for group in config["project-groups"]:
-        _gather_glossary_terms(groups[group], project_glossary)
-
-    _generate_project_glossary(project_glossary, config["project-header"],
-                               config["project-target"], group_uids)
-
+    project_config = {
+        "project-groups": config["project-groups"],
+        "project-header": config["project-header"],
+        "project-target": config["project-target"],
+        "group-uids": group_uids
+    }
+    run_unit(
+        "glossary:project", project_config,
+        functools.partial(_generate_project_glossary, config, group_uids,
+                          item_cache))
+    sources_by_path: Dict[str, List[str]] = {}
+    for document_config in config["documents"]:
+        for path in document_config["rest-source-paths"]:
+            sources_by_path[path] = _get_sources(path)
+    terms_by_source = _scan_sources(
+        dict.fromkeys(itertools.chain.from_iterable(sources_by_path.values())),
+        config.get("term-index", None), config.get("jobs", 1))
     for document_config in config["documents"]:
-        _generate_document_glossary(document_config, group_uids,
-                                    project_glossary)
+        terms = _get_document_terms(document_config, sources_by_path,
+                                    terms_by_source)
+        run_unit(
+            f"glossary:{document_config['target']}", {
+                "config": document_config,
+                "project-groups": config["project-groups"],
+                "group-uids": group_uids,
+                "terms": terms
+            },
+            functools.partial(_generate_document_glossary, config,
+                              document_config, terms, group_uids, item_cache))
@@ -0,0 +1,337 @@
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module provides a dependency tracker to skip the generation of outputs
+with unchanged inputs.
+"""
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from contextlib import contextmanager
+import base64
+import concurrent.futures
+import hashlib
+import json
+import multiprocessing
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, \
+    Tuple
+
+from rtemsspec.items import data_digest, ItemCache, record_item_uids
+from rtemsspec.outputsink import Chunks, open_atomically, OutputSink, \
+    output_sink, write_output
+
+# Increment this version if the format of the manifest changes or if the
+# generators produce different outputs for unchanged inputs.
+_MANIFEST_VERSION = 1
+
+UnitRecord = Dict[str, Any]
+
+Unit = Tuple[str, Any, Callable[[], None]]
+
+
+def _text_digest(chunks: Iterable[str]) -> str:
+    state = hashlib.sha256()
+    for chunk in chunks:
+        state.update(chunk.encode("utf-8"))
+    return base64.urlsafe_b64encode(state.digest()).decode("ascii")
+
+
+def _file_digest(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as src:
+            return _text_digest(iter(lambda: src.read(65536), ""))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class DependencyTracker:
+    """
+    Tracks the items used to generate outputs.
+
+    The outputs are generated by units.  A unit is identified by a key.  For
+    each unit, the digest of the unit configuration, the digest of the item
+    cache structure, the digests of the items used by the unit, and the digests
+    of the outputs written by the unit are recorded in a manifest.  The
+    generation of a unit is skipped, if all recorded digests are equal to the
+    current digests.  The item cache structure consists of the item UIDs, the
+    item types, and the links to parents of all items.  A unit may provide a
+    function returning a structure digest of its own which replaces the digest
+    of the item cache structure for this unit.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, item_cache: ItemCache, manifest_path: str):
+        self._item_cache = item_cache
+        self._manifest_path = manifest_path
+        self._item_digests: Dict[str, Optional[str]] = {}
+        self._structure_digest: Optional[str] = None
+        self._recorded_units: Dict[str, UnitRecord] = {}
+        self._outputs: List[Dict[str, str]] = []
+        self.generated = 0
+        self.skipped = 0
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as src:
+                manifest = json.load(src)
+        except (OSError, ValueError):
+            manifest = {}
+        if manifest.get("version", None) == _MANIFEST_VERSION:
+            self._units: Dict[str, UnitRecord] = manifest["units"]
+        else:
+            self._units = {}
+
+    def _get_item_digest(self, uid: str) -> Optional[str]:
+        try:
+            return self._item_digests[uid]
+        except KeyError:
+            item = self._item_cache.all.get(uid, None)
+            digest = None if item is None else item.digest
+            self._item_digests[uid] = digest
+            return digest
+
+    def _get_structure_digest(self) -> str:
+        if self._structure_digest is None:
+            self._structure_digest = data_digest(
+                [[item.uid, item.type] + [[link.item.uid, link.role]
+                                          for link in item.links_to_parents()]
+                 for item in sorted(self._item_cache.all.values())])
+        return self._structure_digest
+
+    def _is_up_to_date(self, record: UnitRecord, config_digest: str,
+                       structure_digest: str) -> bool:
+        return record["config"] == config_digest and record[
+            "structure"] == structure_digest and all(
+                self._get_item_digest(uid) == digest
+                for uid, digest in record["inputs"].items()) and all(
+                    _file_digest(path) == digest
+                    for path, digest in record["outputs"].items())
+
+    def record_output(self, path: str, text: str) -> None:
+        """
+        Records the output text written to the file specified by the path.
+        """
+        self.record_output_chunks(path, lambda: [text])
+
+    def record_output_chunks(self, path: str, chunks: Chunks) -> None:
+        """
+        Records the output text made of the chunks written to the file
+        specified by the path.
+        """
+        if self._outputs:
+            self._outputs[-1][os.path.normpath(path)] = _text_digest(chunks())
+
+    def run_unit(self,
+                 key: str,
+                 config: Any,
+                 generate: Callable[[], None],
+                 structure: Optional[Callable[[], str]] = None) -> UnitRecord:
+        """
+        Runs the generator of the unit specified by the key if the recorded
+        digests of the unit are not up-to-date.
+
+        If the structure digest function is specified, then the digest it
+        returns is used instead of the digest of the item cache structure.
+
+        Returns the record of the unit.
+        """
+        config_digest = data_digest(config)
+        structure_digest = self._get_structure_digest(
+        ) if structure is None else structure()
+        record = self._units.get(key, None)
+        if record is not None and self._is_up_to_date(record, config_digest,
+                                                      structure_digest):
+            self.skipped += 1
+        else:
+            self.generated += 1
+            outputs: Dict[str, str] = {}
+            self._outputs.append(outputs)
+            try:
+                with record_item_uids() as uids:
+                    generate()
+            finally:
+                self._outputs.pop()
+            record = {
+                "config": config_digest,
+                "structure": structure_digest,
+                "inputs": {
+                    uid: self._get_item_digest(uid)
+                    for uid in sorted(uids)
+                },
+                "outputs": outputs
+            }
+        self.add_unit(key, record)
+        return record
+
+    def add_unit(self, key: str, record: UnitRecord) -> None:
+        """ Adds the record of the unit specified by the key. """
+        self._recorded_units[key] = record
+
+    def save(self) -> None:
+        """
+        Saves the manifest.  The records of units which were not run are kept.
+        """
+        units = dict(self._units)
+        units.update(self._recorded_units)
+        with open_atomically(self._manifest_path) as out:
+            json.dump({
+                "version": _MANIFEST_VERSION,
+                "units": units
+            },
+                      out,
+                      indent=1,
+                      sort_keys=True)
+
+
+_TRACKER: List[DependencyTracker] = []
+
+
+@contextmanager
+def track(tracker: Optional[DependencyTracker]) -> Iterator[None]:
+    """
+    Opens a context in which the generators use the dependency tracker.
+
+    If no dependency tracker is specified, then all units are generated.  The
+    manifest is saved if the context is left without an exception.
+    """
+    if tracker is None:
+        yield
+    else:
+        _TRACKER.append(tracker)
+        try:
+            yield
+        finally:
+            _TRACKER.pop()
+        tracker.save()
+
+
+def record_output(path: str, text: str) -> None:
+    """
+    Records the output text written to the file specified by the path in the
+    active dependency tracker.
+    """
+    if _TRACKER:
+        _TRACKER[-1].record_output(path, text)
+
+
+def record_output_chunks(path: str, chunks: Chunks) -> None:
+    """
+    Records the output text made of the chunks written to the file specified
+    by the path in the active dependency tracker.
+    """
+    if _TRACKER:
+        _TRACKER[-1].record_output_chunks(path, chunks)
+
+
+def run_unit(
+        key: str,
+        config: Any,
+        generate: Callable[[], None],
+        structure: Optional[Callable[[], str]] = None) -> Optional[UnitRecord]:
+    """
+    Runs the generator of the unit specified by the key and the configuration.
+
+    If a dependency tracker is active, then the generator is only run if the
+    inputs of the unit changed and the record of the unit is returned,
+    otherwise the generator is run unconditionally and None is returned.  The
+    digest returned by the optional structure digest function replaces the
+    digest of the item cache structure, see DependencyTracker.  The function is
+    only called if a dependency tracker is active.
+    """
+    if _TRACKER:
+        return _TRACKER[-1].run_unit(key, config, generate, structure)
+    generate()
+    return None
+
+
+def add_unit(key: str, record: Optional[UnitRecord]) -> None:
+    """
+    Adds the unit record returned by run_unit() called by a worker process to
+    the active dependency tracker.
+    """
+    if _TRACKER and record is not None:
+        _TRACKER[-1].add_unit(key, record)
+
+
+# The units shared with the worker processes.  The worker processes are
+# forked, so the units are inherited and not transferred through pickling.
+_UNITS: List[List[Unit]] = []
+
+_UnitResult = Tuple[str, Optional[UnitRecord], List[Tuple[str, str]]]
+
+
+def _run_unit_in_worker(index: int) -> _UnitResult:
+    key, config, generate = _UNITS[-1][index]
+    with output_sink(OutputSink()) as sink:
+        record = run_unit(key, config, generate)
+    return key, record, sink.outputs
+
+
+def _add_unit_results(results: Iterable[_UnitResult]) -> None:
+    for key, record, outputs in results:
+        add_unit(key, record)
+        for path, text in outputs:
+            write_output(path, text)
+
+
+def map_jobs(function: Callable[[Any], Any],
+             iterable: Iterable[Any],
+             jobs: Optional[int] = 1,
+             chunksize: int = 1) -> List[Any]:
+    """
+    Returns the list of the function results for the elements of the iterable.
+
+    If the job count is one, then the function is called by the calling
+    process, otherwise the function is called by forked worker processes.  If
+    the job count is None, then the count of processors is used.  The function
+    results are in the order of the elements.
+    """
+    if jobs == 1:
+        return list(map(function, iterable))
+    with concurrent.futures.ProcessPoolExecutor(
+            jobs, mp_context=multiprocessing.get_context("fork")) as executor:
+        return list(executor.map(function, iterable, chunksize=chunksize))
+
+
+def run_units(units: List[Unit], jobs: int = 1) -> None:
+    """
+    Runs the generators of the units specified by the key, the configuration,
+    and the generator of each unit.
+
+    If the job count is greater than one, then the units are run by forked
+    worker processes, otherwise the units are run by the calling process.  The
+    outputs of the units are written to the active output sink and the unit
+    records are added to the active dependency tracker by the calling process
+    in the order of the units, so the outputs do not depend on the job count.
+    """
+    if jobs == 1:
+        # Write the outputs of each unit directly to the active output sink
+        for key, config, generate in units:
+            run_unit(key, config, generate)
+        return
+    _UNITS.append(units)
+    try:
+        _add_unit_results(
+            map_jobs(_run_unit_in_worker, range(len(units)), jobs))
+    finally:
+        _UNITS.pop()
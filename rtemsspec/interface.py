@@ -29,14 +29,15 @@ from contextlib import contextmanager
 import functools
 import itertools
 import os
-from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, \
-    Union, Set, Tuple
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, \
+    Optional, Union, Set, Tuple
 
 from rtemsspec.content import CContent, CInclude, enabled_by_to_exp, \
     ExpressionMapper, forward_declaration, get_value_compound, \
     get_value_double_colon, get_value_doxygen_function, \
     get_value_doxygen_group, get_value_forward_declaration, get_value_hash, \
     get_value_params, get_value_plural, to_camel_case
+from rtemsspec.incremental import run_units, Unit
 from rtemsspec.items import Item, ItemCache, ItemGetValueMap, ItemMapper
 
 ItemMap = Dict[str, Item]
@@ -682,32 +683,64 @@ _NODE_GENERATORS = {
 }
 
 
-def _is_ready_to_bubble(before: Node, after: Node) -> bool:
-    if after in before.dependents:
-        return False
+def _get_placement_key(node: Node) -> Tuple[bool, bool, Tuple[str, int], str]:
+    # Move the groups towards the top of the header file, then move items with
+    # an explicit placement order towards the bottom of the file
+    return (node.item.type != "interface/group", node.index
+            is not None, node.index or ("", 0), node.item.uid)
 
-    # Move the groups towards the top of the header file
-    group = "interface/group"
-    if (before.item.type == group) ^ (after.item.type == group):
-        return after.item.type == group
 
-    # Move items with an explicit placement order towards the bottom of the
-    # file
-    if before.index and after.index:
-        return after.index < before.index
-    if after.index:
-        return False
-
-    return after < before
+def _get_ranks(nodes: List[Node], key: Callable[[Node], Any]) -> List[int]:
+    ranks = [0] * len(nodes)
+    for rank, position in enumerate(
+            sorted(range(len(nodes)), key=lambda i: key(nodes[i]))):
+        ranks[position] = rank
+    return ranks
 
 
 def _bubble_sort(nodes: List[Node]) -> List[Node]:
     node_count = len(nodes)
+    positions = {
+        node.item.uid: position
+        for position, node in enumerate(nodes)
+    }
+    dependents = [
+        set(positions[other.item.uid] for other in node.dependents)
+        for node in nodes
+    ]
+    ranks = _get_ranks(nodes, _get_placement_key)
+    uid_ranks = _get_ranks(nodes, lambda node: node.item.uid)
+    is_group = [node.item.type == "interface/group" for node in nodes]
+    is_indexed = [node.index is not None for node in nodes]
+    order = list(range(node_count))
+    start = 0
     for i in range(node_count - 1):
-        for j in range(node_count - 1 - i):
-            if _is_ready_to_bubble(nodes[j], nodes[j + 1]):
-                nodes[j], nodes[j + 1] = nodes[j + 1], nodes[j]
-    return nodes
+        first_swap = -1
+        for j in range(start, node_count - 1 - i):
+            before = order[j]
+            after = order[j + 1]
+            # A node is moved before another node only if it does not depend
+            # on the other node and it has a lower placement rank
+            if ranks[after] > ranks[before] or after in dependents[before]:
+                continue
+
+            # A node without an explicit placement order is moved before a
+            # node with an explicit placement order only if it has a lower UID
+            if is_indexed[before] and not is_indexed[after] and is_group[
+                    before] == is_group[after]:
+                if uid_ranks[after] > uid_ranks[before]:
+                    continue
+            order[j] = after
+            order[j + 1] = before
+            if first_swap < 0:
+                first_swap = j
+        if first_swap < 0:
+            break
+
+        # The nodes in front of the first swap remain in place in the next
+        # pass
+        start = max(0, first_swap - 1)
+    return [nodes[position] for position in order]
 
 
 class _HeaderFile:
@@ -759,9 +792,8 @@ class _HeaderFile:
         The nodes form a partially ordered set (poset).  The ordering is done
         in two steps.  Firstly, a topological sort using Kahn's algorithm is
         carried out.  Secondly, the nodes are sorted using a bubble sort which
-        takes node dependencies into account.  There are more efficient ways to
-        do this, however, if you experience run time problems due to this
-        method, then maybe you should reconsider your header file organization.
+        takes node dependencies into account.  The bubble sort compares
+        precomputed placement ranks and stops if a pass swaps no nodes.
         """
         nodes_in_dependency_order: List[Node] = []
 
@@ -771,21 +803,22 @@ class _HeaderFile:
             in_degree[node.item.uid] = len(node.dependents)
 
         # Create a queue with all nodes with no incoming edges
-        queue: List[Node] = []
+        queue: Deque[Node] = collections.deque()
         for node in sorted(self._nodes.values()):
             if in_degree[node.item.uid] == 0:
                 queue.append(node)
 
         # Topological sort
         while queue:
-            node = queue.pop(0)
-            nodes_in_dependency_order.insert(0, node)
+            node = queue.popleft()
+            nodes_in_dependency_order.append(node)
 
             for other in sorted(node.depends_on):
                 in_degree[other.item.uid] -= 1
                 if in_degree[other.item.uid] == 0:
                     queue.append(other)
 
+        nodes_in_dependency_order.reverse()
         return _bubble_sort(nodes_in_dependency_order)
 
     def finalize(self) -> None:
@@ -851,6 +884,11 @@ def generate(config: dict, item_cache: ItemCache) -> None:
     """
     Generates header files according to the configuration.
 
+    The optional "jobs" configuration entry specifies the count of worker
+    processes used to generate the header files.  If the count is one or no
+    count is specified, then the header files are generated by the calling
+    process.
+
     :param config: A dictionary with configuration entries.
     :param item_cache: The specification item cache containing the interfaces.
     """
@@ -858,6 +896,16 @@ def generate(config: dict, item_cache: ItemCache) -> None:
     enabled = config["enabled"]
     enabled_by_defined = _gather_enabled_by_defined(
         config["item-level-interfaces"], item_cache)
+    unit_config = {
+        "domains": domains,
+        "enabled": enabled,
+        "enabled-by-defined": enabled_by_defined
+    }
+    units: List[Unit] = []
     for item in item_cache.all.values():
         if item.type == "interface/header-file":
-            _generate_header_file(item, domains, enabled_by_defined, enabled)
+            units.append(
+                (f"interface:{item.uid}", unit_config,
+                 functools.partial(_generate_header_file, item, domains,
+                                   enabled_by_defined, enabled)))
+    run_units(units, config.get("jobs", 1))
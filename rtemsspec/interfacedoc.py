@@ -34,6 +34,7 @@ from rtemsspec.content import CContent, get_value_compound, \
     get_value_forward_declaration
 from rtemsspec.sphinxcontent import get_label, get_reference, sanitize_name, \
     SphinxContent, SphinxInterfaceMapper
+from rtemsspec.incremental import run_units, Unit
 from rtemsspec.items import Item, ItemCache, ItemGetValueContext, ItemMapper
 
 ItemMap = Dict[str, Item]
@@ -200,24 +201,43 @@ def _generate_directives(target: str, group: Item, group_uids: List[str],
     content.write(target)
 
 
-def _directive_key(order: List[Item], item: Item) -> Tuple[int, str]:
-    try:
-        index = order.index(item) - len(order)
-    except ValueError:
-        index = 1
-    return (index, item.uid)
+def _generate_group(doc_config: Dict[str,
+                                     Any], group: Item, group_uids: List[str],
+                    items: List[Item], enabled: List[str]) -> None:
+    _generate_introduction(doc_config["introduction-target"], group,
+                           group_uids, items)
+    _generate_directives(doc_config["directives-target"], group, group_uids,
+                         items, enabled)
+
+
+def _get_placement_order(group: Item) -> Dict[str, int]:
+    order = list(group.parents("placement-order"))
+    indices: Dict[str, int] = {}
+    for index, item in enumerate(order):
+        indices.setdefault(item.uid, index - len(order))
+    return indices
+
+
+def _directive_key(order: Dict[str, int], item: Item) -> Tuple[int, str]:
+    return (order.get(item.uid, 1), item.uid)
 
 
 def generate(config: dict, item_cache: ItemCache) -> None:
     """
     Generates interface documentation according to the configuration.
 
+    The optional "jobs" configuration entry specifies the count of worker
+    processes used to generate the documentation of the groups.  If the count
+    is one or no count is specified, then the documentation is generated by
+    the calling process.
+
     :param config: A dictionary with configuration entries.
     :param item_cache: The specification item cache containing the interfaces.
     """
     groups = config["groups"]
     enabled = config["enabled"]
     group_uids = [doc_config["group"] for doc_config in groups]
+    units: List[Unit] = []
     for doc_config in groups:
         items: List[Item] = []
         group = item_cache[doc_config["group"]]
@@ -225,9 +245,13 @@ def generate(config: dict, item_cache: ItemCache) -> None:
         for child in group.children("interface-ingroup"):
             if child.type in ["interface/function", "interface/macro"]:
                 items.append(child)
-        items.sort(key=functools.partial(
-            _directive_key, list(group.parents("placement-order"))))
-        _generate_introduction(doc_config["introduction-target"], group,
-                               group_uids, items)
-        _generate_directives(doc_config["directives-target"], group,
-                             group_uids, items, enabled)
+        items.sort(
+            key=functools.partial(_directive_key, _get_placement_order(group)))
+        units.append((f"interfacedoc:{group.uid}", {
+            "config": doc_config,
+            "enabled": enabled,
+            "group-uids": group_uids
+        },
+                      functools.partial(_generate_group, doc_config, group,
+                                        group_uids, items, enabled)))
+    run_units(units, config.get("jobs", 1))
@@ -36,6 +36,8 @@ from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, \
 import json
 import yaml
 
+from rtemsspec.outputsink import open_atomically
+
 
 class ItemGetValueContext(NamedTuple):
     """ Context used to get an item value. """
@@ -173,6 +175,28 @@ def _hash_data(data, state) -> None:
         state.update(str(data).encode("utf-8"))
 
 
+_ITEM_UID_RECORDERS: List[Set[str]] = []
+
+
+@contextmanager
+def record_item_uids() -> Iterator[Set[str]]:
+    """
+    Opens a context which records the UIDs of the items with data accessed
+    through the item attribute getters or item mappers.
+    """
+    uids: Set[str] = set()
+    _ITEM_UID_RECORDERS.append(uids)
+    try:
+        yield uids
+    finally:
+        _ITEM_UID_RECORDERS.pop()
+
+
+def _record_item_uid(uid: str) -> None:
+    for uids in _ITEM_UID_RECORDERS:
+        uids.add(uid)
+
+
 def data_digest(data: Any) -> str:
     """ Returns a digest of the data. """
     state = hashlib.sha256()
@@ -187,6 +211,7 @@ class Item:
     def __init__(self, item_cache: "ItemCache", uid: str, data: Any):
         self._cache = item_cache
         self._uid = uid
+        self._dir = os.path.dirname(uid)
         self._data = data
         self._links_to_parents: List[Link] = []
         self._links_to_children: List[Link] = []
@@ -205,9 +230,13 @@ class Item:
         return hash(self._uid)
 
     def __contains__(self, key: str) -> bool:
+        if _ITEM_UID_RECORDERS:
+            _record_item_uid(self._uid)
         return key in self._data
 
     def __getitem__(self, key: str) -> Any:
+        if _ITEM_UID_RECORDERS:
+            _record_item_uid(self._uid)
         return self._data[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
@@ -228,6 +257,8 @@ class Item:
         Gets the attribute value if the attribute exists, otherwise the
         specified default value is returned.
         """
+        if _ITEM_UID_RECORDERS:
+            _record_item_uid(self._uid)
         return self._data.get(key, default)
 
     def get_by_normalized_key_path(self, normalized_key_path: str,
@@ -276,10 +307,7 @@ class Item:
         """
         if abs_or_rel_uid == ".":
             return self._uid
-        if os.path.isabs(abs_or_rel_uid):
-            return abs_or_rel_uid
-        return os.path.normpath(
-            os.path.join(os.path.dirname(self.uid), abs_or_rel_uid))
+        return self._cache.resolve_uid(self._dir, abs_or_rel_uid)
 
     def map(self, abs_or_rel_uid: str) -> "Item":
         """
@@ -378,7 +406,9 @@ class Item:
         """ Initializes the list of links to parents of this items. """
         for data in self._data["links"]:
             try:
-                link = Link(item_cache[self.to_abs_uid(data["uid"])], data)
+                link = Link(
+                    item_cache[item_cache.resolve_uid(self._dir, data["uid"])],
+                    data)
                 self._links_to_parents.append(link)
             except KeyError as err:
                 msg = (f"item '{self.uid}' links "
@@ -405,6 +435,8 @@ class Item:
     @property
     def data(self) -> Any:
         """ The item data. """
+        if _ITEM_UID_RECORDERS:
+            _record_item_uid(self._uid)
         return self._data
 
     @property
@@ -586,6 +618,8 @@ class ItemMapper:
             msg = (f"cannot get value for '{key_path}' of {item.spec} "
                    f"specified by '{identifier}'")
             raise ValueError(msg) from err
+        if _ITEM_UID_RECORDERS:
+            _record_item_uid(item.uid)
         return item, key_path, value
 
     def __getitem__(self, identifier):
@@ -661,16 +695,30 @@ def _load_json_data(path: str, uid: str) -> Any:
 
 
 class ItemCache:
-    """ This class provides a cache of specification items. """
+    """
+    This class provides a cache of specification items.
+
+    If a set of UIDs is specified, then only the items with these UIDs are
+    loaded.  The links of the loaded items shall only refer to loaded items.
+    """
+
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self,
                  config: Any,
-                 post_process_load: Optional[Callable[[ItemMap],
-                                                      None]] = None):
+                 post_process_load: Optional[Callable[[ItemMap], None]] = None,
+                 uids: Optional[Set[str]] = None):
         self._items: ItemMap = {}
+        self._uids = uids
+        self._uid_directories = None if uids is None else set(
+            os.path.dirname(uid) for uid in uids)
+        self._cache_file_mtimes: Dict[str, float] = {}
+        self._derived_data: Dict[str, Any] = {}
+        self._resolved_uids: Dict[Tuple[str, str], str] = {}
         self._types: Set[str] = set()
         self.items_by_type: Dict[str, List[Item]] = {}
         self._updates = 0
+        self._cache_directory: Optional[str] = None
         self._load_items(config)
         if post_process_load:
             post_process_load(self._items)
@@ -687,6 +735,25 @@ class ItemCache:
     def __getitem__(self, uid: str) -> Item:
         return self._items[uid]
 
+    def resolve_uid(self, directory: str, abs_or_rel_uid: str) -> str:
+        """
+        Returns the absolute UID of an absolute UID or an UID relative to the
+        directory.
+
+        The results are cached since many items share the same relative links.
+        """
+        key = (directory, abs_or_rel_uid)
+        try:
+            return self._resolved_uids[key]
+        except KeyError:
+            if os.path.isabs(abs_or_rel_uid):
+                abs_uid = abs_or_rel_uid
+            else:
+                abs_uid = os.path.normpath(
+                    os.path.join(directory, abs_or_rel_uid))
+            self._resolved_uids[key] = abs_uid
+            return abs_uid
+
     @property
     def updates(self) -> bool:
         """
@@ -695,6 +762,26 @@ class ItemCache:
         """
         return self._updates > 0
 
+    @property
+    def cache_state(self) -> str:
+        """
+        Returns a digest of the paths and modification times of the persistent
+        cache files.
+
+        The state changes if items are added, modified, or removed.
+        """
+        return data_digest(
+            [[path, mtime]
+             for path, mtime in sorted(self._cache_file_mtimes.items())])
+
+    @property
+    def cache_directory(self) -> Optional[str]:
+        """
+        Returns the cache directory if the items are loaded from a persistent
+        cache, otherwise None.
+        """
+        return self._cache_directory
+
     @property
     def all(self) -> ItemMap:
         """ Returns the map of all specification items. """
@@ -705,6 +792,23 @@ class ItemCache:
         """ Returns the types of the items. """
         return self._types
 
+    def get_derived_data(self, key: str, create: Callable[["ItemCache"],
+                                                          Any]) -> Any:
+        """
+        Returns the data derived from the items associated with the key.
+
+        If no data is associated with the key, then the data is created by the
+        create function and associated with the key.  The associations are
+        removed if a volatile item is added.  The derived data shall not be
+        modified by the caller.
+        """
+        try:
+            return self._derived_data[key]
+        except KeyError:
+            data = create(self)
+            self._derived_data[key] = data
+            return data
+
     def add_volatile_item(self, uid: str, data: Any) -> Item:
         """
         Adds an item with the specified data to the cache and returns it.
@@ -715,6 +819,7 @@ class ItemCache:
         item.init_parents(self)
         item.init_children()
         self._set_type(item)
+        self._derived_data.clear()
         return item
 
     def add_volatile_item_from_file(self, uid: str, path: str) -> Item:
@@ -741,14 +846,16 @@ class ItemCache:
                     uid = "/" + os.path.relpath(path2, base).replace(
                         ".yml", "")
                     data_by_uid[uid] = _load_yaml_data(path2, uid)
-            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
-            with open(cache_file, "wb") as out:
+            with open_atomically(cache_file, "wb") as out:
                 pickle.dump(data_by_uid, out)
-        else:
+        elif self._uid_directories is None or os.path.normpath(
+                "/" + os.path.relpath(path, base)) in self._uid_directories:
             with open(cache_file, "rb") as pickle_src:
                 data_by_uid = pickle.load(pickle_src)
+        self._cache_file_mtimes[cache_file] = os.path.getmtime(cache_file)
         for uid, data in iter(data_by_uid.items()):
-            self._add_item(uid, data)
+            if self._uids is None or uid in self._uids:
+                self._add_item(uid, data)
 
     def _load_items_recursive(self, index: str, base: str, path: str,
                               cache_dir: str) -> None:
@@ -773,6 +880,8 @@ class ItemCache:
 
     def _load_items(self, config: Any):
         cache_dir = os.path.abspath(config["cache-directory"])
+        if config["paths"]:
+            self._cache_directory = cache_dir
         for index, path in enumerate(config["paths"]):
             self._load_items_recursive(str(index), path, path, cache_dir)
 
@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module provides output sinks used by the generators to write files.
+"""
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from contextlib import contextmanager
+import os
+import secrets
+import stat
+from typing import Any, Callable, IO, Iterable, Iterator, List, Optional, \
+    Tuple
+
+Chunks = Callable[[], Iterable[str]]
+
+
+class OutputSink:
+    """ Collects the outputs in memory. """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.outputs: List[Tuple[str, str]] = []
+
+    def write(self, path: str, text: str) -> None:
+        """ Writes the text to the file specified by the path. """
+        self.outputs.append((path, text))
+
+    def write_chunks(self, path: str, chunks: Chunks) -> None:
+        """
+        Writes the text made of the chunks to the file specified by the path.
+
+        The chunks function returns the chunks of the text.  It may be called
+        more than once and shall return the same chunks for each call.
+        """
+        self.write(path, "".join(chunks()))
+
+
+def _create_temporary_file(directory: str, name: str) -> Tuple[int, str]:
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}")
+        try:
+            # The mode of the new file is subject to the umask of the process
+            return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                           0o666), temp_path
+        except FileExistsError:
+            pass
+
+
+def _is_unchanged(path: str, chunks: Iterable[str]) -> bool:
+    try:
+        with open(path, "r", encoding="utf-8") as src:
+            for chunk in chunks:
+                if src.read(len(chunk)) != chunk:
+                    return False
+            return not src.read(1)
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+@contextmanager
+def open_atomically(path: str, mode: str = "w") -> Iterator[IO[Any]]:
+    """
+    Opens a context with a new file which replaces the file specified by the
+    path at the end of the context.
+
+    The new file is a temporary file in the directory of the path.  It is
+    opened in the mode, which is either "w" for UTF-8 text or "wb" for bytes.
+    If the context is left through an exception, then the temporary file is
+    removed and the file specified by the path is left untouched.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, temp_path = _create_temporary_file(directory or ".",
+                                           os.path.basename(path))
+    try:
+        with os.fdopen(fd, mode,
+                       encoding=None if "b" in mode else "utf-8") as out:
+            yield out
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _write_atomically(path: str, chunks: Iterable[str]) -> None:
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = None
+    with open_atomically(path) as out:
+        for chunk in chunks:
+            out.write(chunk)
+        if mode is not None:
+            os.fchmod(out.fileno(), mode)
+
+
+class FileOutputSink(OutputSink):
+    """
+    Writes the outputs to files if the file content changed.
+
+    A file is replaced atomically by a new file with the changed content.
+    Files with unchanged content are left untouched, so that their
+    modification time is preserved.  In dry run mode, the changed outputs are
+    collected in memory and no files are written.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, dry_run: bool = False) -> None:
+        super().__init__()
+        self.dry_run = dry_run
+        self.changed = 0
+        self.unchanged = 0
+
+    def write(self, path: str, text: str) -> None:
+        self.write_chunks(path, lambda: [text])
+
+    def write_chunks(self, path: str, chunks: Chunks) -> None:
+        # The existing file is compared with the chunks, so that the text does
+        # not need to be in memory at once
+        if _is_unchanged(path, chunks()):
+            self.unchanged += 1
+        else:
+            self.changed += 1
+            if self.dry_run:
+                super().write(path, "".join(chunks()))
+            else:
+                _write_atomically(path, chunks())
+
+
+_OUTPUT_SINKS: List[OutputSink] = [FileOutputSink()]
+
+
+@contextmanager
+def output_sink(sink: OutputSink) -> Iterator[OutputSink]:
+    """ Opens a context in which the outputs are written to the sink. """
+    _OUTPUT_SINKS.append(sink)
+    try:
+        yield sink
+    finally:
+        _OUTPUT_SINKS.pop()
+
+
+def write_output(path: str, text: str) -> None:
+    """
+    Writes the text to the file specified by the path using the active output
+    sink.
+    """
+    _OUTPUT_SINKS[-1].write(path, text)
+
+
+def write_output_chunks(path: str, chunks: Chunks) -> None:
+    """
+    Writes the text made of the chunks to the file specified by the path using
+    the active output sink, see OutputSink.write_chunks().
+    """
+    _OUTPUT_SINKS[-1].write_chunks(path, chunks)
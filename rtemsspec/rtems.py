@@ -24,7 +24,8 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Any
+import itertools
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple
 
 from rtemsspec.items import create_unique_link, Item, ItemCache
 
@@ -56,3 +57,226 @@ def augment_with_test_links(item_cache: ItemCache) -> None:
                     _add_link(item_cache, item, link)
             for link in actions["links"]:
                 _add_link(item_cache, item, link)
+
+
+# The roles of links to the children of items in the specification tree
+CHILD_ROLES = [
+    "requirement-refinement", "interface-ingroup", "interface-ingroup-hidden",
+    "interface-function", "glossary-member", "test-case"
+]
+
+# The roles of links to the parents of items in the specification tree
+PARENT_ROLES = ["function-implementation", "interface-enumerator"]
+
+_VALIDATION_CHILD_ROLES = CHILD_ROLES + ["validation"]
+
+_VALIDATION_LEAF = set([
+    "constraint",
+    "glossary/group",
+    "glossary/term",
+    "interface/appl-config-group",
+    "interface/container",
+    "interface/domain",
+    "interface/enum",
+    "interface/enumerator",
+    "interface/forward-declaration",
+    "interface/header-file",
+    "interface/register-block",
+    "interface/struct",
+    "interface/typedef",
+    "interface/union",
+    "interface/unspecified-define",
+    "interface/unspecified-define-or-object",
+    "interface/unspecified-enum",
+    "interface/unspecified-enumerator",
+    "interface/unspecified-function",
+    "interface/unspecified-group",
+    "interface/unspecified-macro",
+    "interface/unspecified-macro-or-function",
+    "interface/unspecified-object",
+    "interface/unspecified-struct",
+    "interface/unspecified-typedef",
+    "interface/unspecified-union",
+    "memory-benchmark",
+    "requirement/functional/action",
+    "requirement/non-functional/performance-runtime",
+    "runtime-measurement-test",
+    "test-case",
+    "validation/by-analysis",
+    "validation/by-inspection",
+    "validation/by-review-of-design",
+])
+
+_ValidationFrame = Tuple[Item, List[Item], Iterator[Item]]
+
+
+def _push_validation_frame(stack: List[_ValidationFrame], on_stack: Set[str],
+                           item: Item, enabled: List[str]) -> None:
+    dependencies = [
+        link.item for link in itertools.chain(
+            item.links_to_children(_VALIDATION_CHILD_ROLES),
+            item.links_to_parents(PARENT_ROLES))
+        if link.item.is_enabled(enabled)
+    ]
+    stack.append((item, dependencies, iter(dependencies)))
+    on_stack.add(item.uid)
+
+
+def get_validation_status(root: Item, enabled: List[str]) -> Dict[str, bool]:
+    """
+    Gets the validation status of the root item and the enabled items it
+    depends on.
+
+    An item depends on its refinements, group members, validations, and test
+    cases, and on the items implementing it.  An item without enabled
+    dependencies is validated, if it is not pre-qualified or if it is of a
+    type which needs no validation.  Otherwise, it is validated if all its
+    dependencies are validated.  The status of each item is evaluated once.
+    A dependency which closes a cycle is considered to be validated.
+
+    Returns a dictionary which maps the UIDs of the evaluated items to their
+    validation status.
+    """
+    status: Dict[str, bool] = {}
+    on_stack: Set[str] = set()
+    stack: List[_ValidationFrame] = []
+    _push_validation_frame(stack, on_stack, root, enabled)
+    while stack:
+        item, dependencies, pending = stack[-1]
+        for dependency in pending:
+            if dependency.uid not in status and dependency.uid not in on_stack:
+                _push_validation_frame(stack, on_stack, dependency, enabled)
+                break
+        else:
+            stack.pop()
+            on_stack.remove(item.uid)
+            if dependencies:
+                status[item.uid] = all(
+                    status.get(dependency.uid, True)
+                    for dependency in dependencies)
+            else:
+                status[item.uid] = not is_pre_qualified(
+                    item) or item.type in _VALIDATION_LEAF
+    return status
+
+
+# An edge of a closure consists of the item at the end of the edge, a flag
+# indicating if the item is a member of the closure, and a flag indicating if
+# the members of the closure of the item are members of the closure.
+_ClosureEdge = Tuple[Item, bool, bool]
+
+
+class _Closure:
+    """
+    Computes the closures of items along edges with the strongly connected
+    components algorithm of Tarjan, so that each closure is computed once and
+    cycles are handled.  The members of a strongly connected component share
+    their closure, except that an item is not a member of its own closure.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, get_edges: Callable[[Item], Iterable[_ClosureEdge]]):
+        self._get_edges = get_edges
+        self._closures: Dict[Item, Dict[Item, None]] = {}
+        self._partial: Dict[Item, Dict[Item, None]] = {}
+        self._index: Dict[Item, int] = {}
+        self._low: Dict[Item, int] = {}
+        self._stack: List[Item] = []
+
+    def get(self, item: Item) -> Dict[Item, None]:
+        """
+        Returns the closure of the item as a dictionary with the members as
+        keys in the order of the edges.
+        """
+        if item not in self._closures:
+            self._visit(item)
+        return self._closures[item]
+
+    def _visit(self, item: Item) -> None:
+        index = len(self._index)
+        self._index[item] = index
+        self._low[item] = index
+        self._stack.append(item)
+        closure: Dict[Item, None] = {}
+        for other, is_member, follow in self._get_edges(item):
+            if is_member:
+                closure[other] = None
+            if not follow:
+                continue
+            if other not in self._index:
+                self._visit(other)
+            if other in self._closures:
+                closure.update(self._closures[other])
+            else:
+                # The other item is in the strongly connected component of
+                # this item
+                self._low[item] = min(self._low[item], self._low[other])
+        self._partial[item] = closure
+        if self._low[item] == index:
+            component: List[Item] = []
+            while not component or component[-1] != item:
+                component.append(self._stack.pop())
+            shared: Dict[Item, None] = {}
+            for member in reversed(component):
+                shared.update(self._partial.pop(member))
+            for member in component:
+                member_closure = dict(shared)
+                member_closure.pop(member, None)
+                self._closures[member] = member_closure
+
+
+_REFINEMENTS = ["interface-function", "requirement-refinement"]
+
+_DESIGN_GROUPS = ["requirement/non-functional/design-group", "interface/group"]
+
+
+def _get_refinement_edges(item: Item) -> Iterator[_ClosureEdge]:
+    for parent in item.parents(_REFINEMENTS):
+        yield parent, True, True
+
+
+def _get_design_component_edges(item: Item) -> Iterator[_ClosureEdge]:
+    for parent in item.parents("interface-function"):
+        yield parent, True, False
+    for parent in item.parents("requirement-refinement"):
+        if parent.type in _DESIGN_GROUPS:
+            yield parent, True, False
+        elif parent.type.startswith("requirement"):
+            yield parent, False, True
+
+
+def get_design_components(item_cache: ItemCache,
+                          enabled: List[str]) -> Dict[str, List[str]]:
+    """
+    Gets the design components of the enabled design groups and requirements.
+
+    The design components of a requirement are the interface functions it
+    refines and the design groups and interface groups it is a refinement of,
+    directly or through other requirements.  Only the most refined design
+    components are returned, components refined by another component of the
+    requirement are omitted.  A design group is its own design component.
+
+    Returns a dictionary which maps the UIDs of the items to the UIDs of their
+    design components.
+    """
+    ancestors = _Closure(_get_refinement_edges)
+    components = _Closure(_get_design_component_edges)
+    design_components: Dict[str, List[str]] = {}
+    for item in item_cache.all.values():
+        if not item.is_enabled(enabled):
+            continue
+        if item.type in _DESIGN_GROUPS:
+            design_components[item.uid] = [item.uid]
+            continue
+        if not item.type.startswith("requirement"):
+            continue
+        item_components = components.get(item)
+        refined: Set[Item] = set()
+        for component in item_components:
+            refined.update(ancestors.get(component))
+        design_components[item.uid] = [
+            component.uid for component in item_components
+            if component not in refined
+        ]
+    return design_components
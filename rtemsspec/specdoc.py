@@ -24,12 +24,16 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import os
 import re
 from typing import Any, Dict, Iterator, List, Optional, Pattern, Set, Tuple
 
+from rtemsspec.incremental import record_output, run_unit
 from rtemsspec.sphinxcontent import get_reference, get_label, \
     SphinxContent, SphinxMapper
-from rtemsspec.items import Item, ItemCache, ItemGetValueContext
+from rtemsspec.items import data_digest, Item, ItemCache, \
+    ItemGetValueContext
+from rtemsspec.outputsink import open_atomically, write_output
 from rtemsspec.specverify import NAME
 
 _DocumenterMap = Dict[str, "_Documenter"]
@@ -265,6 +269,7 @@ class _Documenter:
         self._item = item
         self._documenter_map = documenter_map
         self.used_by: Set[str] = set()
+        self._refinements: Dict[Pattern[Any], List[_Documenter]] = {}
         self._label_prefix = config["label-prefix"]
         self._mapper = SphinxMapper(item)
         self._mapper.add_get_value("spec:/spec-name",
@@ -321,11 +326,15 @@ class _Documenter:
 
     def refinements(self, ignore: Pattern[Any]) -> Iterator["_Documenter"]:
         """ Yields the refinements of this type. """
-        refinement_set = set(
-            self._documenter_map[child["spec-type"]]
-            for child in self._item.children("spec-refinement")
-            if ignore.search(child["spec-type"]) is None)
-        yield from sorted(refinement_set, key=lambda x: x.section)
+        refinements = self._refinements.get(ignore, None)
+        if refinements is None:
+            refinement_set = set(
+                self._documenter_map[child["spec-type"]]
+                for child in self._item.children("spec-refinement")
+                if ignore.search(child["spec-type"]) is None)
+            refinements = sorted(refinement_set, key=lambda x: x.section)
+            self._refinements[ignore] = refinements
+        yield from refinements
 
     def refines(self) -> Iterator[Tuple["_Documenter", str, str]]:
         """ Yields the types refined by type. """
@@ -533,13 +542,7 @@ def _create_str_documenter(item_cache: ItemCache, name: str, description: str,
             }), documenter_map, config)
 
 
-def document(config: dict, item_cache: ItemCache) -> None:
-    """
-    Documents specification items according to the configuration.
-
-    :param config: A dictionary with configuration entries.
-    :param item_cache: The specification item cache.
-    """
+def _get_content(config: dict, item_cache: ItemCache) -> SphinxContent:
     documenter_map: _DocumenterMap = {}
     root_item = item_cache[config["root-type"]]
     _create_str_documenter(
@@ -572,4 +575,50 @@ def document(config: dict, item_cache: ItemCache) -> None:
             for documenter in sorted(documenters, key=lambda x: x.section):
                 documenter.document(content, ignore)
     content.add_licence_and_copyrights()
-    content.write(config["doc-target"])
+    return content
+
+
+def _get_spec_digest(item_cache: ItemCache) -> str:
+    return data_digest([[item.uid, item.digest] for item in sorted(
+        item for item in item_cache.all.values() if item.type == "spec")])
+
+
+def _document(config: dict, item_cache: ItemCache) -> None:
+    target = config["doc-target"]
+    cache_directory = item_cache.cache_directory
+    if cache_directory is None:
+        _get_content(config, item_cache).write(target)
+        return
+    directory = os.path.join(cache_directory, "specdoc")
+    name = f"{data_digest([config, _get_spec_digest(item_cache)])}.rst"
+    cache_file = os.path.join(directory, name)
+    try:
+        with open(cache_file, "r", encoding="utf-8") as src:
+            text = src.read()
+    except OSError:
+        text = str(_get_content(config, item_cache))
+        with open_atomically(cache_file) as out:
+            out.write(text)
+        for other_name in os.listdir(directory):
+            if other_name != name:
+                os.remove(os.path.join(directory, other_name))
+    write_output(target, text)
+    record_output(target, text)
+
+
+def document(config: dict, item_cache: ItemCache) -> None:
+    """
+    Documents specification items according to the configuration.
+
+    The documentation depends only on the specification type items.  If a
+    dependency tracker is active, then the documentation is not generated if
+    the digest of the specification type items and the output did not change.
+    If the item cache has a cache directory, then the documentation is kept in
+    the cache directory and is only rendered again if the configuration or the
+    specification type items changed.
+
+    :param config: A dictionary with configuration entries.
+    :param item_cache: The specification item cache.
+    """
+    run_unit("specdoc", config, lambda: _document(config, item_cache),
+             lambda: _get_spec_digest(item_cache))
@@ -27,7 +27,9 @@
 from contextlib import contextmanager
 import logging
 import re
-from typing import Any, Dict, Iterator, List, NamedTuple, Set
+import time
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, \
+    Optional, Set
 
 from rtemsspec.items import Item, ItemCache
 
@@ -43,16 +45,31 @@ class VerifyStatus(NamedTuple):
     debug: int
 
 
-class _Filter(logging.Filter):
+class Diagnostic(NamedTuple):
+    """ This tuple provides a verify diagnostic. """
+    severity: int
+    uid: str
+    path: str
+    message: str
 
-    def __init__(self):
-        super().__init__()
+
+class Diagnostics:
+    """
+    Collects the diagnostics of a specification item verification.
+
+    The severity of a diagnostic is a logging level.  Trace diagnostics which
+    report each verified node are only produced if tracing is enabled.
+    """
+
+    def __init__(self, trace: bool = False):
+        self.trace = trace
+        self.diagnostics: List[Diagnostic] = []
         self._counts: Dict[int, int] = {}
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        count = self._counts.get(record.levelno, 0)
-        self._counts[record.levelno] = count + 1
-        return True
+    def add(self, severity: int, uid: str, path: str, message: str) -> None:
+        """ Adds a diagnostic. """
+        self._counts[severity] = self._counts.get(severity, 0) + 1
+        self.diagnostics.append(Diagnostic(severity, uid, path, message))
 
     def get_verify_info(self) -> VerifyStatus:
         """ Returns the gathered verify information. """
@@ -63,6 +80,36 @@ class _Filter(logging.Filter):
                             self._counts.get(logging.DEBUG, 0))
 
 
+def _format_location(uid: str, path: str) -> str:
+    if path:
+        return f"{uid}:{path}:"
+    return f"{uid}:"
+
+
+class LoggingDiagnostics(Diagnostics):
+    """
+    Reports the diagnostics of a specification item verification through the
+    logging module.
+
+    Tracing is enabled if the root logger is enabled for the info level.  The
+    diagnostics are counted but not stored.  Only the diagnostics for which the
+    root logger is enabled are counted.
+    """
+
+    def __init__(self):
+        super().__init__(logging.getLogger().isEnabledFor(logging.INFO))
+
+    def add(self, severity: int, uid: str, path: str, message: str) -> None:
+        if not logging.getLogger().isEnabledFor(severity):
+            return
+        self._counts[severity] = self._counts.get(severity, 0) + 1
+        if uid:
+            logging.log(severity, "%s %s", _format_location(uid, path),
+                        message)
+        else:
+            logging.log(severity, "%s", message)
+
+
 def _type_name(value: Any):
     type_name = type(value).__name__
     if type_name == "NoneType":
@@ -73,6 +120,121 @@ def _type_name(value: Any):
 class _Path(NamedTuple):
     item: Item
     path: str
+    diagnostics: Diagnostics
+
+
+def _report(path: _Path, severity: int, message: str) -> None:
+    path.diagnostics.add(severity, path.item.uid, path.path, message)
+
+
+class ProfileCounter:
+    """ Counts the visits and the time spent in verification nodes. """
+
+    # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.visits = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ Returns the counter as a dictionary. """
+        return {
+            "visits": self.visits,
+            "total-time": self.total_time,
+            "self-time": self.self_time
+        }
+
+
+_INDEX = re.compile(r"\[[0-9]+\]")
+
+
+def _add_to_counter(counters: Dict[str, ProfileCounter], key: str,
+                    elapsed: float, self_time: float, visit: bool) -> None:
+    counter = counters.setdefault(key, ProfileCounter())
+    if visit:
+        counter.visits += 1
+        counter.total_time += elapsed
+    counter.self_time += self_time
+
+
+class VerifyProfile:
+    """
+    Records the time and the visit counts of a specification item verification
+    by verifier type name and by attribute path.
+
+    The attribute path consists of the item type and the key path of the
+    attribute with the list indices removed, for example
+    ``requirement/functional/action:/transition-map``.  The total time of a
+    node includes the time of the nested nodes, the self time excludes it.
+    Subtype verifications of an attribute are not counted as separate visits
+    of the attribute path.
+    """
+
+    def __init__(self):
+        self.by_type: Dict[str, ProfileCounter] = {}
+        self.by_attribute: Dict[str, ProfileCounter] = {}
+        self._stack: List[List[Any]] = []
+
+    def wrap(self, type_name: str,
+             verify_method: Callable[[_Path, Any], Set[str]]) -> Callable:
+        """ Returns a verify method which records the profile of the node. """
+
+        def _verify(path: _Path, value: Any) -> Set[str]:
+            # Subtype verifiers are nested in their parent type verifier with
+            # the same path.  Count the visits and the total time of an
+            # attribute path only for the outermost node.
+            outermost = not self._stack or self._stack[-1][1] is not path
+            self._stack.append([0.0, path])
+            start = time.perf_counter()
+            try:
+                return verify_method(path, value)
+            finally:
+                elapsed = time.perf_counter() - start
+                self_time = elapsed - self._stack.pop()[0]
+                if self._stack:
+                    self._stack[-1][0] += elapsed
+                _add_to_counter(self.by_type, type_name, elapsed, self_time,
+                                True)
+                _add_to_counter(
+                    self.by_attribute,
+                    f"{path.item.type}:{_INDEX.sub('', path.path)}", elapsed,
+                    self_time, outermost)
+
+        return _verify
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ Returns the profile as a dictionary suitable for JSON. """
+        return {
+            "by-type": {
+                key: counter.to_dict()
+                for key, counter in sorted(self.by_type.items())
+            },
+            "by-attribute": {
+                key: counter.to_dict()
+                for key, counter in sorted(self.by_attribute.items())
+            }
+        }
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """
+        Returns a report of the entries ranked by self time.
+
+        The optional limit restricts the number of entries in each section.
+        """
+        lines: List[str] = []
+        for title, counters in (("verifier type", self.by_type),
+                                ("attribute path", self.by_attribute)):
+            ranked = sorted(counters.items(),
+                            key=lambda kv: (-kv[1].self_time, kv[0]))[:limit]
+            if lines:
+                lines.append("")
+            lines.append(
+                f"{'self [s]':>10} {'total [s]':>10} {'visits':>8} {title}")
+            lines.extend(f"{counter.self_time:10.6f} "
+                         f"{counter.total_time:10.6f} "
+                         f"{counter.visits:8} {key}"
+                         for key, counter in ranked)
+        return "\n".join(lines)
 
 
 class _AssertContext(NamedTuple):
@@ -128,8 +290,7 @@ def _assert_op_uid(ctx: _AssertContext, _assert_info: Any) -> bool:
     try:
         ctx.path.item.map(ctx.value)
     except KeyError:
-        logging.warning("%s cannot resolve UID: %s", _prefix(ctx.path),
-                        ctx.value)
+        _report(ctx.path, logging.WARNING, f"cannot resolve UID: {ctx.value}")
         return False
     return True
 
@@ -207,20 +368,14 @@ def _assert_type(path: _Path, value: Any, type_expected: str) -> bool:
     type_actual = _type_name(value)
     if type_actual == type_expected:
         return True
-    logging.error("%s expected type '%s', actual type '%s'", _prefix(path),
-                  type_expected, type_actual)
+    _report(path, logging.ERROR,
+            f"expected type '{type_expected}', actual type '{type_actual}'")
     return False
 
 
 NAME = re.compile(r"^([a-z][a-z0-9-]*|SPDX-License-Identifier)$")
 
 
-def _prefix(prefix: _Path) -> str:
-    if prefix.path.endswith(":"):
-        return prefix.path
-    return prefix.path + ":"
-
-
 class _Verifier:
 
     def __init__(self, name: str, verifier_map: _VerifierMap):
@@ -230,8 +385,9 @@ class _Verifier:
         verifier_map[name] = self
 
     def verify_info(self, path: _Path) -> None:
-        """ Produces a verify logging information. """
-        logging.info("%s verify using type '%s'", _prefix(path), self._name)
+        """ Produces a verify trace diagnostic if tracing is enabled. """
+        if path.diagnostics.trace:
+            _report(path, logging.INFO, f"verify using type '{self._name}'")
 
     def verify(self, path: _Path, value: Any) -> Set[str]:
         """ Verifies a value according to the type information. """
@@ -257,7 +413,7 @@ class _NameVerifier(_Verifier):
         """ Verifies a name. """
         self.verify_info(path)
         if _assert_type(path, value, "str") and NAME.search(value) is None:
-            logging.error("%s invalid name: %s", _prefix(path), value)
+            _report(path, logging.ERROR, f"invalid name: {value}")
         return set()
 
 
@@ -270,8 +426,7 @@ class _UIDVerifier(_Verifier):
             try:
                 path.item.map(value)
             except KeyError:
-                logging.error("%s cannot resolve UID: %s", _prefix(path),
-                              value)
+                _report(path, logging.ERROR, f"cannot resolve UID: {value}")
         return set()
 
 
@@ -290,18 +445,19 @@ class _ItemVerifier(_Verifier):
         if type_info and "assert" in type_info:
             expected = type_info["assert"]
             if expected != value:
-                logging.error("%s expected %r, actual %r", _prefix(path),
-                              expected, value)
+                _report(path, logging.ERROR,
+                        f"expected {expected!r}, actual {value!r}")
         return set()
 
     def _verify_key(self, path: _Path, value: Any, type_name: str,
                     key: str) -> None:
         if type_name in self._verifier_map:
             self._verifier_map[type_name].verify(
-                _Path(path.item, path.path + f"/{key}"), value[key])
+                _Path(path.item, f"{path.path}/{key}", path.diagnostics),
+                value[key])
         else:
-            logging.error("%s unknown specification type: %s", _prefix(path),
-                          type_name)
+            _report(path, logging.ERROR,
+                    f"unknown specification type: {type_name}")
 
     def assert_keys_no_constraints(self, path: _Path, specified_keys: Set[str],
                                    keys: List[str]) -> None:
@@ -312,31 +468,30 @@ class _ItemVerifier(_Verifier):
         """ Asserts that at least one specified key is present in the keys. """
         present_keys = specified_keys.intersection(keys)
         if len(present_keys) == 0:
-            logging.error(
-                "%s not at least one key out of %s is present for type '%s'",
-                _prefix(path), str(sorted(specified_keys)), self._name)
+            _report(
+                path, logging.ERROR,
+                f"not at least one key out of {sorted(specified_keys)} "
+                f"is present for type '{self._name}'")
 
     def assert_keys_at_most_one(self, path: _Path, specified_keys: Set[str],
                                 keys: List[str]) -> None:
         """ Asserts that at most one specified key is present in the keys. """
         present_keys = specified_keys.intersection(keys)
         if len(present_keys) > 1:
-            logging.error(
-                "%s not at most one key out of %s "
-                "is present for type '%s': %s", _prefix(path),
-                str(sorted(specified_keys)), self._name,
-                str(sorted(present_keys)))
+            _report(
+                path, logging.ERROR,
+                f"not at most one key out of {sorted(specified_keys)} "
+                f"is present for type '{self._name}': {sorted(present_keys)}")
 
     def assert_keys_exactly_one(self, path: _Path, specified_keys: Set[str],
                                 keys: List[str]) -> None:
         """ Asserts that exactly one specified key is present in the keys. """
         present_keys = specified_keys.intersection(keys)
         if len(present_keys) != 1:
-            logging.error(
-                "%s not exactly one key out of %s "
-                "is present for type '%s': %s", _prefix(path),
-                str(sorted(specified_keys)), self._name,
-                str(sorted(present_keys)))
+            _report(
+                path, logging.ERROR,
+                f"not exactly one key out of {sorted(specified_keys)} "
+                f"is present for type '{self._name}': {sorted(present_keys)}")
 
     def assert_keys_subset(self, path: _Path, specified_keys: Set[str],
                            keys: List[str]) -> None:
@@ -344,8 +499,10 @@ class _ItemVerifier(_Verifier):
         if not specified_keys.issubset(keys):
             missing_keys = specified_keys.difference(
                 specified_keys.intersection(keys))
-            logging.error("%s missing mandatory keys for type '%s': %s",
-                          _prefix(path), self._name, str(sorted(missing_keys)))
+            _report(
+                path, logging.ERROR,
+                f"missing mandatory keys for type '{self._name}': "
+                f"{sorted(missing_keys)}")
 
     def _assert_mandatory_keys(self, path: _Path, type_info: Any,
                                attr_info: Any, keys: List[str]) -> None:
@@ -383,34 +540,38 @@ class _ItemVerifier(_Verifier):
                         self._subtype_verifiers[subtype_value].verify(
                             path, value))
                 else:
-                    logging.error(
-                        "%s unknown subtype for key '%s' for type '%s': %s",
-                        _prefix(path), self._subtype_key, self._name,
-                        subtype_value)
+                    _report(
+                        path, logging.ERROR,
+                        f"unknown subtype for key '{self._subtype_key}' "
+                        f"for type '{self._name}': {subtype_value}")
             else:
-                logging.error("%s subtype key '%s' not present for type '%s'",
-                              _prefix(path), self._subtype_key, self._name)
+                _report(
+                    path, logging.ERROR,
+                    f"subtype key '{self._subtype_key}' not present "
+                    f"for type '{self._name}'")
         if not self.is_subtype:
             unverified_keys = set(keys).difference(verified_keys)
             if unverified_keys:
-                logging.error(
-                    "%s has unverfied keys for type '%s' and its subtypes: %s",
-                    _prefix(path), self._name, str(sorted(unverified_keys)))
+                _report(
+                    path, logging.ERROR,
+                    f"has unverfied keys for type '{self._name}' and its "
+                    f"subtypes: {sorted(unverified_keys)}")
         return verified_keys
 
     def verify_int_or_float(self, path: _Path, value: Any,
                             type_info: Any) -> Set[str]:
         """ Verifies an integer or float value. """
         if not _assert_int_or_float(path, value, type_info):
-            logging.error("%s invalid value: %s", _prefix(path), str(value))
+            _report(path, logging.ERROR, f"invalid value: {value}")
         return set()
 
     def verify_list(self, path: _Path, value: Any, type_info: Any) -> Set[str]:
         """ Verifies a list value. """
         verifier = self._verifier_map[type_info["spec-type"]]
         for index, element in enumerate(value):
-            verifier.verify(_Path(path.item, path.path + f"[{index}]"),
-                            element)
+            verifier.verify(
+                _Path(path.item, f"{path.path}[{index}]", path.diagnostics),
+                element)
         return set()
 
     def verify_none(self, _path: _Path, _value: Any,
@@ -421,7 +582,7 @@ class _ItemVerifier(_Verifier):
     def verify_str(self, path: _Path, value: Any, type_info: Any) -> Set[str]:
         """ Verifies a string value. """
         if not _assert_str(path, value, type_info):
-            logging.error("%s invalid value: %s", _prefix(path), value)
+            _report(path, logging.ERROR, f"invalid value: {value}")
         return set()
 
     def verify(self, path: _Path, value: Any) -> Set[str]:
@@ -430,10 +591,10 @@ class _ItemVerifier(_Verifier):
         if type_name in self._info_map:
             return _VERIFY[type_name](self, path, value,
                                       self._info_map[type_name])
-        logging.error(
-            "%s expected value of types %s for type '%s', "
-            "actual type '%s'", _prefix(path), str(sorted(self._info_map)),
-            self._name, type_name)
+        _report(
+            path, logging.ERROR,
+            f"expected value of types {sorted(self._info_map)} for type "
+            f"'{self._name}', actual type '{type_name}'")
         return set()
 
     def _add_subtype_verifier(self, subtype_key: str, subtype_value: str,
@@ -487,15 +648,6 @@ def _gather_item_verifiers(item: Item, verifier_map: _VerifierMap) -> None:
             _create_verifier(link.item, verifier_map)
 
 
-@contextmanager
-def _add_filter() -> Iterator[_Filter]:
-    logger = logging.getLogger()
-    log_filter = _Filter()
-    logger.addFilter(log_filter)
-    yield log_filter
-    logger.removeFilter(log_filter)
-
-
 class SpecVerifier:
     """ Verifies items according to the specification of the specification. """
 
@@ -510,6 +662,7 @@ class SpecVerifier:
         _Verifier("int", verifier_map)
         _Verifier("none", verifier_map)
         _Verifier("str", verifier_map)
+        self._verifier_map = verifier_map
         try:
             root_item = item_cache[root_uid]
         except KeyError:
@@ -521,42 +674,91 @@ class SpecVerifier:
                 logging.info("type: %s", name)
                 verifier_map[name].resolve_type_refinements()
 
-    def verify_all(self, item_cache: ItemCache) -> VerifyStatus:
-        """ Verifies all items of the cache. """
-        with _add_filter() as log_filter:
-            if self._root_verifier is None:
-                logging.error("root type item does not exist in item cache")
-            else:
-                logging.info("start specification item verification")
+    def _verify_item(self, item: Item, diagnostics: Diagnostics) -> None:
+        assert self._root_verifier is not None
+        self._root_verifier.verify(_Path(item, "", diagnostics), item.data)
+
+    @contextmanager
+    def _profile(self, profile: Optional[VerifyProfile]) -> Iterator[None]:
+        if profile is None:
+            yield
+            return
+        for name, verifier in self._verifier_map.items():
+            setattr(verifier, "verify", profile.wrap(name, verifier.verify))
+        try:
+            yield
+        finally:
+            for verifier in self._verifier_map.values():
+                delattr(verifier, "verify")
+
+    def verify_all(self,
+                   item_cache: ItemCache,
+                   diagnostics: Optional[Diagnostics] = None,
+                   profile: Optional[VerifyProfile] = None) -> VerifyStatus:
+        """
+        Verifies all items of the cache.
+
+        If no diagnostics collector is specified, then the diagnostics are
+        reported through the logging module.  If a profile is specified, then
+        the verification time and visit counts are recorded in the profile.
+        """
+        if diagnostics is None:
+            diagnostics = LoggingDiagnostics()
+        if self._root_verifier is None:
+            diagnostics.add(logging.ERROR, "", "",
+                            "root type item does not exist in item cache")
+        else:
+            if diagnostics.trace:
+                diagnostics.add(logging.INFO, "", "",
+                                "start specification item verification")
+            with self._profile(profile):
                 for key in sorted(item_cache.all):
-                    item = item_cache[key]
-                    self._root_verifier.verify(_Path(item, f"{item.uid}:"),
-                                               item.data)
-                logging.info("finished specification item verification")
-        return log_filter.get_verify_info()
-
-    def verify(self, item: Item) -> VerifyStatus:
-        """ Verifies the item. """
-        with _add_filter() as log_filter:
-            if self._root_verifier is None:
-                logging.error("root type item does not exist in item cache")
-            else:
-                self._root_verifier.verify(_Path(item, f"{item.uid}:"),
-                                           item.data)
-        return log_filter.get_verify_info()
+                    self._verify_item(item_cache[key], diagnostics)
+            if diagnostics.trace:
+                diagnostics.add(logging.INFO, "", "",
+                                "finished specification item verification")
+        return diagnostics.get_verify_info()
+
+    def verify(self,
+               item: Item,
+               diagnostics: Optional[Diagnostics] = None) -> VerifyStatus:
+        """
+        Verifies the item.
+
+        If no diagnostics collector is specified, then the diagnostics are
+        reported through the logging module.
+        """
+        if diagnostics is None:
+            diagnostics = LoggingDiagnostics()
+        if self._root_verifier is None:
+            diagnostics.add(logging.ERROR, "", "",
+                            "root type item does not exist in item cache")
+        else:
+            self._verify_item(item, diagnostics)
+        return diagnostics.get_verify_info()
 
 
-def verify(config: dict, item_cache: ItemCache) -> VerifyStatus:
+def verify(config: dict,
+           item_cache: ItemCache,
+           diagnostics: Optional[Diagnostics] = None,
+           profile: Optional[VerifyProfile] = None) -> VerifyStatus:
     """
     Verifies specification items according to the configuration.
 
     :param config: A dictionary with configuration entries.
     :param item_cache: The specification item cache.
+    :param diagnostics: The optional diagnostics collector.  If it is not
+                        specified, then the diagnostics are reported through
+                        the logging module.
+    :param profile: The optional verification profile.
     """
+    if diagnostics is None:
+        diagnostics = LoggingDiagnostics()
     try:
         root_uid = config["root-type"]
     except KeyError:
-        logging.error("configuration has no root type")
-        return VerifyStatus(0, 1, 0, 0, 0)
+        diagnostics.add(logging.ERROR, "", "",
+                        "configuration has no root type")
+        return diagnostics.get_verify_info()
     verifier = SpecVerifier(item_cache, root_uid)
-    return verifier.verify_all(item_cache)
+    return verifier.verify_all(item_cache, diagnostics, profile)
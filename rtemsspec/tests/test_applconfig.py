@@ -693,3 +693,11 @@ description m
 /** @} */
 """
         assert content == src.read()
+
+    with open(g_rst, "r") as src:
+        g_rst_content = src.read()
+    applconfig_config["jobs"] = 2
+    os.remove(g_rst)
+    generate(applconfig_config, [], item_cache)
+    with open(g_rst, "r") as src:
+        assert g_rst_content == src.read()
@@ -27,8 +27,11 @@
 import os
 import pytest
 
-from rtemsspec.content import Content, enabled_by_to_exp, \
+from rtemsspec.content import CContent, Content, enabled_by_to_exp, \
     ExpressionMapper, PythonExpressionMapper
+from rtemsspec.incremental import DependencyTracker, run_unit, track
+from rtemsspec.items import EmptyItemCache
+from rtemsspec.outputsink import output_sink, OutputSink
 
 
 def test_tab():
@@ -73,6 +76,26 @@ b
 a
 b
 
+"""
+    content.append("e")
+    assert str(content) == """  c
+  d
+a
+b
+
+e
+"""
+    assert content.lines == ["  c", "  d", "a", "b", "", "e"]
+    content.lines[-1] += "f"
+    content.prepend("g")
+    content.indent_lines(1)
+    assert str(content) == """  g
+    c
+    d
+  a
+  b
+
+  ef
 """
 
 
@@ -162,6 +185,15 @@ b c
   ggggggggggggggggg hhhhhhhhhhhhhhhhhhhhhhhhh iiiiiiiiiiiiiiii
   jjjjjjjjjjjjjjjjjjj
 """
+    content = Content("BSD-2-Clause", True)
+    content.wrap(f"{78 * 'k'}l\n\nm\tn \n\n{79 * 'o'} p")
+    assert str(content) == f"""{78 * 'k'}l
+
+m       n
+
+{79 * 'o'}
+p
+"""
 
 
 def test_paste():
@@ -250,6 +282,58 @@ def test_write(tmpdir):
 """
 
 
+def test_flush(tmpdir):
+    content = CContent()
+    content.add("a")
+    content.flush()
+    assert content.lines == []
+    content.add(["b", "c"])
+    content.lines[-1] += "d"
+    content.flush()
+    content.add("e")
+    content.indent_lines(1)
+    content.prepend("f")
+    content.prepend_spdx_license_identifier()
+    text = """/* SPDX-License-Identifier: BSD-2-Clause */
+
+f
+a
+
+b
+cd
+
+  e
+"""
+    assert str(content) == text
+    assert str(content) == text
+    path = os.path.join(tmpdir, "x")
+    with output_sink(OutputSink()) as sink:
+        content.write(path)
+    assert sink.outputs == [(path, text)]
+    manifest = os.path.join(tmpdir, "manifest.json")
+    for generated in [1, 0]:
+        tracker = DependencyTracker(EmptyItemCache(), manifest)
+        with track(tracker):
+            run_unit("x", {}, lambda: content.write(path))
+        assert tracker.generated == generated
+    with open(path, "r") as src:
+        assert src.read() == text
+    content.add("g")
+    content.flush()
+    assert str(content) == """/* SPDX-License-Identifier: BSD-2-Clause */
+
+f
+a
+
+b
+cd
+
+  e
+
+g
+"""
+
+
 def to_c_exp(enabled_by):
     return enabled_by_to_exp(enabled_by, ExpressionMapper())
 
@@ -25,6 +25,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import os
+import pickle
 
 from rtemsspec.glossary import generate
 from rtemsspec.items import EmptyItemCache, ItemCache
@@ -100,3 +101,53 @@ Glossary
         Term text U.
 """
         assert content == src.read()
+
+    index_path = os.path.join(tmpdir, "index", "terms.pickle")
+    glossary_config["term-index"] = index_path
+    glossary_config["jobs"] = 2
+    os.remove(document_glossary)
+    generate(glossary_config, [], item_cache)
+    assert os.path.exists(index_path)
+    with open(document_glossary, "r") as src:
+        assert content == src.read()
+
+    glossary_config["jobs"] = 1
+    os.remove(document_glossary)
+    generate(glossary_config, [], item_cache)
+    with open(document_glossary, "r") as src:
+        assert content == src.read()
+
+    with open(os.path.join(tmpdir, "spec", "doc.rst"), "w") as out:
+        out.write(":term:`U`\n")
+    generate(glossary_config, [], item_cache)
+    with open(document_glossary, "r") as src:
+        content = """.. SPDX-License-Identifier: CC-BY-SA-4.0
+
+.. Copyright (C) 2020 embedded brains GmbH (http://www.embedded-brains.de)
+
+Glossary
+********
+
+.. glossary::
+    :sorted:
+
+    U
+        Term text U.
+"""
+        assert content == src.read()
+
+    with open(index_path, "wb") as out:
+        out.write(b"")
+    os.remove(document_glossary)
+    generate(glossary_config, [], item_cache)
+    with open(document_glossary, "r") as src:
+        assert content == src.read()
+
+    for data in [b"", b"X", pickle.dumps([])]:
+        with open(index_path, "wb") as out:
+            out.write(data)
+        os.remove(document_glossary)
+        generate(glossary_config, [], item_cache)
+        with open(document_glossary, "r") as src:
+            assert content == src.read()
+    assert os.listdir(os.path.dirname(index_path)) == ["terms.pickle"]
@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: BSD-2-Clause
+""" Unit tests for the rtemsspec.incremental module. """
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import functools
+import os
+
+from rtemsspec.glossary import generate
+from rtemsspec.incremental import DependencyTracker, run_unit, run_units, \
+    track
+from rtemsspec.items import ItemCache
+from rtemsspec.outputsink import output_sink, OutputSink, write_output
+from rtemsspec.tests.util import create_item_cache_config_and_copy_spec
+import rtemsspec.validation
+
+
+def _generate(item_cache, manifest, glossary_config):
+    tracker = DependencyTracker(item_cache, manifest)
+    with track(tracker):
+        generate(glossary_config, [], item_cache)
+    return tracker.generated, tracker.skipped
+
+
+def test_incremental(tmpdir):
+    item_cache_config = create_item_cache_config_and_copy_spec(
+        tmpdir, "spec-glossary", with_spec_types=True)
+    item_cache = ItemCache(item_cache_config)
+    manifest = os.path.join(tmpdir, "manifest", "manifest.json")
+    project_glossary = os.path.join(tmpdir, "project", "glossary.rst")
+    document_glossary = os.path.join(tmpdir, "document", "glossary.rst")
+    glossary_config = {
+        "project-groups": ["/g"],
+        "project-header":
+        "Project Glossary",
+        "project-target":
+        project_glossary,
+        "documents": [{
+            "header": "Glossary",
+            "rest-source-paths": [str(tmpdir)],
+            "target": document_glossary
+        }]
+    }
+    assert _generate(item_cache, manifest, glossary_config) == (2, 0)
+    assert _generate(item_cache, manifest, glossary_config) == (0, 2)
+
+    # Changed output
+    with open(project_glossary, "w") as out:
+        out.write("foobar")
+    assert _generate(item_cache, manifest, glossary_config) == (1, 1)
+    with open(project_glossary, "r") as src:
+        assert "foobar" not in src.read()
+
+    # Removed output
+    os.remove(document_glossary)
+    assert _generate(item_cache, manifest, glossary_config) == (1, 1)
+    assert os.path.exists(document_glossary)
+
+    # Changed document source
+    with open(os.path.join(tmpdir, "spec", "doc.rst"), "a") as out:
+        out.write(":term:`U`\n")
+    assert _generate(item_cache, manifest, glossary_config) == (1, 1)
+
+    # Changed item
+    item_cache["/glossary/v"]["text"] = "Changed text."
+    assert _generate(item_cache, manifest, glossary_config) == (2, 0)
+    with open(project_glossary, "r") as src:
+        assert "Changed text." in src.read()
+    assert _generate(item_cache, manifest, glossary_config) == (0, 2)
+
+    # Changed configuration
+    glossary_config["project-header"] = "Glossary of the Project"
+    assert _generate(item_cache, manifest, glossary_config) == (1, 1)
+
+    # Outputs outside of units are not recorded
+    tracker = DependencyTracker(item_cache, manifest)
+    tracker.record_output("foo", "bar")
+    with track(tracker):
+        pass
+    assert _generate(item_cache, manifest, glossary_config) == (0, 2)
+
+    # No tracker
+    os.remove(project_glossary)
+    with track(None):
+        generate(glossary_config, [], item_cache)
+    assert os.path.exists(project_glossary)
+
+    # Invalid manifest
+    with open(manifest, "w") as out:
+        out.write("foobar")
+    assert _generate(item_cache, manifest, glossary_config) == (2, 0)
+
+
+def test_incremental_validation(tmpdir, monkeypatch):
+    item_cache_config = create_item_cache_config_and_copy_spec(
+        tmpdir, "spec-validation", with_spec_types=True)
+    item_cache = ItemCache(item_cache_config)
+    monkeypatch.chdir(tmpdir)
+    manifest = "manifest.json"
+    validation_config = {
+        "base-directory": os.path.join(tmpdir, "base"),
+        "jobs": 2
+    }
+    tracker = DependencyTracker(item_cache, manifest)
+    with track(tracker):
+        rtemsspec.validation.generate(validation_config, item_cache)
+    validation_config["jobs"] = 1
+    tracker = DependencyTracker(item_cache, manifest)
+    with track(tracker):
+        rtemsspec.validation.generate(validation_config, item_cache)
+    assert tracker.generated == 0
+    assert tracker.skipped > 0
+
+    # Changed source files of a test program
+    tc34_c = os.path.join(tmpdir, "base", "tc34.c")
+    with open(tc34_c, "r") as src:
+        assert "@ingroup RTEMSTestSuiteTs" in src.read()
+    tp_yml = os.path.join(tmpdir, "spec", "tp.yml")
+    with open(tp_yml, "r") as src:
+        tp_data = src.read()
+    with open(tp_yml, "w") as out:
+        out.write(tp_data.replace("- ts.c\n", ""))
+    item_cache = ItemCache(item_cache_config)
+    tracker = DependencyTracker(item_cache, manifest)
+    with track(tracker):
+        rtemsspec.validation.generate(validation_config, item_cache)
+    assert tracker.generated > 0
+    with open(tc34_c, "r") as src:
+        assert "@ingroup RTEMSTestSuiteTs" not in src.read()
+
+
+def test_incremental_structure(tmpdir):
+    item_cache_config = create_item_cache_config_and_copy_spec(
+        tmpdir, "spec-glossary", with_spec_types=True)
+    item_cache = ItemCache(item_cache_config)
+    manifest = os.path.join(tmpdir, "manifest.json")
+    structures = []
+    generated = []
+
+    def _structure():
+        structures.append(None)
+        return "s" if len(structures) < 3 else "t"
+
+    def _run():
+        tracker = DependencyTracker(item_cache, manifest)
+        with track(tracker):
+            run_unit("u", {}, lambda: generated.append(None), _structure)
+        return tracker.generated, tracker.skipped
+
+    # The structure digest function is only called by a tracker
+    run_unit("u", {}, lambda: generated.append(None), _structure)
+    assert len(generated) == 1
+    assert len(structures) == 0
+    assert _run() == (1, 0)
+    assert _run() == (0, 1)
+    assert _run() == (1, 0)
+    assert len(structures) == 3
+
+
+def test_run_units(tmpdir, monkeypatch):
+    item_cache = ItemCache(
+        create_item_cache_config_and_copy_spec(tmpdir,
+                                               "spec-glossary",
+                                               with_spec_types=True))
+    manifest = os.path.join(tmpdir, "manifest.json")
+    paths = [os.path.join(tmpdir, name) for name in ["a", "b"]]
+    written = []
+
+    def _generate(path):
+        # The outputs of previous units are written before the next unit runs
+        written.append([os.path.exists(path) for path in paths])
+        write_output(path, path)
+
+    units = [(path, {}, functools.partial(_generate, path)) for path in paths]
+    with output_sink(OutputSink()) as sink:
+        run_units(units)
+    assert written == [[False, False], [False, False]]
+    assert sink.outputs == [(path, path) for path in paths]
+    run_units(units)
+    assert written[2:] == [[False, False], [True, False]]
+
+    # The results of worker processes are written by the calling process
+    monkeypatch.setattr(
+        "rtemsspec.incremental.map_jobs",
+        lambda function, iterable, _jobs: list(map(function, iterable)))
+    tracker = DependencyTracker(item_cache, manifest)
+    with track(tracker), output_sink(OutputSink()) as sink:
+        run_units(units, 2)
+    assert tracker.generated == 2
+    assert sink.outputs == [(path, path) for path in paths]
+    tracker = DependencyTracker(item_cache, manifest)
+    with track(tracker):
+        run_units(units, 2)
+    assert tracker.skipped == 2
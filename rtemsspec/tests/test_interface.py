@@ -25,11 +25,16 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import os
+import random
+from types import SimpleNamespace
 import pytest
 
+from rtemsspec import interface
 from rtemsspec.interface import generate
 from rtemsspec.items import EmptyItemCache, ItemCache
+from rtemsspec.outputsink import OutputSink, output_sink
 from rtemsspec.tests.util import create_item_cache_config_and_copy_spec
+from rtemsspec.util import load_config
 
 
 def test_interface(tmpdir):
@@ -674,3 +679,102 @@ __attribute__((__const__)) static inline int VeryLongFunction(
 #endif /* _H_H */
 """
         assert content == src.read()
+
+    parallel_directory = os.path.join(tmpdir, "parallel")
+    interface_config["domains"] = {"/domain-abc": parallel_directory}
+    interface_config["jobs"] = 2
+    generate(interface_config, ItemCache(item_cache_config))
+    for path, _, names in os.walk(base_directory):
+        for name in names:
+            with open(os.path.join(path, name), "r") as src:
+                with open(
+                        os.path.join(
+                            parallel_directory,
+                            os.path.relpath(os.path.join(path, name),
+                                            base_directory)), "r") as dst:
+                    assert src.read() == dst.read()
+
+
+class _Node:
+
+    def __init__(self, uid, the_type, index):
+        self.item = SimpleNamespace(uid=uid, type=the_type)
+        self.index = index
+        self.dependents = set()
+
+    def __lt__(self, other):
+        return self.item.uid < other.item.uid
+
+
+def _is_ready_to_bubble(before, after):
+    if after in before.dependents:
+        return False
+    group = "interface/group"
+    if (before.item.type == group) ^ (after.item.type == group):
+        return after.item.type == group
+    if before.index and after.index:
+        return after.index < before.index
+    if after.index:
+        return False
+    return after < before
+
+
+def _bubble_sort(nodes):
+    node_count = len(nodes)
+    for i in range(node_count - 1):
+        for j in range(node_count - 1 - i):
+            if _is_ready_to_bubble(nodes[j], nodes[j + 1]):
+                nodes[j], nodes[j + 1] = nodes[j + 1], nodes[j]
+    return nodes
+
+
+def test_interface_node_order():
+    rng = random.Random(1)
+    for node_count in range(1, 64):
+        types = ["interface/group", "interface/function"]
+        positions = list(range(node_count))
+        rng.shuffle(positions)
+        nodes = [
+            _Node(f"/n{rng.randrange(1000):03}-{index}", rng.choice(types),
+                  ("/g", positions[index]) if rng.random() < 0.4 else None)
+            for index in range(node_count)
+        ]
+        for index, node in enumerate(nodes):
+            for _ in range(rng.randrange(3)):
+                if index > 0:
+                    nodes[rng.randrange(index)].dependents.add(node)
+        rng.shuffle(nodes)
+        expected = _bubble_sort(list(nodes))
+        assert interface._bubble_sort(list(nodes)) == expected
+
+
+def test_interface_node_order_of_spec_headers(monkeypatch):
+    # The node order of the header files generated from the specification of
+    # this repository shall be the order of the previous implementation
+    base = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    config = load_config(os.path.join(base, "config.yml"))
+    item_cache = ItemCache({
+        "cache-directory":
+        os.path.join(base, config["spec"]["cache-directory"]),
+        "paths": [
+            os.path.join(base, path)
+            for path in ["spec-spec", "spec", "spec-glossary"]
+        ],
+        "spec-type-root-uid":
+        config["spec"]["spec-type-root-uid"]
+    })
+    bubble_sort = interface._bubble_sort
+    node_counts = []
+
+    def _check_bubble_sort(nodes):
+        node_counts.append(len(nodes))
+        ordered_nodes = bubble_sort(list(nodes))
+        assert ordered_nodes == _bubble_sort(list(nodes))
+        return ordered_nodes
+
+    monkeypatch.setattr(interface, "_bubble_sort", _check_bubble_sort)
+    with output_sink(OutputSink()) as sink:
+        generate(config["interface"], item_cache)
+    assert len(node_counts) == len(sink.outputs)
+    assert len(node_counts) > 60
+    assert max(node_counts) > 50
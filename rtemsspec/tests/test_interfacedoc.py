@@ -476,3 +476,20 @@ The following constraints apply to this directive:
 * Constraint A for :ref:`InterfaceFunction`.
 """
         assert content == src.read()
+
+    parallel_directory = os.path.join(tmpdir, "parallel")
+    os.makedirs(parallel_directory)
+    for group_config in config["groups"]:
+        for key in ["introduction-target", "directives-target"]:
+            group_config[key] = os.path.join(
+                parallel_directory, os.path.basename(group_config[key]))
+    config["jobs"] = 2
+    generate(config, ItemCache(item_cache_config))
+    for path in [
+            introduction_rst, directives_rst, introduction_2_rst,
+            directives_2_rst
+    ]:
+        with open(path, "r") as src:
+            with open(os.path.join(parallel_directory, os.path.basename(path)),
+                      "r") as dst:
+                assert src.read() == dst.read()
@@ -28,7 +28,7 @@ import os
 import pytest
 
 from rtemsspec.items import EmptyItemCache, Item, ItemGetValueContext, \
-    JSONItemCache, Link
+    JSONItemCache, Link, record_item_uids
 
 
 def test_to_abs_uid():
@@ -38,6 +38,16 @@ def test_to_abs_uid():
     assert item.to_abs_uid("/z") == "/z"
     assert item.to_abs_uid("../z") == "/z"
     assert item.to_abs_uid("../../z") == "/z"
+    assert item.to_abs_uid("z") == "/x/z"
+
+
+def test_resolve_uid():
+    item_cache = EmptyItemCache()
+    assert item_cache.resolve_uid("/x", "z") == "/x/z"
+    assert item_cache.resolve_uid("/x", "z") == "/x/z"
+    assert item_cache.resolve_uid("/x", "/z") == "/z"
+    assert item_cache.resolve_uid("/x/y", "../z") == "/x/z"
+    assert item_cache.resolve_uid("", "z") == "z"
 
 
 def test_eq():
@@ -147,6 +157,23 @@ def test_get():
     assert item.get("z", "a") == "a"
 
 
+def test_record_item_uids():
+    item_cache = EmptyItemCache()
+    a = Item(item_cache, "a", {"x": "y"})
+    b = Item(item_cache, "b", {"x": "y"})
+    c = Item(item_cache, "c", {"x": "y"})
+    d = Item(item_cache, "d", {"x": "y"})
+    e = Item(item_cache, "e", {"x": "y"})
+    assert a["x"] == "y"
+    with record_item_uids() as uids:
+        assert "x" in a
+        assert b["x"] == "y"
+        assert c.get("x", "z") == "y"
+        assert d.data == {"x": "y"}
+    assert e["x"] == "y"
+    assert uids == set(["a", "b", "c", "d"])
+
+
 def test_children():
     child = Item(EmptyItemCache(), "c", {})
     parent = Item(EmptyItemCache(), "p", {})
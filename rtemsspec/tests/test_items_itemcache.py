@@ -27,7 +27,8 @@
 import os
 import pytest
 
-from rtemsspec.items import EmptyItem, ItemCache, ItemMapper, ItemTemplate
+from rtemsspec.items import EmptyItem, EmptyItemCache, ItemCache, ItemMapper, \
+    ItemTemplate
 from rtemsspec.tests.util import create_item_cache_config_and_copy_spec
 
 
@@ -50,6 +51,7 @@ def test_load(tmpdir):
     assert item_count == len(item_cache.all)
     assert item_cache.updates
     cache_dir = config["cache-directory"]
+    assert item_cache.cache_directory == os.path.abspath(cache_dir)
     assert os.path.exists(os.path.join(cache_dir, "0", "spec", "spec.pickle"))
     assert os.path.exists(
         os.path.join(cache_dir, "0", "spec", "d", "spec.pickle"))
@@ -66,6 +68,10 @@ def test_load(tmpdir):
     item_cache_2 = ItemCache(config)
     assert not item_cache_2.updates
     assert item_cache_2["/d/c"]["v"] == "c"
+    assert item_cache_2.cache_state == item_cache.cache_state
+    item_cache_partial = ItemCache(config, uids=set(["/p"]))
+    assert list(item_cache_partial.all) == ["/p"]
+    assert item_cache_partial.cache_state == item_cache.cache_state
     with open(os.path.join(tmpdir, "spec", "d", "c.yml"), "w+") as out:
         out.write("links:\n- role: null\n  uid: ../p\nv: x\n")
     item_cache_3 = ItemCache(config)
@@ -83,6 +89,22 @@ def test_load(tmpdir):
         item_cache_4["/d/c"]
 
 
+def test_get_derived_data():
+    item_cache = EmptyItemCache()
+    sizes = []
+
+    def _create(the_item_cache):
+        assert the_item_cache == item_cache
+        sizes.append(len(item_cache.all))
+        return sizes[-1]
+
+    assert item_cache.get_derived_data("size", _create) == 0
+    assert item_cache.get_derived_data("size", _create) == 0
+    item_cache.add_volatile_item("/i", {"links": []})
+    assert item_cache.get_derived_data("size", _create) == 1
+    assert sizes == [0, 1]
+
+
 def test_load_link_error(tmpdir):
     config = create_item_cache_config_and_copy_spec(tmpdir,
                                                     "spec-item-cache-2")
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: BSD-2-Clause
+""" Unit tests for the rtemsspec.outputsink module. """
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import pytest
+import secrets
+
+from rtemsspec.content import Content
+from rtemsspec.outputsink import FileOutputSink, output_sink, OutputSink, \
+    open_atomically, write_output, write_output_chunks
+
+
+def test_output_sink(tmpdir):
+    path = os.path.join(tmpdir, "a", "b.txt")
+    sink = OutputSink()
+    with output_sink(sink):
+        write_output(path, "foo")
+        content = Content("BSD-2-Clause", True)
+        content.add("bar")
+        content.write(path)
+    assert sink.outputs == [(path, "foo"), (path, "bar\n")]
+    assert not os.path.exists(path)
+
+
+def test_file_output_sink(tmpdir, monkeypatch):
+    path = os.path.join(tmpdir, "a", "b.txt")
+    sink = FileOutputSink()
+    with output_sink(sink):
+        write_output(path, "foo")
+        stat = os.stat(path)
+        write_output(path, "foo")
+        assert os.stat(path).st_ino == stat.st_ino
+        assert os.stat(path).st_mtime_ns == stat.st_mtime_ns
+        os.chmod(path, 0o640)
+        write_output(path, "bar")
+        assert os.stat(path).st_ino != stat.st_ino
+        assert os.stat(path).st_mode & 0o777 == 0o640
+        with open(path, "wb") as out:
+            out.write(b"\xff")
+        write_output(path, "bar")
+        with pytest.raises(IsADirectoryError):
+            write_output(str(tmpdir), "foo")
+    assert sink.changed == 4
+    assert sink.unchanged == 1
+    assert sink.outputs == []
+    with open(path, "r") as src:
+        assert src.read() == "bar"
+    assert sorted(os.listdir(os.path.dirname(path))) == ["b.txt"]
+    assert [name for name in os.listdir(tmpdir) if name.startswith(".")] == []
+    monkeypatch.chdir(tmpdir)
+    with output_sink(sink):
+        write_output("c.txt", "foo")
+    with open(os.path.join(tmpdir, "c.txt"), "r") as src:
+        assert src.read() == "foo"
+    umask = os.umask(0o027)
+    try:
+        with output_sink(sink):
+            write_output("d.txt", "foo")
+    finally:
+        os.umask(umask)
+    assert os.stat(os.path.join(tmpdir, "d.txt")).st_mode & 0o777 == 0o640
+    with open(os.path.join(tmpdir, ".e.txt.x"), "w") as out:
+        out.write("x")
+    names = iter(["x", "y"])
+    monkeypatch.setattr(secrets, "token_hex", lambda _: next(names))
+    with output_sink(sink):
+        write_output("e.txt", "foo")
+    with open(os.path.join(tmpdir, "e.txt"), "r") as src:
+        assert src.read() == "foo"
+    with open(os.path.join(tmpdir, ".e.txt.x"), "r") as src:
+        assert src.read() == "x"
+
+
+def test_file_output_sink_dry_run(tmpdir):
+    path = os.path.join(tmpdir, "a.txt")
+    with open(path, "w") as out:
+        out.write("foo")
+    sink = FileOutputSink(dry_run=True)
+    with output_sink(sink):
+        write_output(path, "foo")
+        write_output(path, "bar")
+    assert sink.changed == 1
+    assert sink.unchanged == 1
+    assert sink.outputs == [(path, "bar")]
+    with open(path, "r") as src:
+        assert src.read() == "foo"
+
+
+def test_output_sink_chunks(tmpdir):
+    path = os.path.join(tmpdir, "a.txt")
+    sink = OutputSink()
+    with output_sink(sink):
+        write_output_chunks(path, lambda: ["foo", "bar"])
+    assert sink.outputs == [(path, "foobar")]
+    sink = FileOutputSink()
+    with output_sink(sink):
+        write_output_chunks(path, lambda: ["foo", "bar"])
+        write_output_chunks(path, lambda: ["fo", "obar"])
+        write_output_chunks(path, lambda: ["foo", "baz"])
+        write_output_chunks(path, lambda: ["foo"])
+        write_output_chunks(path, lambda: ["foo", "", "bar"])
+    assert sink.changed == 4
+    assert sink.unchanged == 1
+    with open(path, "r") as src:
+        assert src.read() == "foobar"
+
+
+def test_open_atomically(tmpdir):
+    path = os.path.join(tmpdir, "a", "b.pickle")
+    with open_atomically(path, "wb") as out:
+        out.write(b"foo")
+    with pytest.raises(ValueError):
+        with open_atomically(path, "wb") as out:
+            out.write(b"bar")
+            raise ValueError("interrupted")
+    with open(path, "rb") as src:
+        assert src.read() == b"foo"
+    assert os.listdir(os.path.dirname(path)) == ["b.pickle"]
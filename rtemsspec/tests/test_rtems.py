@@ -26,8 +26,9 @@
 
 import pytest
 
-from rtemsspec.items import EmptyItemCache, Item
-from rtemsspec.rtems import augment_with_test_links, is_pre_qualified
+from rtemsspec.items import create_unique_link, EmptyItemCache, Item
+from rtemsspec.rtems import augment_with_test_links, \
+    get_design_components, get_validation_status, is_pre_qualified
 
 
 def test_is_pre_qualified():
@@ -62,3 +63,166 @@ def test_augment_with_test_links():
     augment_with_test_links(item_cache)
     assert item.child("validation") == test_case
     assert test_case.parent("validation") == item
+
+
+def _add_item(item_cache, uid, links, the_type="", enabled_by=True):
+    item = item_cache.add_volatile_item(uid, {
+        "enabled-by": enabled_by,
+        "links": links
+    })
+    item.data["_type"] = the_type
+    return item
+
+
+def test_get_validation_status():
+    item_cache = EmptyItemCache()
+    item_cache.add_volatile_item("/constraint/constant-not-pre-qualified",
+                                 {"links": []})
+    root = _add_item(item_cache, "/r", [])
+    refinement = {"role": "requirement-refinement", "uid": "/r"}
+    _add_item(item_cache, "/a", [refinement])
+    _add_item(item_cache, "/b", [refinement])
+    _add_item(item_cache, "/c", [refinement], enabled_by=False)
+    _add_item(item_cache, "/d", [{
+        "role": "validation",
+        "uid": "/a"
+    }, {
+        "role": "validation",
+        "uid": "/b"
+    }], "validation/by-analysis")
+    _add_item(item_cache, "/e", [refinement])
+    _add_item(item_cache, "/f", [{
+        "role": "requirement-refinement",
+        "uid": "/e"
+    }])
+    _add_item(item_cache, "/g",
+              [{
+                  "role": "constraint",
+                  "uid": "/constraint/constant-not-pre-qualified"
+              }, {
+                  "role": "requirement-refinement",
+                  "uid": "/r"
+              }])
+    assert get_validation_status(root, []) == {
+        "/a": True,
+        "/b": True,
+        "/d": True,
+        "/e": False,
+        "/f": False,
+        "/g": True,
+        "/r": False
+    }
+    assert get_validation_status(item_cache["/a"], []) == {
+        "/a": True,
+        "/d": True
+    }
+    assert get_validation_status(item_cache["/c"], []) == {"/c": False}
+
+    # Cycle
+    link = {"role": "requirement-refinement", "uid": "/i"}
+    cycle_start = _add_item(item_cache, "/h", [],
+                            "requirement/functional/action")
+    cycle_end = _add_item(item_cache, "/i", [{
+        "role": "requirement-refinement",
+        "uid": "/h"
+    }])
+    create_unique_link(cycle_start, cycle_end, link)
+    assert get_validation_status(item_cache["/h"], []) == {
+        "/h": True,
+        "/i": True
+    }
+
+
+def test_get_design_components():
+    item_cache = EmptyItemCache()
+    _add_item(item_cache, "/g", [], "interface/group")
+    _add_item(item_cache, "/g2", [], "interface/group", enabled_by=False)
+    _add_item(item_cache, "/f1", [{
+        "role": "requirement-refinement",
+        "uid": "/g"
+    }], "interface/function")
+    _add_item(item_cache, "/f2", [{
+        "role": "requirement-refinement",
+        "uid": "/f1"
+    }], "interface/function")
+    _add_item(item_cache, "/r1", [{
+        "role": "requirement-refinement",
+        "uid": "/g"
+    }, {
+        "role": "interface-function",
+        "uid": "/f1"
+    }, {
+        "role": "interface-function",
+        "uid": "/f2"
+    }], "requirement/functional/function")
+
+    # Nested requirements and duplicate components
+    _add_item(item_cache, "/r2", [{
+        "role": "interface-function",
+        "uid": "/f1"
+    }, {
+        "role": "requirement-refinement",
+        "uid": "/r1"
+    }], "requirement/functional/function")
+    _add_item(item_cache, "/r3", [{
+        "role": "requirement-refinement",
+        "uid": "/f1"
+    }], "requirement/functional/function")
+    _add_item(item_cache, "/t", [], "glossary/term")
+
+    # Cycle of refinements: y refines z, z refines y and w
+    _add_item(item_cache, "/w", [], "interface/function")
+    _add_item(item_cache, "/z", [{
+        "role": "requirement-refinement",
+        "uid": "/w"
+    }], "interface/function")
+    _add_item(item_cache, "/y", [{
+        "role": "requirement-refinement",
+        "uid": "/z"
+    }], "interface/function")
+    create_unique_link(item_cache["/z"], item_cache["/y"], {
+        "role": "requirement-refinement",
+        "uid": "/y"
+    })
+    _add_item(item_cache, "/r4", [{
+        "role": "interface-function",
+        "uid": "/z"
+    }, {
+        "role": "interface-function",
+        "uid": "/w"
+    }], "requirement/functional/function")
+    _add_item(item_cache, "/r5", [{
+        "role": "interface-function",
+        "uid": "/w"
+    }, {
+        "role": "interface-function",
+        "uid": "/y"
+    }], "requirement/functional/function")
+
+    # Cycle of requirements
+    _add_item(item_cache, "/ra", [{
+        "role": "interface-function",
+        "uid": "/f1"
+    }], "requirement/functional/function")
+    _add_item(item_cache, "/rb", [{
+        "role": "requirement-refinement",
+        "uid": "/ra"
+    }, {
+        "role": "requirement-refinement",
+        "uid": "/g"
+    }], "requirement/functional/function")
+    create_unique_link(item_cache["/ra"], item_cache["/rb"], {
+        "role": "requirement-refinement",
+        "uid": "/rb"
+    })
+
+    assert get_design_components(item_cache, []) == {
+        "/g": ["/g"],
+        "/r1": ["/f2"],
+        "/r2": ["/f2"],
+        "/r3": [],
+        "/r4": ["/z"],
+        "/r5": ["/y"],
+        "/ra": ["/f1"],
+        "/rb": ["/f1"]
+    }
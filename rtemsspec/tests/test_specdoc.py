@@ -26,12 +26,13 @@
 
 import os
 
+from rtemsspec.incremental import DependencyTracker, track
 from rtemsspec.items import ItemCache
 from rtemsspec.specdoc import document
 from rtemsspec.tests.util import create_item_cache_config_and_copy_spec
 
 
-def test_document(tmpdir):
+def test_document(tmpdir, monkeypatch):
     item_cache_config = create_item_cache_config_and_copy_spec(
         tmpdir, "spec-doc")
     item_cache_config["spec-type-root-uid"] = "/root"
@@ -322,3 +323,48 @@ The value shall be a string. The string shall be a valid absolute or relative
 item UID.
 """
         assert content == src.read()
+
+    # The documentation depends only on the specification type items
+    manifest = os.path.join(tmpdir, "manifest.json")
+
+    def _document():
+        tracker = DependencyTracker(item_cache, manifest)
+        with track(tracker):
+            document(config, item_cache)
+        return tracker.generated, tracker.skipped
+
+    assert _document() == (1, 0)
+    assert _document() == (0, 1)
+    item_cache.add_volatile_item("/x", {
+        "enabled-by": True,
+        "links": [],
+        "type": "b"
+    })
+    assert _document() == (0, 1)
+    item_cache["/a"]["spec-description"] = "Another description."
+    assert _document() == (1, 0)
+    with open(doc_target, "r") as src:
+        content = src.read()
+        assert "Another description." in content
+
+    # The documentation of previous specification versions is removed from the
+    # cache directory
+    cache_directory = os.path.join(item_cache.cache_directory, "specdoc")
+    cache_files = os.listdir(cache_directory)
+    assert len(cache_files) == 1
+    cache_file = os.path.join(cache_directory, cache_files[0])
+    with open(cache_file, "r") as src:
+        assert content == src.read()
+
+    # The documentation is not rendered again if it is in the cache directory
+    with open(cache_file, "w") as out:
+        out.write("cached")
+    document(config, item_cache)
+    with open(doc_target, "r") as src:
+        assert src.read() == "cached"
+
+    # Without a cache directory, the documentation is always rendered
+    monkeypatch.setattr(ItemCache, "cache_directory", None)
+    document(config, item_cache)
+    with open(doc_target, "r") as src:
+        assert content == src.read()
@@ -25,9 +25,11 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import pytest
 
 from rtemsspec.items import ItemCache
-from rtemsspec.specverify import SpecVerifier, verify
+from rtemsspec.specverify import Diagnostic, Diagnostics, \
+    LoggingDiagnostics, SpecVerifier, VerifyProfile, VerifyStatus, verify
 from rtemsspec.tests.util import create_item_cache_config_and_copy_spec, \
     get_and_clear_log
 
@@ -1962,3 +1964,89 @@ INFO /spec2/x:/spec-type: verify using type 'name'"""
     assert info.warning == 0
     assert info.info == 18
     assert info.debug == 0
+
+
+def test_diagnostics(caplog, tmpdir):
+    item_cache_config = create_item_cache_config_and_copy_spec(
+        tmpdir, "spec-verify")
+    item_cache = ItemCache(item_cache_config)
+    caplog.set_level(logging.INFO)
+    diagnostics = Diagnostics()
+    info = verify({}, item_cache, diagnostics)
+    assert diagnostics.diagnostics == [
+        Diagnostic(logging.ERROR, "", "", "configuration has no root type")
+    ]
+    assert info.error == 1
+    verifier = SpecVerifier(item_cache, "/spec/root")
+    get_and_clear_log(caplog)
+    diagnostics = Diagnostics()
+    info = verifier.verify_all(item_cache, diagnostics)
+    assert get_and_clear_log(caplog) == ""
+    assert info.critical == 0
+    assert info.error == 91
+    assert info.warning == 1
+    assert info.info == 0
+    assert info.debug == 0
+    assert len(diagnostics.diagnostics) == 92
+    assert diagnostics.diagnostics[0] == Diagnostic(
+        logging.ERROR, "/c1", "/links[0]",
+        "unknown subtype for key 'role' for type 'link': x")
+    assert diagnostics.diagnostics[1] == Diagnostic(
+        logging.ERROR, "/c1", "",
+        "missing mandatory keys for type 'c': ['any-dict', 'bool', 'float', "
+        "'int', 'must-be-true', 'other-int', 'str', 'str-contains']")
+    diagnostics = Diagnostics(trace=True)
+    info = verifier.verify(item_cache["/spec2/x"], diagnostics)
+    assert get_and_clear_log(caplog) == ""
+    assert info.error == 2
+    assert info.info == 18
+    assert diagnostics.diagnostics[0] == Diagnostic(
+        logging.INFO, "/spec2/x", "", "verify using type 'root'")
+    assert diagnostics.diagnostics[-1] == Diagnostic(
+        logging.INFO, "/spec2/x", "/spec-type", "verify using type 'name'")
+
+    # The logging diagnostics count only the diagnostics which are logged
+    caplog.set_level(logging.WARNING)
+    diagnostics = LoggingDiagnostics()
+    diagnostics.add(logging.INFO, "/a", "", "info")
+    diagnostics.add(logging.ERROR, "/b", "/c", "error")
+    diagnostics.add(logging.WARNING, "", "", "warning")
+    assert get_and_clear_log(caplog) == """ERROR /b:/c: error
+WARNING warning"""
+    assert diagnostics.get_verify_info() == VerifyStatus(0, 1, 1, 0, 0)
+
+
+def test_profile(tmpdir):
+    item_cache_config = create_item_cache_config_and_copy_spec(
+        tmpdir, "spec-verify")
+    item_cache = ItemCache(item_cache_config)
+    profile = VerifyProfile()
+    info = verify({"root-type": "/spec/root"}, item_cache, Diagnostics(),
+                  profile)
+    assert info.error == 91
+    assert profile.by_type["root"].visits == len(item_cache.all)
+    assert profile.by_type["link"].visits == 59
+    assert profile.by_attribute[":/links"].visits == 127
+    assert profile.by_attribute[":/links/role"].visits == 59
+    for counter in profile.by_type.values():
+        assert 0.0 <= counter.self_time <= counter.total_time
+    root = profile.by_type["root"]
+    assert sum(counter.self_time
+               for counter in profile.by_type.values()) == pytest.approx(
+                   root.total_time)
+    data = profile.to_dict()
+    assert data["by-type"]["root"] == {
+        "visits": root.visits,
+        "total-time": root.total_time,
+        "self-time": root.self_time
+    }
+    assert list(data["by-attribute"]) == sorted(profile.by_attribute)
+    report = profile.report(2).split("\n")
+    assert len(report) == 7
+    assert report[0] == "  self [s]  total [s]   visits verifier type"
+    assert report[4] == "  self [s]  total [s]   visits attribute path"
+
+    # The verify methods are restored after the profiling
+    verifier = SpecVerifier(item_cache, "/spec/root")
+    verifier.verify_all(item_cache, Diagnostics(), VerifyProfile())
+    assert "verify" not in vars(verifier._root_verifier)
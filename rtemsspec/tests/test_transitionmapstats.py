@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: BSD-2-Clause
+""" Unit tests for the rtemsspec.transitionmapstats module. """
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import copy
+import json
+
+from rtemsspec.items import ItemCache
+from rtemsspec.transitionmapstats import generate_statistics
+from rtemsspec.tests.util import create_item_cache_config_and_copy_spec
+
+
+def test_transitionmapstats(tmpdir):
+    item_cache_config = create_item_cache_config_and_copy_spec(
+        tmpdir, "spec-validation", with_spec_types=True)
+    item_cache = ItemCache(item_cache_config)
+    statistics = [
+        json.loads(line) for line in generate_statistics(item_cache, jobs=1)
+    ]
+    assert [entry["uid"]
+            for entry in statistics] == ["/action2", "/action3", "/directive"]
+    assert statistics[0] == {
+        "distinct-entries": 7,
+        "map-size": 18,
+        "not-applicable": {
+            "A": 6,
+            "B": 0,
+            "C": 0
+        },
+        "pre-co-summary": [9, 8, 0, 0],
+        "skip-count": 3,
+        "skip-reasons": {
+            "SkipReason": {
+                "count": 3,
+                "share": 3 / 18
+            }
+        },
+        "skip-share": 3 / 18,
+        "uid": "/action2",
+        "variants-by-enabled-by": {
+            "1": 6,
+            "defined(BOOM)": 1
+        }
+    }
+    assert statistics[2]["variants-by-enabled-by"] == {
+        "1": 5,
+        "defined(RTEMS_MULTIPROCESSING)": 1
+    }
+    data = copy.deepcopy(item_cache["/action2"].data)
+    data["pre-conditions"][0]["states"] = []
+    item_cache.add_volatile_item("/invalid", data)
+    lines = list(generate_statistics(item_cache, ["/directive"], jobs=2))
+    assert json.loads(lines[0]) == statistics[2]
+    lines = list(generate_statistics(item_cache, ["/invalid"], jobs=1))
+    assert json.loads(lines[0]) == {
+        "error": "pre-condition 'A' of spec:/invalid has no states",
+        "uid": "/invalid"
+    }
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: BSD-2-Clause
+""" Unit tests for the rtemsspec.transitionstorage module. """
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from rtemsspec.transitionstorage import DecisionDiagram, DenseMap, Descriptor
+
+
+class _Callbacks:
+
+    def __init__(self):
+        self.variants = {}
+        self.entries = {(): 0}
+        self.calls = []
+
+    def make_variant(self, desc, map_idx, ref_states):
+        self.calls.append((map_idx, ref_states))
+        return self.variants.setdefault((desc.variant, ref_states),
+                                        len(self.variants))
+
+    def get_entry_idx(self, variant_ids):
+        return self.entries.setdefault(variant_ids, len(self.entries))
+
+    def add_variant(self, entry_idx, variant_idx, map_idx):
+        variant_ids = next(key for key, value in self.entries.items()
+                           if value == entry_idx)
+        return self.get_entry_idx(variant_ids + (variant_idx, )), True
+
+
+def _build(storage_type):
+    callbacks = _Callbacks()
+    storage = storage_type((2, 3, 2), callbacks.make_variant,
+                           callbacks.add_variant, callbacks.get_entry_idx)
+    additions = storage.add_transitions(
+        Descriptor("a", (0, 0, 1), ([0, 1], [0, 2], [0, 1]), True, (0, 2)))
+    storage.add_default(
+        Descriptor("b", (0, 0, 0), ([0, 1], [0, 1, 2], [0, 1]), True, (1, )))
+    return callbacks, storage, additions
+
+
+def test_transition_storage_empty_states():
+    for storage_type in [DenseMap, DecisionDiagram]:
+        callbacks, storage, _ = _build(storage_type)
+        cells = list(storage)
+        for states in [([0, 1], [0], []), ([], [0], [0])]:
+            assert storage.add_transitions(
+                Descriptor("c", (0, 0, 0), states, True, (0, ))) == {}
+        assert list(storage) == cells
+        assert ("c", (0, )) not in callbacks.variants
+
+
+def _classify(entry_idx):
+    return {
+        1: ("x", (0, 0, 0)),
+        2: ("x", (1, 0, 0)),
+        3: ("y", (0, 0, 1))
+    }[entry_idx]
+
+
+def test_transition_storage(monkeypatch):
+    dense_callbacks, dense, dense_additions = _build(DenseMap)
+    assert dense_callbacks.calls == [(0, (0, 2)), (1, (0, 2)), (4, (0, 2)),
+                                     (5, (0, 2)), (6, (1, 2)), (7, (1, 2)),
+                                     (10, (1, 2)), (11, (1, 2)), (2, (1, )),
+                                     (3, (1, )), (8, (1, )), (9, (1, ))]
+    assert dense_additions == {0: 4, 1: 4}
+    assert list(dense) == [1, 1, 3, 3, 1, 1, 2, 2, 3, 3, 2, 2]
+    assert dense.entry_counts() == {1: 4, 3: 4, 2: 4}
+    assert dense.find_map_idx(3) == 2
+    sparse_callbacks, sparse, sparse_additions = _build(DecisionDiagram)
+    assert sparse_callbacks.calls == [(0, (0, 2)), (1, (0, 2)), (6, (1, 2)),
+                                      (7, (1, 2)), (2, (1, ))]
+    assert sparse_callbacks.variants == dense_callbacks.variants
+    assert sparse_additions == dense_additions
+    assert list(sparse) == list(dense)
+    assert sparse.entry_counts() == dense.entry_counts()
+    assert sparse.find_map_idx(3) == 2
+    single_states = {
+        "x": [(1, 1, 1), (1, 1, 2), (1, 4, 1), (1, 4, 2), (4, 1, 1), (4, 1, 2),
+              (4, 4, 1), (4, 4, 2)],
+        "y": [(1, 2, 4), (2, 2, 4)]
+    }
+    assert {
+        key: sorted(cubes)
+        for key, cubes in dense.get_cubes(_classify).items()
+    } == single_states
+    assert {
+        key: sorted(cubes)
+        for key, cubes in sparse.get_cubes(_classify).items()
+    } == single_states
+    monkeypatch.setattr("rtemsspec.transitionstorage._SINGLE_STATE_LIMIT", 0)
+    assert sparse.get_cubes(_classify) == {"x": [(5, 5, 3)], "y": [(3, 2, 4)]}
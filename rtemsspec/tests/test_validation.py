@@ -28,12 +28,64 @@ import os
 import pytest
 
 from rtemsspec.validation import augment_with_test_case_links, generate, \
-    TransitionMap
-from rtemsspec.items import EmptyItemCache, Item, ItemCache
+    load_item_cache, TransitionMap
+from rtemsspec.items import create_unique_link, data_digest, \
+    EmptyItemCache, Item, ItemCache
+from rtemsspec.transitionmap import SPARSE_THRESHOLD
 from rtemsspec.tests.util import create_item_cache_config_and_copy_spec
 
 
-def test_validation(tmpdir):
+def _check_sparse_map(item: Item) -> None:
+    dense_map = TransitionMap(item)
+    sparse_map = TransitionMap(item, sparse_threshold=0)
+    assert [transitions.key for transitions in sparse_map
+            ] == [transitions.key for transitions in dense_map]
+    assert [
+        (entry[0], entry[1], entry[2].key) for entry in sparse_map.entries()
+    ] == [(entry[0], entry[1], entry[2].key) for entry in dense_map.entries()]
+    assert sparse_map.pre_co_summary == dense_map.pre_co_summary
+    assert list(sparse_map.get_variants(["RTEMS_SMP"])) == list(
+        dense_map.get_variants(["RTEMS_SMP"]))
+    assert list(sparse_map.get_post_conditions(["RTEMS_SMP"])) == list(
+        dense_map.get_post_conditions(["RTEMS_SMP"]))
+
+
+def _check_cached_map(item: Item) -> None:
+    cache_directory = item.cache.cache_directory
+    assert cache_directory is not None
+    built_map = TransitionMap(item, cache_directory=cache_directory)
+    loaded_map = TransitionMap(item, cache_directory=cache_directory)
+    assert [transitions.key for transitions in loaded_map
+            ] == [transitions.key for transitions in built_map]
+    assert [
+        (entry[0], entry[1], entry[2].key) for entry in loaded_map.entries()
+    ] == [(entry[0], entry[1], entry[2].key) for entry in built_map.entries()]
+    assert loaded_map.pre_co_summary == built_map.pre_co_summary
+    assert list(loaded_map.get_post_conditions(["RTEMS_SMP"])) == list(
+        built_map.get_post_conditions(["RTEMS_SMP"]))
+    directory = os.path.join(cache_directory, "transition-maps")
+    paths = [
+        os.path.join(path, name) for path, _, names in os.walk(directory)
+        for name in names
+    ]
+    for path in paths:
+        with open(path, "wb") as out:
+            out.write(b"foobar")
+    rebuilt_map = TransitionMap(item, cache_directory=cache_directory)
+    assert rebuilt_map.pre_co_summary == built_map.pre_co_summary
+    item_directory = os.path.join(directory,
+                                  data_digest([item.uid, SPARSE_THRESHOLD]))
+    names = os.listdir(item_directory)
+    assert len(names) == 1
+    os.replace(os.path.join(item_directory, names[0]),
+               os.path.join(item_directory, "stale.pickle"))
+    with open(os.path.join(item_directory, "other"), "wb") as out:
+        out.write(b"other")
+    TransitionMap(item, cache_directory=cache_directory)
+    assert sorted(os.listdir(item_directory)) == sorted([names[0], "other"])
+
+
+def test_validation(tmpdir, monkeypatch):
     base_directory = os.path.join(tmpdir, "base")
     validation_config = {"base-directory": base_directory}
 
@@ -51,10 +103,32 @@ def test_validation(tmpdir):
     assert len(list(transition_map.get_variants([]))) == 36
     assert len(list(transition_map.get_variants(["RTEMS_MULTIPROCESSING"
                                                  ]))) == 36
-    assert len(list(transition_map.get_post_conditions([]))) == 4
+    assert transition_map.map_idx_to_pre_co_states(13, (0, 1, 0)) == (1, 6, 1)
+    assert list(transition_map.get_post_conditions([])) == [
+        ((0, 0, 3), [([2], [0, 3, 5], [1])]),
+        ((0, 0, 2), [([1], [0, 1, 2, 3, 4, 5], [1])]),
+        ((0, 2, 0), [([0], [0, 3, 5], [1]), ([0, 2], [1, 2, 4], [1])]),
+        ((0, 1, 1), [([0, 1, 2], [0, 1, 2, 3, 4, 5], [0])])
+    ]
     assert len(
         list(transition_map.get_post_conditions(["RTEMS_MULTIPROCESSING"
                                                  ]))) == 5
+    for uid in ["/directive", "/action2", "/action3"]:
+        _check_sparse_map(item_cache[uid])
+    _check_cached_map(item_cache["/directive"])
+    _check_cached_map(item_cache["/action3"])
+    monkeypatch.setattr("rtemsspec.transitionstorage._EXPAND_LIMIT", 1)
+    _check_sparse_map(item_cache["/action2"])
+    monkeypatch.setattr("rtemsspec.transitionstorage._SINGLE_STATE_LIMIT", 0)
+    transition_map = TransitionMap(item_cache["/directive"],
+                                   sparse_threshold=1)
+    assert list(transition_map.get_post_conditions([])) == [
+        ((0, 0, 3), [([2], [0, 3, 5], [1])]),
+        ((0, 0, 2), [([1], [0, 1, 2, 3, 4, 5], [1])]),
+        ((0, 2, 0), [([0], [0, 1, 2, 3, 4, 5], [1]), ([2], [1, 2, 4], [1])]),
+        ((0, 1, 1), [([0, 1, 2], [0, 1, 2, 3, 4, 5], [0])])
+    ]
+    monkeypatch.undo()
     transition_map = TransitionMap(item_cache["/action2"])
     assert transition_map.skip_idx_to_name(2) == "SkipReason"
     assert len(list(transition_map.get_post_conditions(["BOOM"]))) == 6
@@ -63,6 +137,80 @@ def test_validation(tmpdir):
 
     generate(validation_config, item_cache)
     generate(validation_config, item_cache, ["ts.c"])
+    parallel_directory = os.path.join(tmpdir, "parallel")
+    generate({"base-directory": parallel_directory, "jobs": 2}, item_cache)
+    for path, _, names in os.walk(base_directory):
+        for name in names:
+            with open(os.path.join(path, name), "r") as src:
+                with open(
+                        os.path.join(
+                            parallel_directory,
+                            os.path.relpath(os.path.join(path, name),
+                                            base_directory)), "r") as dst:
+                    assert src.read() == dst.read()
+
+    compressed_directory = os.path.join(tmpdir, "compressed")
+    generate(
+        {
+            "base-directory": compressed_directory,
+            "compress-transition-maps": True
+        }, item_cache)
+    with open(os.path.join(compressed_directory, "tc12.c"), "r") as src:
+        content = src.read()
+        assert """};
+
+#if defined(RTEMS_TEST_COMPRESSED_TRANSITION_MAPS)
+/* The compressed map needs 26 bytes, the plain map 36 bytes */
+
+static const uint8_t
+Directive_MapBlocks[] = {
+  0, 1, 0, 2, 0, 3, 0, 4
+};
+
+static const uint8_t
+Directive_MapBlockOffsets[] = {
+  0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 4, 6, 0, 4, 6, 4
+};
+
+static inline uint8_t Directive_GetMapEntry( size_t index )
+{
+  return Directive_MapBlocks[
+    Directive_MapBlockOffsets[ index / 2 ] + index % 2
+  ];
+}
+
+#else
+
+static const uint8_t
+Directive_Map[] = {
+  0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 2, 0, 3,
+  0, 4, 0, 1, 0, 3, 0, 4, 0, 3
+};
+
+static inline uint8_t Directive_GetMapEntry( size_t index )
+{
+  return Directive_Map[ index ];
+}
+
+#endif
+
+static size_t Directive_Scope( void *arg, char *buf, size_t n )
+""" in content
+        assert """  return Directive_Entries[
+    Directive_GetMapEntry( index )
+  ];
+""" in content
+    with open(os.path.join(compressed_directory, "action2.c"), "r") as src:
+        assert """static inline uint8_t Action2_GetMapEntry( size_t index )
+{
+  return Action2_Map[ index ];
+}
+""" in src.read()
+    transition_map = TransitionMap(item_cache["/directive"])
+    assert transition_map.get_map_size() == 36
+    assert transition_map.get_map_size(compressed=True) == 26
+    transition_map = TransitionMap(item_cache["/action2"])
+    assert transition_map.get_map_size(compressed=True) == 18
 
     with open(os.path.join(base_directory, "ts.c"), "r") as src:
         content = """/* SPDX-License-Identifier: BSD-2-Clause */
@@ -2396,12 +2544,87 @@ void Action2_Run( int *a, int b, int *c )
 
 
 def _add_item(item_cache, uid, data, item_type):
-    item = Item(item_cache, uid, data)
+    item = item_cache.add_volatile_item(uid, data)
     item["_type"] = item_type
-    item_cache.all[item.uid] = item
     return item
 
 
+def _read_files(directory):
+    files = {}
+    for path, _, names in os.walk(directory):
+        for name in names:
+            with open(os.path.join(path, name), "r") as src:
+                files[os.path.relpath(os.path.join(path, name),
+                                      directory)] = src.read()
+    return files
+
+
+def test_validation_targets(tmpdir):
+    item_cache_config = create_item_cache_config_and_copy_spec(
+        tmpdir, "spec-validation", with_spec_types=True)
+    base_directory = os.path.join(tmpdir, "base")
+    item_cache = load_item_cache(item_cache_config)
+    item_count = len(item_cache.all)
+    generate({"base-directory": base_directory}, item_cache)
+    expected = _read_files(base_directory)
+    targets = ["action2.c", "action3.c", "tc12.c", "tc34.c", "ts.c"]
+    for target in targets:
+        target_directory = os.path.join(tmpdir, target)
+        item_cache = load_item_cache(item_cache_config, [target])
+        assert len(item_cache.all) < item_count
+        generate({"base-directory": target_directory}, item_cache, [target])
+        for name, content in _read_files(target_directory).items():
+            assert expected[name] == content
+    item_cache = load_item_cache(item_cache_config, ["nix.c"])
+    assert len(item_cache.all) == item_count
+    no_types_config = dict(item_cache_config)
+    no_types_config["cache-directory"] = os.path.join(tmpdir, "no-types")
+    no_types_config["spec-type-root-uid"] = None
+    item_cache = load_item_cache(no_types_config, ["ts.c"])
+    assert len(item_cache.all) == item_count
+
+    # Changed item
+    with open(os.path.join(tmpdir, "spec", "tc.yml"), "a") as out:
+        out.write("foo: bar\n")
+    item_cache = load_item_cache(item_cache_config, ["ts.c"])
+    assert len(item_cache.all) == item_count
+    item_cache = load_item_cache(item_cache_config, ["ts.c"])
+    assert len(item_cache.all) < item_count
+
+    # Invalid index
+    with open(os.path.join(tmpdir, "cache", "validation-targets.pickle"),
+              "wb") as out:
+        out.write(b"foobar")
+    item_cache = load_item_cache(item_cache_config, ["ts.c"])
+    assert len(item_cache.all) == item_count
+
+
+def test_validation_build_dependency_cycle():
+    item_cache = EmptyItemCache()
+    _add_item(item_cache, "/ts", {
+        "links": [],
+        "test-target": "ts.c"
+    }, "test-suite")
+    tc = _add_item(item_cache, "/tc", {
+        "links": [],
+        "test-target": "tc.c"
+    }, "test-case")
+    lib = _add_item(item_cache, "/lib", {
+        "links": [],
+        "source": ["tc.c"]
+    }, "build/objects")
+    tp = _add_item(item_cache, "/tp", {
+        "links": [{
+            "role": "build-dependency",
+            "uid": "/lib"
+        }],
+        "source": ["ts.c"]
+    }, "build/test-program")
+    create_unique_link(lib, tp, {"role": "build-dependency"})
+    augment_with_test_case_links(item_cache)
+    assert [parent.uid for parent in tc.parents("test-case")] == ["/ts"]
+
+
 def test_validation_invalid_actions():
     item_cache = EmptyItemCache()
     validation_config = {"base-directory": "/foobar"}
@@ -2543,6 +2766,8 @@ def test_validation_invalid_actions():
              "for pre-condition set {A=A2}")
     with pytest.raises(ValueError, match=match):
         generate(validation_config, item_cache)
+    with pytest.raises(ValueError, match=match):
+        TransitionMap(item_cache["/a"], sparse_threshold=0)
     action_data["transition-map"][0]["enabled-by"] = False
     match = ("transition map descriptor 0 of spec:/a is the first "
              "variant for {A=A0} and it is not enabled by default")
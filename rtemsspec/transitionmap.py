@@ -29,12 +29,17 @@ action requirements.
 
 import itertools
 import math
+import os
+import pickle
 import textwrap
-from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, \
+    Optional, Set, Tuple, Union
 
 from rtemsspec.content import CContent, enabled_by_to_exp, ExpressionMapper, \
     get_integer_type
-from rtemsspec.items import is_enabled, Item
+from rtemsspec.items import data_digest, is_enabled, Item
+from rtemsspec.outputsink import open_atomically
+from rtemsspec.transitionstorage import DecisionDiagram, DenseMap, Descriptor
 
 
 class Transition(NamedTuple):
@@ -54,9 +59,9 @@ def _variant_to_key(variant: Transition) -> str:
 
 class _TransitionEntry:
 
-    def __init__(self):
-        self.key = ""
-        self.variants: List[Transition] = []
+    def __init__(self, variants: Tuple[Transition, ...] = (), key: str = ""):
+        self.key = key
+        self.variants = list(variants)
 
     def __bool__(self):
         return bool(self.variants)
@@ -67,20 +72,6 @@ class _TransitionEntry:
     def __len__(self):
         return len(self.variants)
 
-    def add(self, variant: Transition) -> None:
-        """ Adds the variant to the transitions of the entry. """
-        self.key += _variant_to_key(variant)
-        self.variants.append(variant)
-
-    def replace(self, index: int, variant: Transition) -> None:
-        """ Replace the variant at transition variant index. """
-        self.key = self.key.replace(_variant_to_key(self.variants[index]),
-                                    _variant_to_key(variant))
-        self.variants[index] = variant
-
-
-_TransitionMap = List[_TransitionEntry]
-
 
 def _to_st_idx(conditions: List[Any]) -> Tuple[Dict[str, int], ...]:
     return tuple(
@@ -98,167 +89,255 @@ def _to_st_name(conditions: List[Any]) -> Tuple[Tuple[str, ...], ...]:
         for condition in conditions)
 
 
-class _PostCondContext(NamedTuple):
-    transition_map: "TransitionMap"
-    map_idx: int
-    pre_co_states: Tuple[int, ...]
-    post_co_states: Tuple[Any, ...]
-    post_co_idx: int
-    ops: Any
+Evaluator = Callable[[Tuple[int, ...], List[Any]], Any]
+
+
+class _PostCondCompiler:
+    """
+    Compiles post-condition expressions into evaluators.
+
+    The evaluators are called with the states of the referenced pre-conditions
+    and the post-condition states determined so far.
+    """
+
+    # pylint: disable=too-few-public-methods
+    def __init__(self, transition_map: "TransitionMap",
+                 pre_co_refs: Tuple[int, ...]):
+        self._map = transition_map
+        self._positions = dict(
+            (co_idx, pos) for pos, co_idx in enumerate(pre_co_refs))
+        self._bool_ops = {
+            "and": self._bool_and,
+            "not": self._bool_not,
+            "or": self._bool_or,
+            "post-conditions": self._bool_post_cond,
+            "pre-conditions": self._bool_pre_cond,
+        }
+        self._ops = {
+            "else": self._else,
+            "if": self._if,
+            "specified-by": self._specified_by,
+        }
+
+    def _bool_and(self, exp: Any) -> Evaluator:
+        elements = [self._bool_exp(element) for element in exp]
+        return lambda states, post_cond: all(
+            element(states, post_cond) for element in elements)
+
+    def _bool_not(self, exp: Any) -> Evaluator:
+        element = self._bool_exp(exp)
+        return lambda states, post_cond: not element(states, post_cond)
+
+    def _bool_or(self, exp: Any) -> Evaluator:
+        elements = [self._bool_exp(element) for element in exp]
+        return lambda states, post_cond: any(
+            element(states, post_cond) for element in elements)
+
+    def _bool_post_cond(self, exp: Any) -> Evaluator:
+        checks = []
+        for post_co_name, status in exp.items():
+            if isinstance(status, str):
+                status = [status]
+            post_co_idx = self._map.post_co_name_to_co_idx(post_co_name)
+            checks.append((post_co_idx,
+                           tuple(
+                               self._map.post_co_idx_st_name_to_st_idx(
+                                   post_co_idx, st_name)
+                               for st_name in status)))
+        return lambda states, post_cond: all(post_cond[post_co_idx] in st_idx
+                                             for post_co_idx, st_idx in checks)
+
+    def _bool_pre_cond(self, exp: Any) -> Evaluator:
+        checks = []
+        for pre_co_name, status in exp.items():
+            if isinstance(status, str):
+                status = [status]
+            pre_co_idx = self._map.pre_co_name_to_co_idx(pre_co_name)
+            checks.append((self._positions[pre_co_idx],
+                           tuple(
+                               self._map.pre_co_idx_st_name_to_st_idx(
+                                   pre_co_idx, st_name)
+                               for st_name in status)))
+        return lambda states, post_cond: all(states[pos] in st_idx
+                                             for pos, st_idx in checks)
+
+    def _bool_exp(self, exp: Any) -> Evaluator:
+        if isinstance(exp, list):
+            return self._bool_or(exp)
+        key = next(iter(exp))
+        return self._bool_ops[key](exp[key])
+
+    def _do_specified_by(self, pre_co_name: str,
+                         post_co_idx: int) -> Evaluator:
+        pre_co_idx = self._map.pre_co_name_to_co_idx(pre_co_name)
+        pos = self._positions[pre_co_idx]
+        map_ = self._map
+        return lambda states, post_cond: map_.post_co_idx_st_name_to_st_idx(
+            post_co_idx,
+            map_.pre_co_idx_st_idx_to_st_name(pre_co_idx, states[pos]))
+
+    def _if(self, ops: Any, post_co_idx: int) -> Evaluator:
+        condition = self._bool_exp(ops["if"])
+        if "then-specified-by" in ops:
+            then = self._do_specified_by(ops["then-specified-by"], post_co_idx)
+        else:
+            then = self._state(ops["then"], post_co_idx)
+        return lambda states, post_cond: then(states, post_cond) if condition(
+            states, post_cond) else None
 
+    def _specified_by(self, ops: Any, post_co_idx: int) -> Evaluator:
+        return self._do_specified_by(ops["specified-by"], post_co_idx)
 
-def _post_cond_bool_and(ctx: _PostCondContext, exp: Any) -> bool:
-    for element in exp:
-        if not _post_cond_bool_exp(ctx, element):
-            return False
-    return True
+    def _else(self, ops: Any, post_co_idx: int) -> Evaluator:
+        return self._state(ops["else"], post_co_idx)
 
+    def _state(self, st_name: str, post_co_idx: int) -> Evaluator:
+        st_idx = self._map.post_co_idx_st_name_to_st_idx(post_co_idx, st_name)
+        return lambda states, post_cond: st_idx
 
-def _post_cond_bool_not(ctx: _PostCondContext, exp: Any) -> bool:
-    return not _post_cond_bool_exp(ctx, exp)
+    def compile(self, post_cond: Any, post_co_idx: int) -> Evaluator:
+        """
+        Returns an evaluator of the post-condition operations.  The evaluator
+        returns None, if no operation determines the post-condition state.
+        """
+        ops_evaluators = [
+            self._ops[next(iter(ops))](ops, post_co_idx) for ops in post_cond
+        ]
 
+        def _evaluate(states: Tuple[int, ...], post_cond: List[Any]) -> Any:
+            for ops_evaluator in ops_evaluators:
+                st_idx = ops_evaluator(states, post_cond)
+                if st_idx is not None:
+                    return st_idx
+            return None
 
-def _post_cond_bool_or(ctx: _PostCondContext, exp: Any) -> bool:
-    for element in exp:
-        if _post_cond_bool_exp(ctx, element):
-            return True
-    return False
+        return _evaluate
 
 
-def _post_cond_bool_post_cond(ctx: _PostCondContext, exp: Any) -> bool:
-    for post_co_name, status in exp.items():
-        if isinstance(status, str):
-            status = [status]
-        post_co_idx = ctx.transition_map.post_co_name_to_co_idx(post_co_name)
-        st_idx = [
-            ctx.transition_map.post_co_idx_st_name_to_st_idx(
-                post_co_idx, st_name) for st_name in status
-        ]
-        if ctx.post_co_states[post_co_idx] not in st_idx:
-            return False
-    return True
-
-
-def _post_cond_bool_pre_cond(ctx: _PostCondContext, exp: Any) -> bool:
-    for pre_co_name, status in exp.items():
-        if isinstance(status, str):
-            status = [status]
-        pre_co_idx = ctx.transition_map.pre_co_name_to_co_idx(pre_co_name)
-        st_idx = [
-            ctx.transition_map.pre_co_idx_st_name_to_st_idx(
-                pre_co_idx, st_name) for st_name in status
-        ]
-        if ctx.pre_co_states[pre_co_idx] not in st_idx:
-            return False
-    return True
+PostCond = Tuple[int, ...]
+
+PreCondsOfPostCond = List[Tuple[List[int], ...]]
+
+
+def _merge_pre_conds(cubes: List[Tuple[int, ...]],
+                     order: List[int]) -> List[Tuple[int, ...]]:
+    # Each cube is a tuple of state sets represented by bit masks.  Cubes which
+    # differ only in the states of one pre-condition are merged into one cube.
+    # Each pass is linear in the count of cubes and a new pass is only done if
+    # the previous passes reduced the count of cubes.
+    changed = True
+    while changed:
+        changed = False
+        for co_idx in order:
+            groups: Dict[Tuple[int, ...], int] = {}
+            for cube in cubes:
+                key = cube[:co_idx] + (0, ) + cube[co_idx + 1:]
+                groups[key] = groups.get(key, 0) | cube[co_idx]
+            if len(groups) < len(cubes):
+                changed = True
+                cubes = [
+                    key[:co_idx] + (states, ) + key[co_idx + 1:]
+                    for key, states in groups.items()
+                ]
+    return cubes
 
 
-_POST_COND_BOOL_OPS = {
-    "and": _post_cond_bool_and,
-    "not": _post_cond_bool_not,
-    "or": _post_cond_bool_or,
-    "post-conditions": _post_cond_bool_post_cond,
-    "pre-conditions": _post_cond_bool_pre_cond,
-}
+def _minimize_pre_conds(cubes: List[Tuple[int, ...]],
+                        pre_co_count: int) -> PreCondsOfPostCond:
+    # The merge result depends on the order of the pre-conditions, so try the
+    # forward and backward order and use the smaller cover
+    forward = list(range(pre_co_count))
+    best = min(_merge_pre_conds(cubes, forward),
+               _merge_pre_conds(cubes, forward[::-1]),
+               key=len)
+    return sorted(
+        tuple([
+            st_idx for st_idx in range(states.bit_length())
+            if states & (1 << st_idx)
+        ] for states in cube) for cube in best)
 
 
-def _post_cond_bool_exp(ctx: _PostCondContext, exp: Any) -> Optional[int]:
+def _post_cond_bool_exp_refs(exp: Any, pre_co_names: Set[str]) -> None:
     if isinstance(exp, list):
-        return _post_cond_bool_or(ctx, exp)
+        for element in exp:
+            _post_cond_bool_exp_refs(element, pre_co_names)
+        return
     key = next(iter(exp))
-    return _POST_COND_BOOL_OPS[key](ctx, exp[key])
+    if key in ["and", "or"]:
+        for element in exp[key]:
+            _post_cond_bool_exp_refs(element, pre_co_names)
+    elif key == "not":
+        _post_cond_bool_exp_refs(exp[key], pre_co_names)
+    elif key == "pre-conditions":
+        pre_co_names.update(exp[key])
 
 
-def _post_cond_do_specified_by(ctx: _PostCondContext, pre_co_name: str) -> int:
-    pre_co_idx = ctx.transition_map.pre_co_name_to_co_idx(pre_co_name)
-    st_name = ctx.transition_map.pre_co_idx_st_idx_to_st_name(
-        pre_co_idx, ctx.pre_co_states[pre_co_idx])
-    return ctx.transition_map.post_co_idx_st_name_to_st_idx(
-        ctx.post_co_idx, st_name)
+def _post_cond_refs(post_cond: Any, pre_co_names: Set[str]) -> None:
+    for ops in post_cond:
+        key = next(iter(ops))
+        if key == "if":
+            _post_cond_bool_exp_refs(ops["if"], pre_co_names)
+            if "then-specified-by" in ops:
+                pre_co_names.add(ops["then-specified-by"])
+        elif key == "specified-by":
+            pre_co_names.add(ops[key])
 
 
-def _post_cond_if(ctx: _PostCondContext) -> Optional[int]:
-    if _post_cond_bool_exp(ctx, ctx.ops["if"]):
-        if "then-specified-by" in ctx.ops:
-            return _post_cond_do_specified_by(ctx,
-                                              ctx.ops["then-specified-by"])
-        return ctx.transition_map.post_co_idx_st_name_to_st_idx(
-            ctx.post_co_idx, ctx.ops["then"])
-    return None
+SPARSE_THRESHOLD = 65536
 
+# If this define is defined, then the compressed transition maps are used
+COMPRESSED_MAPS_DEFINE = "RTEMS_TEST_COMPRESSED_TRANSITION_MAPS"
 
-def _post_cond_specified_by(ctx: _PostCondContext) -> Optional[int]:
-    return _post_cond_do_specified_by(ctx, ctx.ops["specified-by"])
+# Increment this version if the representation of the cached transition maps
+# changes
+_CACHE_VERSION = 1
 
 
-def _post_cond_else(ctx: _PostCondContext) -> Optional[int]:
-    return ctx.transition_map.post_co_idx_st_name_to_st_idx(
-        ctx.post_co_idx, ctx.ops["else"])
+def _get_integer_size(value: int) -> int:
+    return int(get_integer_type(value)[4:-2]) // 8
 
 
-_POST_COND_OP = {
-    "else": _post_cond_else,
-    "if": _post_cond_if,
-    "specified-by": _post_cond_specified_by,
-}
+def _add_integers(content: CContent, values: List[int]) -> None:
+    wrapper = textwrap.TextWrapper()
+    wrapper.initial_indent = "  "
+    wrapper.subsequent_indent = "  "
+    wrapper.width = 79
+    content.append(wrapper.wrap(", ".join(map(str, values))))
 
-PostCond = Tuple[int, ...]
 
-PreCondsOfPostCond = List[Tuple[List[int], ...]]
+def _add_plain_map(content: CContent, ident: str, integer_type: str,
+                   map_indices: List[int]) -> None:
+    content.append(["", f"static const {integer_type}", f"{ident}_Map[] = {{"])
+    _add_integers(content, map_indices)
+    content.append("};")
 
 
-def _compact(pre_conds: PreCondsOfPostCond) -> PreCondsOfPostCond:
-    while True:
-        last = pre_conds[0]
-        combined_pre_conds = [last]
-        combined_count = 0
-        for row in pre_conds[1:]:
-            diff = [
-                index for index, states in enumerate(last)
-                if states != row[index]
-            ]
-            if len(diff) == 1:
-                index = diff[0]
-                combined_count += 1
-                last[index].extend(row[index])
-            else:
-                combined_pre_conds.append(row)
-                last = row
-        pre_conds = combined_pre_conds
-        if combined_count == 0:
-            break
-    return pre_conds
-
-
-def _compact_more(pre_conds: PreCondsOfPostCond) -> PreCondsOfPostCond:
-    while True:
-        combined_count = 0
-        next_pre_conds = []
-        while pre_conds:
-            first = pre_conds.pop(0)
-            next_pre_conds.append(first)
-            for row in pre_conds:
-                diff = [
-                    index for index, states in enumerate(first)
-                    if states != row[index]
-                ]
-                if len(diff) <= 1:
-                    if diff:
-                        index = diff[0]
-                        first[index].extend(row[index])
-                    combined_count += 1
-                    pre_conds.remove(row)
-        pre_conds = next_pre_conds
-        if combined_count == 0:
-            break
-    return pre_conds
+def _add_get_map_entry(content: CContent, ident: str, integer_type: str,
+                       code: List[str]) -> None:
+    with content.function(f"static inline {integer_type}",
+                          f"{ident}_GetMapEntry", ["size_t index"]):
+        content.add(code)
 
 
 class TransitionMap:
-    """ Representation of an action requirement transition map. """
+    """
+    Representation of an action requirement transition map.
+
+    If the count of pre-condition state combinations is greater than the
+    sparse threshold, then the map is represented by a decision diagram,
+    otherwise by an integer array.
+
+    If a cache directory is specified, then the built map is stored in this
+    directory.  The cache file is keyed by a digest of the item data used to
+    build the map.  Maps of unchanged items are loaded from the cache.  The
+    cache files of previous versions of the item are removed.
+    """
 
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, item: Item):
+    def __init__(self,
+                 item: Item,
+                 sparse_threshold: int = SPARSE_THRESHOLD,
+                 cache_directory: Optional[str] = None):
         self._item = item
         self._pre_co_count = len(item["pre-conditions"])
         self._post_co_count = len(item["post-conditions"])
@@ -289,14 +368,32 @@ class TransitionMap:
             (key, skip_idx + 1)
             for skip_idx, key in enumerate(item["skip-reasons"].keys()))
         self._entries: Dict[str, List[Any]] = {}
-        self._map = self._build_map()
-        self._post_process()
+
+        # The map elements are indices into the table of the distinct
+        # transition map entries.  The entry at index zero is the empty entry.
+        self._entry_table = [_TransitionEntry()]
+        self._entry_ids: Dict[Tuple[int, ...], int] = {(): 0}
+        self._entry_variant_ids: List[Tuple[int, ...]] = [()]
+        self._variants: List[Transition] = []
+        self._variant_keys: List[str] = []
+        self._variant_ids: Dict[Tuple[int, Tuple[Any, ...]], int] = {}
+        self._variant_additions: List[int] = []
+        self._add_variant_cache: Dict[Tuple[int, int], Tuple[int, bool]] = {}
+
+        # The post-condition operations of a descriptor are compiled once.  The
+        # resulting variants are memoized by the states of the pre-conditions
+        # referenced by the operations.
+        self._post_cond_evaluators: Dict[int, List[Tuple[int, Evaluator]]] = {}
+        self._variant_memo: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+        self._map = self._get_map(sparse_threshold, cache_directory)
 
     def __getitem__(self, key: str):
         return self._item[key]
 
     def __iter__(self):
-        yield from self._map
+        entry_table = self._entry_table
+        for entry_idx in self._map:
+            yield entry_table[entry_idx]
 
     def entries(self) -> Iterator[List[Any]]:
         """ Yields the transition map entry variants sorted by frequency. """
@@ -308,13 +405,24 @@ class TransitionMap:
         Yields the map index and the transition variants enabled by the enabled
         list.
         """
-        for map_idx, transitions in enumerate(self._map):
-            for variant in transitions[1:]:
-                if is_enabled(enabled, variant.enabled_by):
-                    break
-            else:
-                variant = transitions[0]
-            yield map_idx, variant
+        selected: Dict[int, Transition] = {}
+        for map_idx, entry_idx in enumerate(self._map):
+            yield map_idx, self._select_variant(selected, entry_idx, enabled)
+
+    def _select_variant(self, selected: Dict[int, Transition], entry_idx: int,
+                        enabled: List[str]) -> Transition:
+        try:
+            return selected[entry_idx]
+        except KeyError:
+            pass
+        transitions = self._entry_table[entry_idx]
+        for variant in transitions[1:]:
+            if is_enabled(enabled, variant.enabled_by):
+                break
+        else:
+            variant = transitions[0]
+        selected[entry_idx] = variant
+        return variant
 
     def get_post_conditions(
             self, enabled: List[str]
@@ -327,38 +435,53 @@ class TransitionMap:
         remaining entries are post-condition indices.  The pre-condition
         variants are a list of tuples.  Each tuple entry corresponds to a
         pre-condition and provides a list of corresponding pre-condition state
-        indices.
+        indices.  The pre-condition variants of a post-condition variant are
+        disjoint.
         """
-        entries: Dict[PostCond, PreCondsOfPostCond] = {}
-        for map_idx, variant in self.get_variants(enabled):
-            key = (variant.skip, ) + variant.post_cond
-            entry = entries.setdefault(key, [])
-            entry.append(
-                tuple([state] for state in self.map_idx_to_pre_co_states(
-                    map_idx, variant.pre_cond_na)))
-        for post_cond, pre_conds in sorted(entries.items(),
-                                           key=lambda x: (x[0][0], len(x[1]))):
-            pre_conds = _compact_more(_compact(pre_conds))
-            yield post_cond, pre_conds
+        selected: Dict[int, Transition] = {}
+
+        def _classify(entry_idx: int) -> Tuple[PostCond, Tuple[int, ...]]:
+            variant = self._select_variant(selected, entry_idx, enabled)
+            return (variant.skip, ) + variant.post_cond, variant.pre_cond_na
+
+        # The storage provides the states of a post-condition variant as
+        # cubes, so the state product is not enumerated
+        counts: Dict[PostCond, int] = {}
+        for entry_idx, count in self._map.entry_counts().items():
+            key = _classify(entry_idx)[0]
+            counts[key] = counts.get(key, 0) + count
+        cubes = self._map.get_cubes(_classify)
+        for post_cond, _ in sorted(counts.items(),
+                                   key=lambda x: (x[0][0], x[1])):
+            yield post_cond, _minimize_pre_conds(cubes[post_cond],
+                                                 self._pre_co_count)
 
     def _post_process(self) -> None:
-        for map_idx, transitions in enumerate(self):
+        for entry_idx, count in self._map.entry_counts().items():
+            transitions = self._entry_table[entry_idx]
             if not transitions or not isinstance(
                     transitions[0].enabled_by,
                     bool) or not transitions[0].enabled_by:
+                map_idx = self._map.find_map_idx(entry_idx)
                 raise ValueError(
                     f"transition map of {self._item.spec} contains no default "
                     "entry for pre-condition set "
                     f"{{{self._map_index_to_pre_conditions(map_idx)}}}")
             entry = self._entries.setdefault(transitions.key,
-                                             [0, 0, transitions, []])
-            entry[0] += 1
-            entry[3].append(map_idx)
+                                             [0, 0, transitions])
+            entry[0] += count
         for index, entry in enumerate(
                 sorted(self._entries.values(),
                        key=lambda x: x[0],
                        reverse=True)):
             entry[1] = index
+        summary = [0] * (self._pre_co_count + 1)
+        for variant, count in zip(self._variants, self._variant_additions):
+            if count:
+                for index, value in enumerate((variant.skip, ) +
+                                              variant.pre_cond_na):
+                    summary[index] += count * value
+        self.pre_co_summary = tuple(summary)
 
     def _map_index_to_pre_conditions(self, map_idx: int) -> str:
         conditions = []
@@ -449,41 +572,82 @@ class TransitionMap:
         """
         return self._skip_idx_to_name[skip_idx]
 
-    def _map_post_cond(self, map_idx: int, co_idx: int,
-                       variant: Transition) -> Transition:
-        if isinstance(variant.post_cond[co_idx], int):
-            return variant
-        pre_co_states = self.map_idx_to_pre_co_states(map_idx,
-                                                      variant.pre_cond_na)
-        for ops in variant.post_cond[co_idx]:
-            idx = _POST_COND_OP[next(iter(ops))](_PostCondContext(
-                self, map_idx, pre_co_states, variant.post_cond, co_idx, ops))
-            if idx is not None:
-                return Transition(
-                    variant.desc_idx, variant.enabled_by, variant.skip,
-                    variant.pre_cond_na, variant.post_cond[0:co_idx] +
-                    (idx, ) + variant.post_cond[co_idx + 1:])
-        raise ValueError(
-            "cannot determine state for post-condition "
-            f"'{self._post_co_idx_to_co_name[co_idx]}' of transition map "
-            f"descriptor {variant.desc_idx} of {self._item.spec} for "
-            "pre-condition set "
-            f"{{{self._map_index_to_pre_conditions(map_idx)}}}")
-
-    def _make_post_cond(self, map_idx: int, variant: Transition) -> Transition:
-        for co_idx in range(len(variant.post_cond)):
-            variant = self._map_post_cond(map_idx, co_idx, variant)
-        return variant
-
-    def _update_pre_co_summary(self, variant: Transition) -> None:
-        self.pre_co_summary = tuple(
-            a + b for a, b in zip(self.pre_co_summary, (variant.skip, ) +
-                                  variant.pre_cond_na))
-
-    def _add_variant(self, transition_map: _TransitionMap, map_idx: int,
-                     variant: Transition) -> None:
-        if transition_map[map_idx]:
-            for index, existing in enumerate(transition_map[map_idx].variants):
+    def _make_variant(self, desc: Descriptor, map_idx: int,
+                      ref_states: Tuple[int, ...]) -> int:
+        variant = desc.variant
+        key = (variant.desc_idx, ref_states)
+        try:
+            return self._variant_memo[key]
+        except KeyError:
+            pass
+        if desc.has_post_cond_ops:
+            post_cond = list(variant.post_cond)
+            for co_idx, evaluate in self._post_cond_evaluators[
+                    variant.desc_idx]:
+                st_idx = evaluate(ref_states, post_cond)
+                if st_idx is None:
+                    raise ValueError(
+                        "cannot determine state for post-condition "
+                        f"'{self._post_co_idx_to_co_name[co_idx]}' of "
+                        f"transition map descriptor {variant.desc_idx} of "
+                        f"{self._item.spec} for pre-condition set "
+                        f"{{{self._map_index_to_pre_conditions(map_idx)}}}")
+                post_cond[co_idx] = st_idx
+            variant = Transition(variant.desc_idx, variant.enabled_by,
+                                 variant.skip, variant.pre_cond_na,
+                                 tuple(post_cond))
+        variant_idx = self._get_variant_idx(variant)
+        self._variant_memo[key] = variant_idx
+        return variant_idx
+
+    def _get_variant_idx(self, variant: Transition) -> int:
+        # The enabled-by, skip, and N/A attributes of a variant are determined
+        # by the transition map descriptor
+        key = (variant.desc_idx, variant.post_cond)
+        try:
+            return self._variant_ids[key]
+        except KeyError:
+            variant_idx = len(self._variants)
+            self._variant_ids[key] = variant_idx
+            self._variants.append(variant)
+            self._variant_keys.append(_variant_to_key(variant))
+            self._variant_additions.append(0)
+            return variant_idx
+
+    def _get_entry_idx(self, variant_ids: Tuple[int, ...]) -> int:
+        try:
+            return self._entry_ids[variant_ids]
+        except KeyError:
+            entry_idx = len(self._entry_table)
+            self._entry_ids[variant_ids] = entry_idx
+            self._entry_variant_ids.append(variant_ids)
+            self._entry_table.append(
+                _TransitionEntry(
+                    tuple(self._variants[variant_idx]
+                          for variant_idx in variant_ids),
+                    "".join(self._variant_keys[variant_idx]
+                            for variant_idx in variant_ids)))
+            return entry_idx
+
+    def _add_variant(self, entry_idx: int, variant_idx: int,
+                     map_idx: int) -> Tuple[int, bool]:
+        # The result of adding a variant to an entry does not depend on the
+        # map index, so it can be shared by all elements with the same entry
+        key = (entry_idx, variant_idx)
+        try:
+            return self._add_variant_cache[key]
+        except KeyError:
+            result = self._do_add_variant(entry_idx, variant_idx, map_idx)
+            self._add_variant_cache[key] = result
+            return result
+
+    def _do_add_variant(self, entry_idx: int, variant_idx: int,
+                        map_idx: int) -> Tuple[int, bool]:
+        transitions = self._entry_table[entry_idx]
+        variant_ids = self._entry_variant_ids[entry_idx]
+        variant = self._variants[variant_idx]
+        if transitions:
+            for index, existing in enumerate(transitions.variants):
                 if existing.enabled_by == variant.enabled_by:
                     if variant.skip:
                         # Allow transition map variants with a skip reason to
@@ -492,20 +656,21 @@ class TransitionMap:
                         # some pre-conditions.  It makes it also easier to skip
                         # pre-conditon states which are controlled by build
                         # options.
-                        self._update_pre_co_summary(variant)
-                        transition_map[map_idx].replace(index, variant)
-                        return
+                        return self._get_entry_idx(variant_ids[:index] +
+                                                   (variant_idx, ) +
+                                                   variant_ids[index +
+                                                               1:]), True
                     raise ValueError(
                         f"transition map descriptor {variant.desc_idx} of "
                         f"{self._item.spec} duplicates pre-condition set "
                         f"{{{self._map_index_to_pre_conditions(map_idx)}}}"
                         " defined by transition map descriptor "
                         f"{existing.desc_idx}")
-            default = transition_map[map_idx][0]
+            default = transitions[0]
             if (default.post_cond, default.skip,
                     default.pre_cond_na) == (variant.post_cond, variant.skip,
                                              variant.pre_cond_na):
-                return
+                return entry_idx, False
         elif not isinstance(variant.enabled_by,
                             bool) or not variant.enabled_by:
             raise ValueError(
@@ -513,61 +678,63 @@ class TransitionMap:
                 f"{self._item.spec} is the first variant for "
                 f"{{{self._map_index_to_pre_conditions(map_idx)}}} "
                 "and it is not enabled by default")
-        self._update_pre_co_summary(variant)
-        transition_map[map_idx].add(variant)
-
-    def _add_transitions(self, transition_map: _TransitionMap,
-                         desc: Dict[str, Any], desc_idx: int,
-                         skip_post_cond: Tuple[Any, ...], co_idx: int,
-                         map_idx: int, pre_cond_na: Tuple[int, ...]) -> None:
-        # pylint: disable=too-many-arguments
+        return self._get_entry_idx(variant_ids + (variant_idx, )), True
+
+    def _get_descriptor(self, desc: Dict[str, Any], desc_idx: int,
+                        skip_post_cond: Tuple[Any, ...]) -> Descriptor:
         # pylint: disable=too-many-locals
-        if co_idx < self._pre_co_count:
-            condition = self._pre_co_idx_to_cond[co_idx]
-            state_count = len(condition["states"])
-            map_idx *= state_count
-            states = desc["pre-conditions"][condition["name"]]
-            if isinstance(states, str):
-                assert states in ["all", "N/A"]
-                for st_idx in range(state_count):
-                    self._add_transitions(
-                        transition_map, desc, desc_idx, skip_post_cond,
-                        co_idx + 1, map_idx + st_idx,
-                        pre_cond_na + (int(states == "N/A"), ))
-            else:
-                for st_name in states:
-                    try:
-                        st_idx = self._pre_co_idx_st_name_to_st_idx[co_idx][
-                            st_name]
-                    except KeyError as err:
-                        msg = (f"transition map descriptor {desc_idx} of "
-                               f"{self._item.spec} refers to non-existent "
-                               f"state {err} of pre-condition "
-                               f"'{condition['name']}'")
-                        raise ValueError(msg) from err
-                    self._add_transitions(transition_map, desc, desc_idx,
-                                          skip_post_cond, co_idx + 1,
-                                          map_idx + st_idx,
-                                          pre_cond_na + (0, ))
-        else:
-            variant = self._make_post_cond(
-                map_idx,
+        has_post_cond_ops = not all(
+            isinstance(post_cond, int) for post_cond in skip_post_cond[1:])
+        pre_co_names: Set[str] = set()
+        if has_post_cond_ops:
+            for post_cond in skip_post_cond[1:]:
+                if not isinstance(post_cond, int):
+                    _post_cond_refs(post_cond, pre_co_names)
+        pre_co_refs = tuple(
+            sorted(self._pre_co_name_to_co_idx[co_name]
+                   for co_name in pre_co_names))
+        compiler = _PostCondCompiler(self, pre_co_refs)
+        self._post_cond_evaluators[desc_idx] = [
+            (co_idx, compiler.compile(post_cond, co_idx))
+            for co_idx, post_cond in enumerate(skip_post_cond[1:])
+            if not isinstance(post_cond, int)
+        ]
+        if not isinstance(desc["pre-conditions"], dict):
+            assert desc["pre-conditions"] == "default"
+            no_pre_cond_na = (0, ) * self._pre_co_count
+            return Descriptor(
                 Transition(desc_idx, desc["enabled-by"], skip_post_cond[0],
-                           pre_cond_na, skip_post_cond[1:]))
-            self._add_variant(transition_map, map_idx, variant)
-
-    def _add_default(self, transition_map: _TransitionMap, desc: Dict[str,
-                                                                      Any],
-                     desc_idx: int, skip_post_cond: Tuple[int, ...]) -> None:
-        enabled_by = desc["enabled-by"]
-        for map_idx, transition in enumerate(transition_map):
-            if not transition:
-                transition.add(
-                    self._make_post_cond(
-                        map_idx,
-                        Transition(desc_idx, enabled_by, skip_post_cond[0],
-                                   (0, ) * self._pre_co_count,
-                                   skip_post_cond[1:])))
+                           no_pre_cond_na, skip_post_cond[1:]), no_pre_cond_na,
+                tuple(
+                    list(range(len(condition["states"])))
+                    for condition in self["pre-conditions"]),
+                has_post_cond_ops, pre_co_refs)
+        states: List[List[int]] = []
+        pre_cond_na: List[int] = []
+        for co_idx, condition in enumerate(self["pre-conditions"]):
+            co_states = desc["pre-conditions"][condition["name"]]
+            if isinstance(co_states, str):
+                assert co_states in ["all", "N/A"]
+                states.append(list(range(len(condition["states"]))))
+                pre_cond_na.append(int(co_states == "N/A"))
+                continue
+            st_indices = []
+            for st_name in co_states:
+                try:
+                    st_indices.append(
+                        self._pre_co_idx_st_name_to_st_idx[co_idx][st_name])
+                except KeyError as err:
+                    msg = (f"transition map descriptor {desc_idx} of "
+                           f"{self._item.spec} refers to non-existent "
+                           f"state {err} of pre-condition "
+                           f"'{condition['name']}'")
+                    raise ValueError(msg) from err
+            states.append(st_indices)
+            pre_cond_na.append(0)
+        return Descriptor(
+            Transition(desc_idx, desc["enabled-by"], skip_post_cond[0],
+                       tuple(pre_cond_na), skip_post_cond[1:]),
+            tuple(pre_cond_na), tuple(states), has_post_cond_ops, pre_co_refs)
 
     def _get_post_cond(self, desc: Dict[str, Any], co_idx: int) -> Any:
         info = desc["post-conditions"][self._post_co_idx_to_co_name[co_idx]]
@@ -575,15 +742,59 @@ class TransitionMap:
             return self._post_co_idx_st_name_to_st_idx[co_idx][info]
         return info
 
-    def _build_map(self) -> _TransitionMap:
-        transition_count = 1
+    def _get_map(
+            self, sparse_threshold: int, cache_directory: Optional[str]
+    ) -> Union[DenseMap, DecisionDiagram]:
+        if cache_directory is None:
+            self._map = self._build_map(sparse_threshold)
+            self._post_process()
+            return self._map
+        digest = data_digest([_CACHE_VERSION] + [
+            self._item[key] for key in [
+                "pre-conditions", "post-conditions", "skip-reasons",
+                "transition-map"
+            ]
+        ])
+        # Each item has its own directory, so that the maps of previous
+        # versions of the item can be removed
+        directory = os.path.join(
+            cache_directory, "transition-maps",
+            data_digest([self._item.uid, sparse_threshold]))
+        name = f"{digest}.pickle"
+        cache_file = os.path.join(directory, name)
+        try:
+            with open(cache_file, "rb") as src:
+                (self._entry_table, self._map, self._entries,
+                 self.pre_co_summary) = pickle.load(src)
+            return self._map
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        self._map = self._build_map(sparse_threshold)
+        self._post_process()
+        with open_atomically(cache_file, "wb") as out:
+            pickle.dump((self._entry_table, self._map, self._entries,
+                         self.pre_co_summary), out)
+        for other_name in os.listdir(directory):
+            if other_name != name and other_name.endswith(".pickle"):
+                os.remove(os.path.join(directory, other_name))
+        return self._map
+
+    def _build_map(self,
+                   sparse_threshold: int) -> Union[DenseMap, DecisionDiagram]:
+        state_counts: List[int] = []
         for condition in self["pre-conditions"]:
             state_count = len(condition["states"])
             if state_count == 0:
                 raise ValueError(f"pre-condition '{condition['name']}' of "
                                  f"{self._item.spec} has no states")
-            transition_count *= state_count
-        transition_map = [_TransitionEntry() for _ in range(transition_count)]
+            state_counts.append(state_count)
+        if state_counts and math.prod(state_counts) > sparse_threshold:
+            engine: Union[DenseMap, DecisionDiagram] = DecisionDiagram(
+                tuple(state_counts), self._make_variant, self._add_variant,
+                self._get_entry_idx)
+        else:
+            engine = DenseMap(tuple(state_counts), self._make_variant,
+                              self._add_variant, self._get_entry_idx)
         for desc_idx, desc in enumerate(self["transition-map"]):
             if isinstance(desc["post-conditions"], dict):
                 try:
@@ -600,14 +811,14 @@ class TransitionMap:
                     self._skip_name_to_idx[desc["post-conditions"]], ) + tuple(
                         self._post_co_idx_st_name_to_st_idx[co_idx]["N/A"]
                         for co_idx in range(self._post_co_count))
+            descriptor = self._get_descriptor(desc, desc_idx, skip_post_cond)
             if isinstance(desc["pre-conditions"], dict):
-                self._add_transitions(transition_map, desc, desc_idx,
-                                      skip_post_cond, 0, 0, ())
+                for variant_idx, count in engine.add_transitions(
+                        descriptor).items():
+                    self._variant_additions[variant_idx] += count
             else:
-                assert desc["pre-conditions"] == "default"
-                self._add_default(transition_map, desc, desc_idx,
-                                  skip_post_cond)
-        return transition_map
+                engine.add_default(descriptor)
+        return engine
 
     def _get_entry(self, ident: str, variant: Transition) -> str:
         text = "{ " + ", ".join(
@@ -642,8 +853,74 @@ class TransitionMap:
                     f"uint{bits}_t Post_{condition['name']} : {state_bits};")
         content.add(f"}} {ident}_Entry;")
 
-    def add_map(self, content: CContent, ident: str) -> None:
-        """ Adds the transition map definitions to the content. """
+    def _get_map_indices(self) -> List[int]:
+        entry_indices = [
+            self._entries[transitions.key][1]
+            if transitions.key in self._entries else 0
+            for transitions in self._entry_table
+        ]
+        return [entry_indices[entry_idx] for entry_idx in self._map]
+
+    def _get_map_blocks(
+            self, map_indices: List[int]) -> Tuple[int, List[int], List[int]]:
+        # The map is split into blocks of equal size.  Each block covers the
+        # states of a tail of the pre-conditions.  Equal blocks are stored
+        # once.  Return the block size with the smallest encoding, the
+        # distinct blocks, and the block offsets.  A block size equal to the
+        # map size indicates that the plain encoding is the smallest.
+        state_counts = [
+            len(condition["states"]) for condition in self["pre-conditions"]
+        ]
+        entry_size = _get_integer_size(len(self._entries))
+        best = (entry_size * len(map_indices), len(map_indices), map_indices,
+                [0])
+        for co_idx in range(1, len(state_counts)):
+            block_size = math.prod(state_counts[co_idx:])
+            block_offsets: Dict[Tuple[int, ...], int] = {}
+            offsets = [
+                block_offsets.setdefault(
+                    tuple(map_indices[index:index + block_size]),
+                    len(block_offsets) * block_size)
+                for index in range(0, len(map_indices), block_size)
+            ]
+            blocks_length = len(block_offsets) * block_size
+            size = entry_size * blocks_length + _get_integer_size(
+                blocks_length) * len(offsets)
+            if size < best[0]:
+                best = (size, block_size,
+                        list(itertools.chain.from_iterable(block_offsets)),
+                        offsets)
+        return best[1], best[2], best[3]
+
+    def get_map_size(self, compressed: bool = False) -> int:
+        """
+        Returns the size in bytes of the transition map entry indices in the
+        plain or compressed encoding.
+        """
+        map_indices = self._get_map_indices()
+        entry_size = _get_integer_size(len(self._entries))
+        if compressed:
+            block_size, blocks, offsets = self._get_map_blocks(map_indices)
+            if block_size < len(map_indices):
+                return entry_size * len(blocks) + _get_integer_size(
+                    len(blocks)) * len(offsets)
+        return entry_size * len(map_indices)
+
+    def add_map(self,
+                content: CContent,
+                ident: str,
+                compressed: bool = False) -> None:
+        """
+        Adds the transition map definitions to the content.
+
+        In the compressed encoding, the map is split into blocks and equal
+        blocks are stored once, if this reduces the map size.  The compressed
+        and the plain map are both added.  The compressed map is used if
+        COMPRESSED_MAPS_DEFINE is defined, so that memory-constrained builds
+        can select it without a regeneration of the sources.  The sizes of
+        both maps are given in a comment.  The entry index of a map index is
+        returned by the ``<ident>_GetMapEntry()`` function.
+        """
         entries = []
         mapper = ExpressionMapper()
         for entry in self.entries():
@@ -665,18 +942,45 @@ class TransitionMap:
         content.add([f"static const {ident}_Entry", f"{ident}_Entries[] = {{"])
         entries[-1] = entries[-1].replace("},", "}")
         content.append(entries)
+        content.append("};")
         integer_type = get_integer_type(len(self._entries))
-        content.append(
-            ["};", "", f"static const {integer_type}", f"{ident}_Map[] = {{"])
-        text = ", ".join(
-            str(self._entries[transitions.key][1])
-            for transitions in self._map)
-        wrapper = textwrap.TextWrapper()
-        wrapper.initial_indent = "  "
-        wrapper.subsequent_indent = "  "
-        wrapper.width = 79
-        content.append(wrapper.wrap(text))
+        map_indices = self._get_map_indices()
+        if compressed:
+            self._add_compressed_map(content, ident, integer_type, map_indices)
+        else:
+            _add_plain_map(content, ident, integer_type, map_indices)
+
+    def _add_compressed_map(self, content: CContent, ident: str,
+                            integer_type: str, map_indices: List[int]) -> None:
+        plain_code = [f"return {ident}_Map[ index ];"]
+        block_size, blocks, offsets = self._get_map_blocks(map_indices)
+        if block_size == len(map_indices):
+            _add_plain_map(content, ident, integer_type, map_indices)
+            _add_get_map_entry(content, ident, integer_type, plain_code)
+            return
+        offset_type = get_integer_type(len(blocks))
+        content.append([
+            "", f"#if defined({COMPRESSED_MAPS_DEFINE})",
+            f"/* The compressed map needs {self.get_map_size(True)} bytes, "
+            f"the plain map {self.get_map_size()} bytes */", "",
+            f"static const {integer_type}", f"{ident}_MapBlocks[] = {{"
+        ])
+        _add_integers(content, blocks)
+        content.append([
+            "};", "", f"static const {offset_type}",
+            f"{ident}_MapBlockOffsets[] = {{"
+        ])
+        _add_integers(content, offsets)
         content.append("};")
+        _add_get_map_entry(content, ident, integer_type, [
+            f"return {ident}_MapBlocks[",
+            f"  {ident}_MapBlockOffsets[ index / {block_size} ] + "
+            f"index % {block_size}", "];"
+        ])
+        content.append(["", "#else"])
+        _add_plain_map(content, ident, integer_type, map_indices)
+        _add_get_map_entry(content, ident, integer_type, plain_code)
+        content.append(["", "#endif"])
 
     def get_post_entry_member(self, co_idx: int) -> str:
         """
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module provides functions to gather statistics of action requirement
+transition maps.
+"""
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from rtemsspec.content import enabled_by_to_exp, ExpressionMapper
+from rtemsspec.incremental import map_jobs
+from rtemsspec.items import EmptyItemCache, Item, ItemCache
+from rtemsspec.transitionmap import TransitionMap
+
+
+def get_statistics(transition_map: TransitionMap) -> Dict[str, Any]:
+    """
+    Returns the statistics of the transition map.
+
+    The skip reason and N/A counts are the counts of map elements with a
+    default variant which is skipped or which has a pre-condition which is not
+    applicable.
+    """
+    # pylint: disable=too-many-locals
+    map_size = 0
+    variants: Dict[Tuple[int, Tuple[int, ...]], str] = {}
+    skip_reasons: Dict[str, int] = {}
+    pre_co_count = len(transition_map["pre-conditions"])
+    not_applicable = [0] * pre_co_count
+    mapper = ExpressionMapper()
+    for count, _, transitions in transition_map.entries():
+        map_size += count
+        for variant in transitions:
+            variants.setdefault((variant.desc_idx, variant.post_cond),
+                                enabled_by_to_exp(variant.enabled_by, mapper))
+        default = transitions[0]
+        if default.skip:
+            name = transition_map.skip_idx_to_name(default.skip)
+            skip_reasons[name] = skip_reasons.get(name, 0) + count
+        for co_idx, pre_cond_na in enumerate(default.pre_cond_na):
+            not_applicable[co_idx] += count * pre_cond_na
+    variants_by_enabled_by: Dict[str, int] = {}
+    for enabled_by in variants.values():
+        variants_by_enabled_by[enabled_by] = variants_by_enabled_by.get(
+            enabled_by, 0) + 1
+    skip_count = sum(skip_reasons.values())
+    return {
+        "map-size": map_size,
+        "distinct-entries": len(list(transition_map.entries())),
+        "variants-by-enabled-by": variants_by_enabled_by,
+        "pre-co-summary": list(transition_map.pre_co_summary),
+        "not-applicable": {
+            transition_map.pre_co_idx_to_co_name(co_idx): count
+            for co_idx, count in enumerate(not_applicable)
+        },
+        "skip-count": skip_count,
+        "skip-share": skip_count / map_size,
+        "skip-reasons": {
+            name: {
+                "count": count,
+                "share": count / map_size
+            }
+            for name, count in skip_reasons.items()
+        }
+    }
+
+
+def _get_item_statistics(
+        uid_data_and_cache_directory: Tuple[str, Any, Optional[str]]) -> str:
+    uid, data, cache_directory = uid_data_and_cache_directory
+    statistics: Dict[str, Any] = {"uid": uid}
+    try:
+        statistics.update(
+            get_statistics(
+                TransitionMap(Item(EmptyItemCache(), uid, data),
+                              cache_directory=cache_directory)))
+    except ValueError as err:
+        statistics["error"] = str(err)
+    return json.dumps(statistics, sort_keys=True)
+
+
+def generate_statistics(item_cache: ItemCache,
+                        uids: Optional[List[str]] = None,
+                        jobs: Optional[int] = None) -> Iterator[str]:
+    """
+    Yields the transition map statistics of the action requirements as JSON
+    lines sorted by UID.
+
+    :param item_cache: The specification item cache.
+    :param uids: The optional list of action requirement UIDs.  If no list is
+                 specified, then the statistics of all action requirements
+                 are generated.
+    :param jobs: The count of worker processes.  If the count is one, then the
+                 statistics are gathered by the calling process.  If no count
+                 is specified, then the count of processors is used.
+    """
+    if uids is None:
+        items = item_cache.items_by_type.get("requirement/functional/action",
+                                             [])
+    else:
+        items = [item_cache[uid] for uid in uids]
+    work = [(item.uid, item.data, item_cache.cache_directory)
+            for item in sorted(items)]
+    yield from map_jobs(_get_item_statistics, work, jobs, 4)
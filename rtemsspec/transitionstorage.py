@@ -0,0 +1,543 @@
+# SPDX-License-Identifier: BSD-2-Clause
+"""
+This module provides the storage representations of action requirement
+transition maps.
+"""
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import itertools
+import math
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, \
+    Sequence, Set, Tuple
+
+
+class Descriptor(NamedTuple):
+    """
+    Describes the map elements selected by a transition map descriptor.
+
+    The states are the selected state indices of each pre-condition.  The
+    variant made for a map element depends only on the states of the
+    pre-conditions referenced by the post-condition operations.  The make
+    variant function is called with these states in the order of the
+    references.  The state of a pre-condition which is not applicable is the
+    state count of the pre-condition.
+    """
+    variant: Any
+    pre_cond_na: Tuple[int, ...]
+    states: Tuple[List[int], ...]
+    has_post_cond_ops: bool
+    pre_co_refs: Tuple[int, ...]
+
+
+MakeVariant = Callable[[Descriptor, int, Tuple[int, ...]], int]
+AddVariant = Callable[[int, int, int], Tuple[int, bool]]
+GetEntryIdx = Callable[[Tuple[int, ...]], int]
+Classify = Callable[[int], Tuple[Any, Tuple[int, ...]]]
+Cube = Tuple[int, ...]
+
+_SINGLE_STATE_LIMIT = 65536
+
+
+class _CubeBuilder:
+    """
+    Builds for each class of the map elements a quasi-reduced decision diagram
+    of the pre-condition states and covers it by disjoint cubes.  Small sets
+    are covered by single state cubes since the merge of them usually results
+    in a smaller cover.
+
+    The nodes of the diagram have an additional child for the state which
+    represents a pre-condition which is not applicable.  Node zero is the empty
+    set on each level and node one is the terminal of the full set.
+    """
+
+    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, state_counts: Tuple[int, ...],
+                 get_children: Callable[[int, int], Sequence[int]],
+                 get_entry: Callable[[int], int], classify: Classify):
+        self._state_counts = state_counts
+        self._level_count = len(state_counts)
+        self._get_children = get_children
+        self._get_entry = get_entry
+        self._classify = classify
+        self._nodes: List[Tuple[int, ...]] = [(), ()]
+        self._unique: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+        self._sets: Dict[Tuple[int, int], Dict[Tuple[Any, Tuple[int, ...]],
+                                               int]] = {}
+        self._unions: Dict[Tuple[int, int], int] = {}
+        self._cubes: Dict[int, List[Cube]] = {1: [()]}
+        self._counts = {0: 0, 1: 1}
+
+    def build(self, root: int) -> Dict[Any, List[Cube]]:
+        """ Returns the cubes by class key of the map with the root. """
+        nodes: Dict[Any, int] = {}
+        for (key, _), node in self._get_sets(root, 0).items():
+            nodes[key] = self._union(nodes.get(key, 0), node, 0)
+        return {
+            key:
+            self._get_single_states(node) if self._get_count(node)
+            <= _SINGLE_STATE_LIMIT else self._get_cubes(node)
+            for key, node in nodes.items()
+        }
+
+    def _get_node(self, level: int, children: Tuple[int, ...]) -> int:
+        key = (level, children)
+        try:
+            return self._unique[key]
+        except KeyError:
+            node = len(self._nodes)
+            self._nodes.append(children)
+            self._unique[key] = node
+            return node
+
+    def _union(self, first: int, second: int, level: int) -> int:
+        if first in (0, second):
+            return second
+        if second == 0:
+            return first
+        key = (min(first, second), max(first, second))
+        try:
+            return self._unions[key]
+        except KeyError:
+            pass
+        node = self._get_node(
+            level,
+            tuple(
+                self._union(first_child, second_child, level + 1)
+                for first_child, second_child in zip(self._nodes[first],
+                                                     self._nodes[second])))
+        self._unions[key] = node
+        return node
+
+    def _get_sets(self, node: int,
+                  level: int) -> Dict[Tuple[Any, Tuple[int, ...]], int]:
+        # Returns the state sets of the sub-map by the entry classification.
+        # The sets are shared by all paths to the sub-map.
+        key = (node, level)
+        try:
+            return self._sets[key]
+        except KeyError:
+            pass
+        if level == self._level_count:
+            sets = {self._classify(self._get_entry(node)): 1}
+        else:
+            state_count = self._state_counts[level]
+            children_by_class: Dict[Tuple[Any, Tuple[int, ...]],
+                                    List[int]] = {}
+            for st_idx, child in enumerate(self._get_children(node, level)):
+                for cls, sub in self._get_sets(child, level + 1).items():
+                    children = children_by_class.setdefault(
+                        cls, [0] * (state_count + 1))
+                    index = state_count if cls[1][level] else st_idx
+                    children[index] = self._union(children[index], sub,
+                                                  level + 1)
+            sets = {
+                cls: self._get_node(level, tuple(children))
+                for cls, children in children_by_class.items()
+            }
+        self._sets[key] = sets
+        return sets
+
+    def _get_count(self, node: int) -> int:
+        try:
+            return self._counts[node]
+        except KeyError:
+            pass
+        count = sum(self._get_count(child) for child in self._nodes[node])
+        self._counts[node] = count
+        return count
+
+    def _get_single_states(self, node: int) -> List[Cube]:
+        if node == 1:
+            return [()]
+        return [(1 << st_idx, ) + cube
+                for st_idx, child in enumerate(self._nodes[node]) if child
+                for cube in self._get_single_states(child)]
+
+    def _get_cubes(self, node: int) -> List[Cube]:
+        # The states leading to the same child are combined in one cube
+        try:
+            return self._cubes[node]
+        except KeyError:
+            pass
+        masks: Dict[int, int] = {}
+        for st_idx, child in enumerate(self._nodes[node]):
+            if child:
+                masks[child] = masks.get(child, 0) | (1 << st_idx)
+        cubes = [(mask, ) + cube for child, mask in masks.items()
+                 for cube in self._get_cubes(child)]
+        self._cubes[node] = cubes
+        return cubes
+
+
+class _Storage:
+    # pylint: disable=too-few-public-methods
+    def __init__(self, state_counts: Tuple[int,
+                                           ...], make_variant: MakeVariant,
+                 add_variant: AddVariant, get_entry_idx: GetEntryIdx):
+        self._state_counts = state_counts
+        self._make_variant = make_variant
+        self._add_variant = add_variant
+        self._get_entry_idx = get_entry_idx
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The functions are only needed to add transitions, so a storage
+        # restored from its state can only be read
+        state = dict(self.__dict__)
+        for name in ["_make_variant", "_add_variant", "_get_entry_idx"]:
+            del state[name]
+        return state
+
+
+class DenseMap(_Storage):
+    """
+    Represents the transition map by an integer array over the product of the
+    pre-condition states.  Each element is an entry index.
+    """
+
+    def __init__(self, state_counts: Tuple[int,
+                                           ...], make_variant: MakeVariant,
+                 add_variant: AddVariant, get_entry_idx: GetEntryIdx):
+        super().__init__(state_counts, make_variant, add_variant,
+                         get_entry_idx)
+        self._cells = [0] * math.prod(state_counts)
+        self._strides = [
+            math.prod(state_counts[level + 1:])
+            for level in range(len(state_counts))
+        ]
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._cells
+
+    def add_transitions(self, desc: Descriptor) -> Dict[int, int]:
+        """
+        Adds the transitions of the descriptor and returns the count of added
+        variants by variant index.
+        """
+        # pylint: disable=too-many-locals
+        # The states of the referenced pre-conditions are enumerated up to the
+        # last referenced pre-condition.  The variants are repeated for the
+        # states of the following pre-conditions.
+        refs = desc.pre_co_refs
+        last_ref = refs[-1] if refs else -1
+        map_indices = [0]
+        ref_states: List[Tuple[int, ...]] = [()]
+        repeat = 1
+        for level, (state_count, st_indices, pre_cond_na) in enumerate(
+                zip(self._state_counts, desc.states, desc.pre_cond_na)):
+            map_indices = [
+                map_idx * state_count + st_idx for map_idx in map_indices
+                for st_idx in st_indices
+            ]
+            if level in refs:
+                co_states = [state_count
+                             ] * len(st_indices) if pre_cond_na else st_indices
+                ref_states = [
+                    states + (st_idx, ) for states in ref_states
+                    for st_idx in co_states
+                ]
+            elif level < last_ref:
+                ref_states = [
+                    states for states in ref_states for _ in st_indices
+                ]
+            else:
+                repeat *= len(st_indices)
+        if not map_indices:
+            # A pre-condition without selected states selects no elements
+            return {}
+        variant_indices = [
+            self._make_variant(desc, map_indices[index * repeat], states)
+            for index, states in enumerate(ref_states)
+        ]
+        additions: Dict[int, int] = {}
+        for index, map_idx in enumerate(map_indices):
+            variant_idx = variant_indices[index // repeat]
+            entry_idx, added = self._add_variant(self._cells[map_idx],
+                                                 variant_idx, map_idx)
+            self._cells[map_idx] = entry_idx
+            if added:
+                additions[variant_idx] = additions.get(variant_idx, 0) + 1
+        return additions
+
+    def add_default(self, desc: Descriptor) -> None:
+        """ Adds the default variant to the empty entries. """
+        entry_ids: Dict[int, int] = {}
+        for map_idx, entry_idx in enumerate(self._cells):
+            if entry_idx == 0:
+                variant_idx = self._make_variant(
+                    desc, map_idx,
+                    tuple((map_idx // self._strides[level]) %
+                          self._state_counts[level]
+                          for level in desc.pre_co_refs))
+                try:
+                    entry_idx = entry_ids[variant_idx]
+                except KeyError:
+                    entry_idx = self._get_entry_idx((variant_idx, ))
+                    entry_ids[variant_idx] = entry_idx
+                self._cells[map_idx] = entry_idx
+
+    def entry_counts(self) -> Dict[int, int]:
+        """
+        Returns the count of elements by entry index in the order of the first
+        appearance of the entry in the map.
+        """
+        counts: Dict[int, int] = {}
+        for entry_idx in self._cells:
+            counts[entry_idx] = counts.get(entry_idx, 0) + 1
+        return counts
+
+    def find_map_idx(self, entry_idx: int) -> int:
+        """ Returns the first map index of the entry. """
+        return self._cells.index(entry_idx)
+
+    def get_cubes(self, classify: Classify) -> Dict[Any, List[Cube]]:
+        """
+        Returns the pre-condition states of the map elements as disjoint cubes
+        by the class key of the entries.
+
+        The classify function returns for an entry index the class key and the
+        not applicable status of each pre-condition.  A cube is a tuple of
+        state bit masks, one for each pre-condition.  The state of a
+        pre-condition which is not applicable is the state count of the
+        pre-condition.
+        """
+        classes: Dict[int, Tuple[Any, Tuple[int, ...]]] = {}
+        cubes: Dict[Any, Set[Cube]] = {}
+        for states, entry_idx in zip(
+                itertools.product(*(range(state_count)
+                                    for state_count in self._state_counts)),
+                self._cells):
+            try:
+                key, pre_cond_na = classes[entry_idx]
+            except KeyError:
+                key, pre_cond_na = classify(entry_idx)
+                classes[entry_idx] = (key, pre_cond_na)
+            cubes.setdefault(key, set()).add(
+                tuple(1 << (state_count if na else st_idx)
+                      for st_idx, state_count, na in zip(
+                          states, self._state_counts, pre_cond_na)))
+        return {key: list(key_cubes) for key, key_cubes in cubes.items()}
+
+
+_EXPAND_LIMIT = 4096
+
+
+class DecisionDiagram(_Storage):
+    """
+    Represents the transition map by a quasi-reduced ordered decision diagram.
+
+    The levels of the diagram correspond to the pre-conditions.  A node has one
+    child for each state of its pre-condition.  Nodes with the same children
+    are shared.  The terminals are entry indices.  The size of the diagram
+    depends on the count of distinct sub-maps and not on the size of the
+    state product.  There shall be at least one pre-condition.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, state_counts: Tuple[int,
+                                           ...], make_variant: MakeVariant,
+                 add_variant: AddVariant, get_entry_idx: GetEntryIdx):
+        super().__init__(state_counts, make_variant, add_variant,
+                         get_entry_idx)
+        self._level_count = len(state_counts)
+        self._nodes: List[Tuple[int, ...]] = []
+        self._unique: Dict[Tuple[int, Tuple[int, ...]], int] = {}
+        self._sizes = [
+            math.prod(state_counts[level:])
+            for level in range(self._level_count + 1)
+        ]
+        root = 0
+        for level in reversed(range(self._level_count)):
+            root = self._get_node(level, (root, ) * state_counts[level])
+        self._root = root
+
+    def _get_node(self, level: int, children: Tuple[int, ...]) -> int:
+        key = (level, children)
+        try:
+            return self._unique[key]
+        except KeyError:
+            node = len(self._nodes)
+            self._nodes.append(children)
+            self._unique[key] = node
+            return node
+
+    def _expand(self, node: int, level: int) -> List[int]:
+        nodes = [node]
+        for _ in range(level, self._level_count):
+            nodes = [
+                child for parent in nodes for child in self._nodes[parent]
+            ]
+        return nodes
+
+    def _iter_node(self, node: int, level: int) -> Iterator[int]:
+        if self._sizes[level] <= _EXPAND_LIMIT:
+            yield from self._expand(node, level)
+        else:
+            for child in self._nodes[node]:
+                yield from self._iter_node(child, level + 1)
+
+    def __iter__(self) -> Iterator[int]:
+        yield from self._iter_node(self._root, 0)
+
+    def add_transitions(self, desc: Descriptor) -> Dict[int, int]:
+        """
+        Adds the transitions of the descriptor and returns the count of added
+        variants by variant index.
+        """
+        # pylint: disable=too-many-locals
+        # The context contains the states of the pre-conditions referenced by
+        # the post-condition expressions of the descriptor.  The sub-diagrams
+        # are shared if the node and the context are equal.
+        refs = set(desc.pre_co_refs)
+        done: Dict[Tuple[int, int, Tuple[int, ...]],
+                   Tuple[int, Dict[int, int]]] = {}
+
+        def _apply(node: int, level: int, map_idx: int,
+                   ctx: Tuple[int, ...]) -> Tuple[int, Dict[int, int]]:
+            if level == self._level_count:
+                variant_idx = self._make_variant(desc, map_idx, ctx)
+                entry_idx, added = self._add_variant(node, variant_idx,
+                                                     map_idx)
+                return entry_idx, {variant_idx: 1} if added else {}
+            key = (node, level, ctx)
+            try:
+                return done[key]
+            except KeyError:
+                pass
+            children = list(self._nodes[node])
+            state_count = self._state_counts[level]
+            pre_cond_na = desc.pre_cond_na[level]
+            additions: Dict[int, int] = {}
+            for st_idx in desc.states[level]:
+                if level in refs:
+                    next_ctx = ctx + (state_count if pre_cond_na else st_idx, )
+                else:
+                    next_ctx = ctx
+                children[st_idx], child_additions = _apply(
+                    children[st_idx], level + 1,
+                    map_idx * state_count + st_idx, next_ctx)
+                for variant_idx, count in child_additions.items():
+                    additions[variant_idx] = additions.get(variant_idx,
+                                                           0) + count
+            result = (self._get_node(level, tuple(children)), additions)
+            done[key] = result
+            return result
+
+        self._root, additions = _apply(self._root, 0, 0, ())
+        return additions
+
+    def add_default(self, desc: Descriptor) -> None:
+        """ Adds the default variant to the empty entries. """
+        refs = set(desc.pre_co_refs)
+        entry_ids: Dict[Tuple[int, ...], int] = {}
+        done: Dict[Tuple[int, int, Tuple[int, ...]], int] = {}
+
+        def _apply(node: int, level: int, map_idx: int,
+                   ctx: Tuple[int, ...]) -> int:
+            if level == self._level_count:
+                if node != 0:
+                    return node
+                try:
+                    return entry_ids[ctx]
+                except KeyError:
+                    entry_idx = self._get_entry_idx(
+                        (self._make_variant(desc, map_idx, ctx), ))
+                    entry_ids[ctx] = entry_idx
+                    return entry_idx
+            key = (node, level, ctx)
+            try:
+                return done[key]
+            except KeyError:
+                pass
+            state_count = self._state_counts[level]
+            children = tuple(
+                _apply(child, level + 1, map_idx * state_count + st_idx, ctx +
+                       (st_idx, ) if level in refs else ctx)
+                for st_idx, child in enumerate(self._nodes[node]))
+            node = self._get_node(level, children)
+            done[key] = node
+            return node
+
+        self._root = _apply(self._root, 0, 0, ())
+
+    def _visit(self) -> Iterator[Tuple[int, int]]:
+        # Yields the entry indices in the order of their first appearance in
+        # the map together with the associated map index
+        visited: Set[int] = set()
+        entries: Set[int] = set()
+
+        def _visit_node(node: int, level: int,
+                        map_idx: int) -> Iterator[Tuple[int, int]]:
+            state_count = self._state_counts[level]
+            for st_idx, child in enumerate(self._nodes[node]):
+                child_map_idx = map_idx * state_count + st_idx
+                if level + 1 == self._level_count:
+                    if child not in entries:
+                        entries.add(child)
+                        yield child, child_map_idx
+                elif child not in visited:
+                    visited.add(child)
+                    yield from _visit_node(child, level + 1, child_map_idx)
+
+        yield from _visit_node(self._root, 0, 0)
+
+    def entry_counts(self) -> Dict[int, int]:
+        """
+        Returns the count of elements by entry index in the order of the first
+        appearance of the entry in the map.
+        """
+        path_counts = {self._root: 1}
+        for _ in range(self._level_count):
+            next_path_counts: Dict[int, int] = {}
+            for node, count in path_counts.items():
+                for child in self._nodes[node]:
+                    next_path_counts[child] = next_path_counts.get(child,
+                                                                   0) + count
+            path_counts = next_path_counts
+        return {
+            entry_idx: path_counts[entry_idx]
+            for entry_idx, _ in self._visit()
+        }
+
+    def find_map_idx(self, entry_idx: int) -> int:
+        """ Returns the first map index of the entry. """
+        return next(map_idx for other_entry_idx, map_idx in self._visit()
+                    if other_entry_idx == entry_idx)
+
+    def get_cubes(self, classify: Classify) -> Dict[Any, List[Cube]]:
+        """
+        Returns the pre-condition states of the map elements as disjoint cubes
+        by the class key of the entries.
+
+        The classify function returns for an entry index the class key and the
+        not applicable status of each pre-condition.  A cube is a tuple of
+        state bit masks, one for each pre-condition.  The state of a
+        pre-condition which is not applicable is the state count of the
+        pre-condition.  The work depends on the count of distinct sub-maps and
+        not on the size of the state product.
+        """
+        return _CubeBuilder(self._state_counts,
+                            lambda node, _: self._nodes[node],
+                            lambda node: node, classify).build(self._root)
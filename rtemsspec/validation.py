@@ -28,22 +28,29 @@
 
 import itertools
 import functools
+import logging
 import os
+import pickle
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, \
+    Optional, Set, Tuple
 
 from rtemsspec.content import CContent, CInclude, enabled_by_to_exp, \
     ExpressionMapper, GenericContent, get_integer_type, get_value_params, \
     get_value_plural, get_value_doxygen_group, get_value_doxygen_function, \
     to_camel_case
+from rtemsspec.incremental import run_units, Unit
 from rtemsspec.items import create_unique_link, Item, ItemCache, \
     ItemGetValueContext, ItemMapper
+from rtemsspec.outputsink import open_atomically
 from rtemsspec.transitionmap import TransitionMap
 
 _CaseToSuite = Dict[str, List["_TestItem"]]
 
 _STEPS = re.compile(r"^steps/([0-9]+)$")
 
+_ITEM_REFERENCE = re.compile(r"\$\{?([a-zA-Z0-9._/-]+)")
+
 
 def _get_test_context_instance(ctx: ItemGetValueContext) -> Any:
     return f"{to_camel_case(ctx.item.uid[1:])}_Instance"
@@ -544,6 +551,7 @@ class _ActionRequirementTestItem(_TestItem):
         self._post_co_idx_to_enum = _to_enum(f"{self.ident}_Post",
                                              item["post-conditions"])
         self._pci = "pcs"
+        self.compress_transition_map = False
 
     def _add_pre_condition_descriptions(self, content: CContent) -> None:
         for condition in self["pre-conditions"]:
@@ -731,10 +739,12 @@ class _ActionRequirementTestItem(_TestItem):
                 content.add(
                     ["index = ctx->Map.index;", "ctx->Map.index = index + 1;"])
                 content.gap = False
-            content.add([
-                f"return {self.ident}_Entries[",
-                f"  {self.ident}_Map[ index ]", "];"
-            ])
+            if self.compress_transition_map:
+                map_entry = f"{self.ident}_GetMapEntry( index )"
+            else:
+                map_entry = f"{self.ident}_Map[ index ]"
+            content.add(
+                [f"return {self.ident}_Entries[", f"  {map_entry}", "];"])
 
     def _add_test_case(self, content: CContent, transition_map: TransitionMap,
                        header: Dict[str, Any]) -> None:
@@ -832,7 +842,8 @@ class _ActionRequirementTestItem(_TestItem):
         else:
             _add_condition_enum(content, self._pre_co_idx_to_enum)
             _add_condition_enum(content, self._post_co_idx_to_enum)
-        transition_map = TransitionMap(self.item)
+        transition_map = TransitionMap(
+            self.item, cache_directory=self.item.cache.cache_directory)
         if transition_map.has_pre_co_not_applicable():
             self._pci = "pci"
         transition_map.add_map_entry_type(content, self.ident)
@@ -859,7 +870,13 @@ class _ActionRequirementTestItem(_TestItem):
         self.add_function(content, "test-prepare", "Prepare")
         self.add_function(content, "test-action", "Action")
         self.add_function(content, "test-cleanup", "Cleanup")
-        transition_map.add_map(content, self.ident)
+        transition_map.add_map(content, self.ident,
+                               self.compress_transition_map)
+        if self.compress_transition_map:
+            logging.info(
+                "%s: compressed the transition map from %i to %i bytes",
+                self.item.uid, transition_map.get_map_size(),
+                transition_map.get_map_size(compressed=True))
         self._add_fixture_scope(content)
         content.add([
             f"static T_fixture {self.ident}_Fixture = {{",
@@ -1029,6 +1046,11 @@ class _SourceFile:
         self._test_suites: List[_TestItem] = []
         self._test_cases: List[_TestItem] = []
 
+    @property
+    def file(self) -> str:
+        """ The file name of the source file. """
+        return self._file
+
     @property
     def test_suites(self) -> List[_TestItem]:
         """ The test suites of the source file. """
@@ -1039,6 +1061,14 @@ class _SourceFile:
         """ The test cases of the source file. """
         return self._test_cases
 
+    @property
+    def uids(self) -> List[str]:
+        """ The UIDs of the test suites and test cases of the source file. """
+        return [
+            test_item.uid for test_item in itertools.chain(
+                self._test_suites, self._test_cases)
+        ]
+
     def add_test_suite(self, item: Item) -> None:
         """ Adds a test suite to the source file. """
         self._test_suites.append(_TestSuiteItem(item))
@@ -1084,21 +1114,37 @@ class _SourceFile:
         content.write(os.path.join(base_directory, self._file))
 
 
-def _gather_build_source_files(item: Item, files: List[str]):
+def _get_build_source_files(item: Item, files_by_uid: Dict[str, List[str]],
+                            visiting: Set[str]) -> List[str]:
+    try:
+        return files_by_uid[item.uid]
+    except KeyError:
+        pass
+    visiting.add(item.uid)
+    files: List[str] = []
     for parent in item.parents("build-dependency"):
-        _gather_build_source_files(parent, files)
+        if parent.uid not in visiting:
+            files.extend(
+                _get_build_source_files(parent, files_by_uid, visiting))
     files.extend(item.data.get("source", []))
+    visiting.remove(item.uid)
+    files_by_uid[item.uid] = files
+    return files
 
 
 class _TestProgram:
     """ A test program. """
 
-    def __init__(self, item: Item):
+    def __init__(self, item: Item, build_source_files: List[str]):
         """ Initializes a test program. """
         self._item = item
         self._source_files: List[_SourceFile] = []
-        self._build_source_files: List[str] = []
-        _gather_build_source_files(item, self._build_source_files)
+        self._build_source_files = build_source_files
+
+    @property
+    def item(self) -> Item:
+        """ The item of the test program. """
+        return self._item
 
     @property
     def source_files(self) -> List[_SourceFile]:
@@ -1116,68 +1162,55 @@ class _TestProgram:
                 self._source_files.append(source_file)
 
 
-def _get_source_file(filename: str,
-                     source_files: Dict[str, _SourceFile]) -> _SourceFile:
-    return source_files.setdefault(filename, _SourceFile(filename))
-
-
-def _gather_action_requirement_test(
-        item: Item, source_files: Dict[str, _SourceFile],
-        _test_programs: List[_TestProgram]) -> None:
-    src = _get_source_file(item["test-target"], source_files)
-    src.add_action_requirement_test(item)
-
-
-def _gather_runtime_measurement_test(
-        item: Item, source_files: Dict[str, _SourceFile],
-        _test_programs: List[_TestProgram]) -> None:
-    src = _get_source_file(item["test-target"], source_files)
-    src.add_runtime_measurement_test(item)
-
-
-def _gather_test_case(item: Item, source_files: Dict[str, _SourceFile],
-                      _test_programs: List[_TestProgram]) -> None:
-    src = _get_source_file(item["test-target"], source_files)
-    src.add_test_case(item)
-
-
-def _gather_test_program(item: Item, _source_files: Dict[str, _SourceFile],
-                         test_programs: List[_TestProgram]) -> None:
-    test_programs.append(_TestProgram(item))
-
-
-def _gather_test_suite(item: Item, source_files: Dict[str, _SourceFile],
-                       _test_programs: List[_TestProgram]) -> None:
-    src = _get_source_file(item["test-target"], source_files)
-    src.add_test_suite(item)
-
+_GATHER: Dict[str, Callable[[_SourceFile, Item], None]] = {
+    "memory-benchmark": _SourceFile.add_test_suite,
+    "requirement/functional/action": _SourceFile.add_action_requirement_test,
+    "runtime-measurement-test": _SourceFile.add_runtime_measurement_test,
+    "test-case": _SourceFile.add_test_case,
+    "test-suite": _SourceFile.add_test_suite,
+}
 
-def _gather_default(_item: Item, _source_files: Dict[str, _SourceFile],
-                    _test_programs: List[_TestProgram]) -> None:
-    pass
 
+class _GatherIndex(NamedTuple):
+    items_by_target: Dict[str, List[Item]]
+    test_programs: List[Tuple[Item, List[str]]]
 
-_GATHER = {
-    "build/test-program": _gather_test_program,
-    "memory-benchmark": _gather_test_suite,
-    "requirement/functional/action": _gather_action_requirement_test,
-    "runtime-measurement-test": _gather_runtime_measurement_test,
-    "test-case": _gather_test_case,
-    "test-suite": _gather_test_suite,
-}
 
-
-def _gather(
-        item_cache: ItemCache) -> Tuple[Dict[str, _SourceFile], _CaseToSuite]:
+def _create_gather_index(item_cache: ItemCache) -> _GatherIndex:
+    index = _GatherIndex({}, [])
+    files_by_uid: Dict[str, List[str]] = {}
+    for item in item_cache.all.values():
+        if item.type in _GATHER:
+            index.items_by_target.setdefault(item["test-target"],
+                                             []).append(item)
+        elif item.type == "build/test-program":
+            index.test_programs.append(
+                (item, _get_build_source_files(item, files_by_uid, set())))
+    return index
+
+
+def _gather_source_files_and_test_programs(
+    item_cache: ItemCache
+) -> Tuple[Dict[str, _SourceFile], List[_TestProgram]]:
+    index = item_cache.get_derived_data("validation", _create_gather_index)
     source_files: Dict[str, _SourceFile] = {}
+    for target, items in index.items_by_target.items():
+        src = _SourceFile(target)
+        for item in items:
+            _GATHER[item.type](src, item)
+        source_files[target] = src
     test_programs: List[_TestProgram] = []
-    for item in item_cache.all.values():
-        _GATHER.get(item.type, _gather_default)(item, source_files,
-                                                test_programs)
+    for item, build_source_files in index.test_programs:
+        test_program = _TestProgram(item, build_source_files)
+        test_program.add_source_files(source_files)
+        test_programs.append(test_program)
+    return source_files, test_programs
 
+
+def _get_test_case_to_suites(
+        test_programs: List[_TestProgram]) -> _CaseToSuite:
     test_case_to_suites: _CaseToSuite = {}
     for test_program in test_programs:
-        test_program.add_source_files(source_files)
         test_suites: List[_TestItem] = []
         for source_file in test_program.source_files:
             test_suites.extend(source_file.test_suites)
@@ -1185,8 +1218,32 @@ def _gather(
             for test_case in source_file.test_cases:
                 test_case_to_suites.setdefault(test_case.uid,
                                                []).extend(test_suites)
+    return test_case_to_suites
 
-    return source_files, test_case_to_suites
+
+def _gather(
+        item_cache: ItemCache) -> Tuple[Dict[str, _SourceFile], _CaseToSuite]:
+    source_files, test_programs = _gather_source_files_and_test_programs(
+        item_cache)
+    return source_files, _get_test_case_to_suites(test_programs)
+
+
+def _get_unit_config(unit_config: Dict[str, Any], src: _SourceFile,
+                     test_case_to_suites: _CaseToSuite,
+                     test_programs: Dict[str, List[str]]) -> Dict[str, Any]:
+    # The test suites of the test cases are determined by the source files of
+    # the test programs, so they are not recorded as inputs of the unit.
+    config = dict(unit_config)
+    config["uids"] = src.uids
+    config["test-programs"] = test_programs.get(src.file, [])
+    config["test-suites"] = {
+        test_case.uid: [
+            test_suite.uid
+            for test_suite in test_case_to_suites.get(test_case.uid, [])
+        ]
+        for test_case in src.test_cases
+    }
+    return config
 
 
 def generate(config: dict,
@@ -1196,19 +1253,142 @@ def generate(config: dict,
     Generates source files and build specification items for validation test
     suites and test cases according to the configuration.
 
+    The optional "jobs" configuration entry specifies the count of worker
+    processes used to generate the source files.  If the count is one or no
+    count is specified, then the source files are generated by the calling
+    process.  The outputs are written to the active output sink by the calling
+    process in the order of the targets, so the outputs do not depend on the
+    count.
+
     :param config: A dictionary with configuration entries.
     :param item_cache: The specification item cache containing the validation
                        test suites and test cases.
     """
-    source_files, test_case_to_suites = _gather(item_cache)
+    source_files, test_programs = _gather_source_files_and_test_programs(
+        item_cache)
+    test_case_to_suites = _get_test_case_to_suites(test_programs)
+    test_programs_by_target: Dict[str, List[str]] = {}
+    for test_program in test_programs:
+        for src in test_program.source_files:
+            test_programs_by_target.setdefault(src.file, []).append(
+                test_program.item.uid)
+    if config.get("compress-transition-maps", False):
+        for src in source_files.values():
+            for test_case in src.test_cases:
+                if isinstance(test_case, _ActionRequirementTestItem):
+                    test_case.compress_transition_map = True
 
     if not targets:
-        for src in source_files.values():
-            src.generate(config["base-directory"], test_case_to_suites)
-    else:
+        targets = sorted(source_files.keys())
+    unit_config = {
+        "base-directory": config["base-directory"],
+        "compress-transition-maps": config.get("compress-transition-maps",
+                                               False)
+    }
+    units: List[Unit] = []
+    for target in targets:
+        src = source_files[target]
+        units.append((f"validation:{target}",
+                      _get_unit_config(unit_config, src, test_case_to_suites,
+                                       test_programs_by_target),
+                      functools.partial(src.generate, config["base-directory"],
+                                        test_case_to_suites)))
+    run_units(units, config.get("jobs", 1))
+
+
+def _gather_item_references(item: Item, value: Any, uids: Set[str]) -> None:
+    if isinstance(value, str):
+        for uid in _ITEM_REFERENCE.findall(value):
+            uids.add(item.to_abs_uid(uid))
+    elif isinstance(value, list):
+        for element in value:
+            _gather_item_references(item, element, uids)
+    elif isinstance(value, dict):
+        for element in value.values():
+            _gather_item_references(item, element, uids)
+
+
+def _get_item_dependencies(item: Item) -> Set[str]:
+    uids: Set[str] = set()
+    _gather_item_references(item, item.data, uids)
+    uids.update(parent.uid for parent in item.parents())
+    uids.update(child.uid
+                for child in item.children("runtime-measurement-request"))
+    return uids
+
+
+def _gather_spec_types(item: Item, uids: Set[str]) -> None:
+    uids.add(item.uid)
+    for child in item.children("spec-refinement"):
+        _gather_spec_types(child, uids)
+
+
+def _get_target_index(item_cache: ItemCache,
+                      spec_type_root_uid: str) -> Dict[str, Set[str]]:
+    source_files, test_programs = _gather_source_files_and_test_programs(
+        item_cache)
+    seeds = {target: set(src.uids) for target, src in source_files.items()}
+    for test_program in test_programs:
+        uids = set([test_program.item.uid])
+        for src in test_program.source_files:
+            uids.update(test_suite.uid for test_suite in src.test_suites)
+        for src in test_program.source_files:
+            seeds[src.file].update(uids)
+    spec_types: Set[str] = set()
+    if spec_type_root_uid:
+        _gather_spec_types(item_cache[spec_type_root_uid], spec_types)
+    dependencies: Dict[str, Set[str]] = {}
+    index: Dict[str, Set[str]] = {}
+    for target, uids in seeds.items():
+        closure: Set[str] = set()
+        todo = list(uids.union(spec_types))
+        while todo:
+            uid = todo.pop()
+            if uid in closure or uid not in item_cache.all:
+                continue
+            closure.add(uid)
+            if uid not in dependencies:
+                dependencies[uid] = _get_item_dependencies(item_cache[uid])
+            todo.extend(dependencies[uid])
+        index[target] = closure
+    return index
+
+
+def load_item_cache(config: dict,
+                    targets: Optional[List[str]] = None) -> ItemCache:
+    """
+    Loads an item cache which contains at least the items required to
+    generate the validation test sources of the targets.
+
+    The UIDs of the items required by a target are stored in a target index
+    in the cache directory.  If no targets are specified, or a target is not
+    in the index, or the index is not up-to-date, then all items are loaded
+    and the index is updated.
+
+    :param config: A dictionary with item cache configuration entries.
+    :param targets: The optional list of validation test source targets.
+    """
+    index_path = os.path.join(config["cache-directory"],
+                              "validation-targets.pickle")
+    try:
+        with open(index_path, "rb") as src:
+            state, index = pickle.load(src)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        state, index = None, {}
+    if targets and all(target in index for target in targets):
+        uids: Set[str] = set()
         for target in targets:
-            source_files[target].generate(config["base-directory"],
-                                          test_case_to_suites)
+            uids.update(index[target])
+        item_cache = ItemCache(config, uids=uids)
+        if item_cache.cache_state == state:
+            return item_cache
+    item_cache = ItemCache(config)
+    if item_cache.cache_directory is not None and (item_cache.cache_state
+                                                   != state):
+        index = _get_target_index(item_cache, config["spec-type-root-uid"])
+        with open_atomically(index_path, "wb") as out:
+            pickle.dump((item_cache.cache_state, index), out)
+    return item_cache
 
 
 def augment_with_test_case_links(item_cache: ItemCache) -> None:
@@ -28,11 +28,12 @@
 import argparse
 import difflib
 import sys
+from typing import List
 
 import rtemsspec
 
 
-def _diff(obj: rtemsspec.content.Content, path: str) -> None:
+def _diff(path: str, text: str) -> None:
     from_file = f"a/{path}"
     to_file = f"b/{path}"
     try:
@@ -42,7 +43,7 @@ def _diff(obj: rtemsspec.content.Content, path: str) -> None:
         file_lines = []
     diff_lines = list(
         difflib.unified_diff(file_lines,
-                             str(obj).splitlines(),
+                             text.splitlines(),
                              fromfile=from_file,
                              tofile=to_file,
                              n=3,
@@ -52,6 +53,23 @@ def _diff(obj: rtemsspec.content.Content, path: str) -> None:
         print("\n".join(diff_lines))
 
 
+def _generate(config: dict, item_cache: rtemsspec.items.ItemCache,
+              targets: List[str]) -> None:
+    rtemsspec.validation.generate(config["validation"], item_cache, targets)
+
+    if not targets:
+        group_uids = [
+            doc["group"] for doc in config["interface-documentation"]["groups"]
+        ]
+        rtemsspec.interface.generate(config["interface"], item_cache)
+        rtemsspec.applconfig.generate(config["appl-config"], group_uids,
+                                      item_cache)
+        rtemsspec.specdoc.document(config["spec-documentation"], item_cache)
+        rtemsspec.glossary.generate(config["glossary"], group_uids, item_cache)
+        rtemsspec.interfacedoc.generate(config["interface-documentation"],
+                                        item_cache)
+
+
 def main() -> None:
     """ Generates files of the modules from the specification. """
     parser = argparse.ArgumentParser()
@@ -60,29 +78,42 @@ def main() -> None:
                         action="store_true",
                         help="print the unified difference from the original"
                         " file content to the new generated content")
+    parser.add_argument("-j",
+                        "--jobs",
+                        type=int,
+                        help="the count of worker processes used by the "
+                        "generators")
+    parser.add_argument("-m",
+                        "--manifest",
+                        help="the manifest file used to skip the generation "
+                        "of outputs with unchanged inputs")
     parser.add_argument("targets",
                         metavar="TARGET",
                         nargs="*",
                         help="a target file of a specification item")
     args = parser.parse_args(sys.argv[1:])
-    if args.diff:
-        rtemsspec.content.Content.write = _diff  # type: ignore
     config = rtemsspec.util.load_config("config.yml")
-    item_cache = rtemsspec.items.ItemCache(config["spec"])
-    rtemsspec.validation.generate(config["validation"], item_cache,
-                                  args.targets)
-
-    if not args.targets:
-        group_uids = [
-            doc["group"] for doc in config["interface-documentation"]["groups"]
-        ]
-        rtemsspec.interface.generate(config["interface"], item_cache)
-        rtemsspec.applconfig.generate(config["appl-config"], group_uids,
-                                      item_cache)
-        rtemsspec.specdoc.document(config["spec-documentation"], item_cache)
-        rtemsspec.glossary.generate(config["glossary"], group_uids, item_cache)
-        rtemsspec.interfacedoc.generate(config["interface-documentation"],
-                                        item_cache)
+    if args.jobs is not None:
+        config["appl-config"]["jobs"] = args.jobs
+        config["glossary"]["jobs"] = args.jobs
+        config["interface"]["jobs"] = args.jobs
+        config["interface-documentation"]["jobs"] = args.jobs
+        config["validation"]["jobs"] = args.jobs
+    item_cache = rtemsspec.validation.load_item_cache(config["spec"],
+                                                      args.targets)
+    if args.manifest is None or args.diff or args.targets:
+        tracker = None
+    else:
+        tracker = rtemsspec.incremental.DependencyTracker(
+            item_cache, args.manifest)
+    sink = rtemsspec.outputsink.FileOutputSink(dry_run=args.diff)
+    with rtemsspec.outputsink.output_sink(sink):
+        with rtemsspec.incremental.track(tracker):
+            _generate(config, item_cache, args.targets)
+    for path, text in sink.outputs:
+        _diff(path, text)
+    print(f"{sink.changed} changed and {sink.unchanged} unchanged files",
+          file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -25,6 +25,10 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import argparse
+import json
+import sys
+
 import rtemsspec.items
 import rtemsspec.specverify
 import rtemsspec.util
@@ -32,9 +36,36 @@ import rtemsspec.util
 
 def main() -> None:
     """ Verfies the specification. """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile",
+                        action="store_true",
+                        help="print the verification time and visit counts "
+                        "ranked by verifier type and attribute path")
+    parser.add_argument("--profile-limit",
+                        type=int,
+                        default=None,
+                        help="the maximum count of profile report entries "
+                        "in each section")
+    parser.add_argument("--profile-json",
+                        metavar="FILE",
+                        default=None,
+                        help="write the verification profile in JSON format "
+                        "to the file")
+    args = parser.parse_args(sys.argv[1:])
     config = rtemsspec.util.load_config("config.yml")
     item_cache = rtemsspec.items.ItemCache(config["spec"])
-    rtemsspec.specverify.verify(config["spec-verification"], item_cache)
+    profile = None
+    if args.profile or args.profile_json:
+        profile = rtemsspec.specverify.VerifyProfile()
+    rtemsspec.specverify.verify(config["spec-verification"],
+                                item_cache,
+                                profile=profile)
+    if profile is not None:
+        if args.profile:
+            print(profile.report(args.profile_limit))
+        if args.profile_json:
+            with open(args.profile_json, "w", encoding="utf-8") as out:
+                json.dump(profile.to_dict(), out, indent=2)
 
 
 if __name__ == "__main__":
@@ -32,19 +32,14 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 from rtemsspec.items import EmptyItem, Item, ItemCache, ItemMapper, \
     ItemGetValueContext
-from rtemsspec.rtems import augment_with_test_links, is_pre_qualified
+from rtemsspec.rtems import augment_with_test_links, CHILD_ROLES, \
+    get_design_components, get_validation_status, is_pre_qualified, \
+    PARENT_ROLES
 from rtemsspec.sphinxcontent import SphinxContent
 from rtemsspec.transitionmap import Transition, TransitionMap
 from rtemsspec.util import load_config
 from rtemsspec.validation import augment_with_test_case_links
 
-_CHILD_ROLES = [
-    "requirement-refinement", "interface-ingroup", "interface-ingroup-hidden",
-    "interface-function", "glossary-member", "test-case"
-]
-
-_PARENT_ROLES = ["function-implementation", "interface-enumerator"]
-
 
 def _get_value_dummy(_ctx: ItemGetValueContext) -> Any:
     return ""
@@ -143,66 +138,18 @@ def _view(item: Item, level: int, role: Optional[str], validated_filter: str,
         if child.is_enabled(enabled):
             _visit_item(child, level + 1, "validation", validated_filter)
     _view_interface_placment(item, level + 1, validated_filter)
-    for link in item.links_to_children(_CHILD_ROLES):
+    for link in item.links_to_children(CHILD_ROLES):
         _view(link.item, level + 1, link.role, validated_filter, enabled)
-    for link in item.links_to_parents(_PARENT_ROLES):
+    for link in item.links_to_parents(PARENT_ROLES):
         _view(link.item, level + 1, link.role, validated_filter, enabled)
 
 
-_VALIDATION_LEAF = [
-    "constraint",
-    "glossary/group",
-    "glossary/term",
-    "interface/appl-config-group",
-    "interface/container",
-    "interface/domain",
-    "interface/enum",
-    "interface/enumerator",
-    "interface/forward-declaration",
-    "interface/header-file",
-    "interface/register-block",
-    "interface/struct",
-    "interface/typedef",
-    "interface/union",
-    "interface/unspecified-define",
-    "interface/unspecified-define-or-object",
-    "interface/unspecified-enum",
-    "interface/unspecified-enumerator",
-    "interface/unspecified-function",
-    "interface/unspecified-group",
-    "interface/unspecified-macro",
-    "interface/unspecified-macro-or-function",
-    "interface/unspecified-object",
-    "interface/unspecified-struct",
-    "interface/unspecified-typedef",
-    "interface/unspecified-union",
-    "memory-benchmark",
-    "requirement/functional/action",
-    "requirement/non-functional/performance-runtime",
-    "runtime-measurement-test",
-    "test-case",
-    "validation/by-analysis",
-    "validation/by-inspection",
-    "validation/by-review-of-design",
-]
-
-_VALIDATION_ROLES = _CHILD_ROLES + ["validation"]
-
-
-def _validate(item: Item, enabled: List[str]) -> bool:
-    validated = True
-    count = 0
-    for link in itertools.chain(item.links_to_children(_VALIDATION_ROLES),
-                                item.links_to_parents(_PARENT_ROLES)):
-        if link.item.is_enabled(enabled):
-            validated = _validate(link.item, enabled) and validated
-            count += 1
-    pre_qualified = is_pre_qualified(item)
-    item["_pre_qualified"] = pre_qualified
-    if count == 0:
-        validated = (not pre_qualified) or (item.type in _VALIDATION_LEAF)
-    item["_validated"] = validated
-    return validated
+def _validate(root: Item, enabled: List[str]) -> None:
+    item_cache = root.cache
+    for uid, validated in get_validation_status(root, enabled).items():
+        item = item_cache[uid]
+        item["_pre_qualified"] = is_pre_qualified(item)
+        item["_validated"] = validated
 
 
 def _validation_count(item: Item, enabled: List[str]) -> int:
@@ -214,16 +161,17 @@ def _validation_count(item: Item, enabled: List[str]) -> int:
 def _no_validation(item: Item, path: List[str],
                    enabled: List[str]) -> List[str]:
     path_2 = path + [item.uid]
-    if not item.is_enabled(enabled):
+    if not item.is_enabled(enabled) or item.get("_validated", True):
+        # All enabled items reachable from a validated item are validated
         return path_2[:-1]
     leaf = _validation_count(item, enabled) == 0
-    for child in item.children(_CHILD_ROLES):
+    for child in item.children(CHILD_ROLES):
         path_2 = _no_validation(child, path_2, enabled)
         leaf = False
-    for parent in item.parents(_PARENT_ROLES):
+    for parent in item.parents(PARENT_ROLES):
         path_2 = _no_validation(parent, path_2, enabled)
         leaf = False
-    if leaf and not item.get("_validated", True):
+    if leaf:
         for index, component in enumerate(path_2):
             if component:
                 print(f"{'  ' * index}{component}")
@@ -231,53 +179,10 @@ def _no_validation(item: Item, path: List[str],
     return path_2[:-1]
 
 
-_REFINEMENTS = ["interface-function", "requirement-refinement"]
-
-_GROUPS = ["requirement/non-functional/design-group", "interface/group"]
-
-
-def _is_refinement(item: Item, other: Item) -> bool:
-    for parent in item.parents(_REFINEMENTS):
-        if parent == other:
-            return True
-        if _is_refinement(parent, other):
-            return True
-    return False
-
-
-def _gather_design_components(item: Item, components: List[Item]) -> bool:
-    if item.type in _GROUPS:
-        components.append(item)
-        return True
-    if item.type.startswith("requirement"):
-        for parent in item.parents("interface-function"):
-            components.append(parent)
-        for parent in item.parents("requirement-refinement"):
-            _gather_design_components(parent, components)
-        return True
-    return False
-
-
 def _design(item_cache: ItemCache, enabled: List[str]) -> None:
-    for item in item_cache.all.values():
-        if not item.is_enabled(enabled):
-            continue
-        components: List[Item] = []
-        if not _gather_design_components(item, components):
-            continue
-        compact: Set[Item] = set()
-        for component in components:
-            for component_2 in components:
-                if component != component_2:
-                    if _is_refinement(component_2, component):
-                        break
-            else:
-                compact.add(component)
-        if compact:
-            text = ", ".join(component.uid for component in compact)
-        else:
-            text = "N/A"
-        print(f"{item.uid}\t{text}")
+    for uid, components in get_design_components(item_cache, enabled).items():
+        text = ", ".join(components) if components else "N/A"
+        print(f"{uid}\t{text}")
 
 
 def _gather_interface_placement(item: Item, spec: Set) -> None:
@@ -291,9 +196,9 @@ def _gather(item: Item, spec: Set) -> None:
     _gather_interface_placement(item, spec)
     for child in item.children("validation"):
         spec.add(child)
-    for child in item.children(_CHILD_ROLES):
+    for child in item.children(CHILD_ROLES):
         _gather(child, spec)
-    for parent in item.parents(_PARENT_ROLES):
+    for parent in item.parents(PARENT_ROLES):
         _gather(parent, spec)
 
 
@@ -319,7 +224,8 @@ def _action_table(enabled: List[str], item: Item) -> None:
                             (condition["name"]
                              for condition in item["post-conditions"])))
     ]
-    transition_map = TransitionMap(item)
+    transition_map = TransitionMap(item,
+                                   cache_directory=item.cache.cache_directory)
     for map_idx, variant in transition_map.get_variants(enabled):
         rows.append(_make_row(transition_map, map_idx, variant))
     content = SphinxContent()
@@ -333,7 +239,8 @@ def _to_name(transition_map, co_idx: int, st_idx: int) -> str:
 
 
 def _action_list(enabled: List[str], item: Item) -> None:
-    transition_map = TransitionMap(item)
+    transition_map = TransitionMap(item,
+                                   cache_directory=item.cache.cache_directory)
     for post_cond, pre_conds in transition_map.get_post_conditions(enabled):
         print("")
         if post_cond[0]:
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: BSD-2-Clause
+""" Reports statistics of the action requirement transition maps. """
+
+# Copyright (C) 2023 embedded brains GmbH (http://www.embedded-brains.de)
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import sys
+
+import rtemsspec.items
+import rtemsspec.transitionmapstats
+import rtemsspec.util
+
+
+def main() -> None:
+    """ Reports statistics of the action requirement transition maps. """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs",
+                        type=int,
+                        default=None,
+                        help="the count of worker processes (default: the "
+                        "count of processors)")
+    parser.add_argument("--output",
+                        metavar="FILE",
+                        default=None,
+                        help="write the JSON lines to the file instead of "
+                        "the standard output")
+    parser.add_argument("UIDs",
+                        metavar="UID",
+                        nargs="*",
+                        help="an UID of an action requirement (default: all)")
+    args = parser.parse_args(sys.argv[1:])
+    config = rtemsspec.util.load_config("config.yml")
+    item_cache = rtemsspec.items.ItemCache(config["spec"])
+    lines = rtemsspec.transitionmapstats.generate_statistics(
+        item_cache, args.UIDs if args.UIDs else None, args.jobs)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            for line in lines:
+                out.write(f"{line}\n")
+    else:
+        for line in lines:
+            print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()